@@ -6,6 +6,8 @@ import pandas as pd
 from scipy.stats import pearsonr
 import matplotlib.pyplot as plt
 
+from korean_font import apply_plot_font
+
 
 ROOT = Path(__file__).resolve().parent
 CONFIG_PATH = ROOT / "config.yaml"
@@ -36,7 +38,7 @@ def main() -> None:
         "점유율_2022": [25.3, 25.6, 5.1, 2.5, 10.0, 21.8, 8.4, 1.2],
     }
 
-    plt.rcParams["axes.unicode_minus"] = False
+    apply_plot_font(cfg)
 
     df = pd.DataFrame(data_extended)
     years = [2020, 2021, 2022]
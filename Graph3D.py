@@ -1,21 +1,89 @@
+"""극장별 스크린 수/특별관 스크린 수/좌석 수의 3D 관계와 회귀 평면.
+
+- 데이터는 극장 통합문서의 '2023년 전국 극장 리스트' 시트(`ingest.read_sheet` 캐시)에서 극장 단위로 읽습니다.
+- z = b0 + b1·x + b2·y 평면을 `numpy.linalg.lstsq`로 한 번에 적합합니다(두 변수를 따로 적합하지 않음).
+- 계수의 부트스트랩 신뢰구간은 재표본을 극장별 복원추출 횟수(다항분포) 가중치로 표현해
+  `graph3d.bootstrap_batch`개씩 가중 정규방정식을 배치로 풉니다(재표본마다 Python 루프를 돌지 않음).
+
+통합문서에는 극장별 관객 수가 없어 기본 반응변수는 총 좌석수입니다. 축 컬럼은 config.yaml `graph3d`의
+`x_column`/`y_column`/`z_column`으로 바꿀 수 있습니다.
+"""
+
 from __future__ import annotations
 
 from pathlib import Path
-import yaml
+
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from sklearn.linear_model import LinearRegression
+import yaml
+
+from ingest import read_sheet
+from korean_font import apply_plot_font
 
 
 ROOT = Path(__file__).resolve().parent
 CONFIG_PATH = ROOT / "config.yaml"
 
+THEATER_SHEET = "2023년 전국 극장 리스트"
+
 
 def load_config() -> dict:
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
 
+def design_matrix(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return np.column_stack([np.ones(len(x)), x, y])
+
+
+def fit_plane(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> tuple[np.ndarray, float]:
+    """(b0, b1, b2)와 결정계수 R²."""
+    design = design_matrix(x, y)
+    coef, *_ = np.linalg.lstsq(design, z, rcond=None)
+    resid = z - design @ coef
+    ss_tot = float(((z - z.mean()) ** 2).sum())
+    r2 = 1.0 - float(resid @ resid) / ss_tot if ss_tot > 0 else float("nan")
+    return coef, r2
+
+
+def bootstrap_coefs(
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    n_boot: int = 2000,
+    batch: int = 500,
+    seed: int = 42,
+) -> np.ndarray:
+    """부트스트랩 계수 (n_boot, 3).
+
+    재표본 b에서 극장 i가 뽑힌 횟수 w[b, i]로 XᵀWX, XᵀWz를 배치 einsum으로 만들고 한 번에 풉니다.
+    """
+    design = design_matrix(x, y)
+    n = len(z)
+    rng = np.random.default_rng(seed)
+    out = np.empty((n_boot, design.shape[1]))
+    for start in range(0, n_boot, batch):
+        size = min(batch, n_boot - start)
+        w = rng.multinomial(n, np.full(n, 1.0 / n), size=size).astype(np.float64)
+        xtwx = np.einsum("bn,ni,nj->bij", w, design, design, optimize=True)
+        xtwz = w @ (design * z[:, None])
+        try:
+            out[start : start + size] = np.linalg.solve(xtwx, xtwz[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            # 한 변수 값이 모두 같은 재표본처럼 특이한 경우가 섞이면 의사역행렬로 풉니다.
+            out[start : start + size] = np.einsum("bij,bj->bi", np.linalg.pinv(xtwx), xtwz)
+    return out
+
+
+def load_theaters(cfg: dict, columns: list[str]) -> pd.DataFrame:
+    paths = cfg.get("paths", {})
+    theater_xlsx = ROOT / paths.get("theater_xlsx", "data_theaters_domestic.xlsx")
+    raw = read_sheet(theater_xlsx, sheet_name=THEATER_SHEET, columns=["번호", *columns], cfg=cfg)
+    # 시트 끝의 총계/주석 행은 번호가 비어 있거나 숫자가 아닙니다.
+    raw = raw[pd.to_numeric(raw["번호"], errors="coerce").notna()]
+    return raw[columns].apply(pd.to_numeric, errors="coerce").dropna()
+
+
 def main() -> None:
     cfg = load_config()
 
@@ -26,41 +94,53 @@ def main() -> None:
 
     out_name = cfg.get("outputs", {}).get("plot_3d_trendlines", "theater_3d_trendlines.png")
 
-    data = {
-        "상영관": [20, 21, 18, 12, 12, 10, 10, 11, 14, 8, 9, 10, 8, 8, 8, 10, 8, 7, 11, 10],
-        "좌석수": [3893, 4276, 3593, 2714, 2213, 2127, 1840, 2487, 3390, 1895, 1889, 1855, 1737, 1494, 1522, 1648, 1523, 1432, 2409, 2172],
-        "연간관객수": [290, 257, 170, 125, 99, 96, 91, 86, 82, 78, 78, 78, 76, 72, 71, 70, 69, 67, 64, 64],
-    }
-    df = pd.DataFrame(data)
-
-    plt.rcParams["axes.unicode_minus"] = False
-
-    fig = plt.figure()
-    ax = fig.add_subplot(111, projection="3d")
-
-    X = df["상영관"].values.reshape(-1, 1)
-    Y = df["좌석수"].values.reshape(-1, 1)
-    Z = df["연간관객수"].values
-
-    ax.scatter(X, Y, Z, s=50, label="Data Points")
-
-    model1 = LinearRegression().fit(X, Z)
-    Z_pred1 = model1.predict(X)
-    ax.plot(X.flatten(), Y.flatten(), Z_pred1, label="Trend: Screens vs Audience")
-
-    model2 = LinearRegression().fit(Y, Z)
-    Z_pred2 = model2.predict(Y)
-    ax.plot(X.flatten(), Y.flatten(), Z_pred2, label="Trend: Seats vs Audience")
-
-    ax.set_title("3D Relationship: Screens / Seats / Annual Audience")
-    ax.set_xlabel("Screens")
-    ax.set_ylabel("Seats")
-    ax.set_zlabel("Annual Audience (10k)")
-
-    ax.legend()
-    plt.tight_layout()
-    plt.savefig(out_dir / out_name, dpi=200)
-    plt.close()
+    g_cfg = cfg.get("graph3d", {})
+    x_col = g_cfg.get("x_column", "총 스크린 수")
+    y_col = g_cfg.get("y_column", "특별관 스크린수")
+    z_col = g_cfg.get("z_column", "총 좌석수")
+    df = load_theaters(cfg, [x_col, y_col, z_col])
+    if len(df) < 4:
+        raise ValueError(f"회귀에 쓸 극장 행이 부족합니다: {len(df)}행")
+
+    x, y, z = (df[c].to_numpy(dtype=np.float64) for c in (x_col, y_col, z_col))
+    coef, r2 = fit_plane(x, y, z)
+
+    n_boot = int(g_cfg.get("bootstrap", 2000))
+    confidence = float(g_cfg.get("confidence", 0.95))
+    boots = bootstrap_coefs(
+        x, y, z, n_boot, int(g_cfg.get("bootstrap_batch", 500)), int(g_cfg.get("seed", 42))
+    )
+    alpha = (1.0 - confidence) / 2
+    lo, hi = np.nanquantile(boots, [alpha, 1.0 - alpha], axis=0)
+
+    names = ["절편", x_col, y_col]
+    for name, b, l, h in zip(names, coef, lo, hi):
+        print(f"[graph3d] {name}: {b:.3f} ({confidence:.0%} CI {l:.3f} ~ {h:.3f})")
+    print(f"[graph3d] 극장 {len(df)}곳, R²={r2:.3f}, 부트스트랩 {n_boot}회")
+
+    from matplotlib.figure import Figure
+
+    apply_plot_font(cfg)
+    fig = Figure(figsize=(10, 8))
+    ax = fig.add_subplot(projection="3d")
+    ax.scatter(x, y, z, s=12, alpha=0.6, label=f"Theaters (n={len(df)})")
+
+    gx, gy = np.meshgrid(np.linspace(x.min(), x.max(), 20), np.linspace(y.min(), y.max(), 20))
+    ax.plot_surface(gx, gy, coef[0] + coef[1] * gx + coef[2] * gy, alpha=0.3, color="tab:orange")
+    ax.plot([], [], color="tab:orange", label=f"Fitted plane (R²={r2:.2f})")
+
+    ci_text = "\n".join(
+        f"{label} = {b:.1f} [{l:.1f}, {h:.1f}]" for label, b, l, h in zip(("b0", "b1", "b2"), coef, lo, hi)
+    )
+    ax.text2D(0.02, 0.02, f"{confidence:.0%} bootstrap CI\n{ci_text}", transform=ax.transAxes, fontsize=9)
+
+    ax.set_title(f"3D Relationship: {x_col} / {y_col} / {z_col}")
+    ax.set_xlabel(x_col)
+    ax.set_ylabel(y_col)
+    ax.set_zlabel(z_col)
+    ax.legend(loc="upper left")
+    fig.tight_layout()
+    fig.savefig(out_dir / out_name, dpi=200)
 
 
 if __name__ == "__main__":
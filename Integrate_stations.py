@@ -1,25 +1,36 @@
 """극장(엑셀), 지하철역(엑셀)을 결합해 Folium 지도를 생성합니다.
 
-- 극장 주소는 Kakao Local API(주소→좌표)로 변환합니다.
+- 극장 주소는 Kakao Local API(주소→좌표)로 변환합니다(geocoding.BatchGeocoder로 동시 배치 변환, 결과 캐시).
 - 역 좌표는 Domestic_station.xlsx의 '역위도', '역경도'를 우선 사용합니다.
-- 서울교통공사 역의 '역사도로명주소'가 있다면 추가로 주소→좌표 변환을 수행할 수 있습니다.
+- 좌표가 없거나 잘못된 역만 '역사도로명주소'를 주소→좌표 변환하며, 역은 (역사명, 노선명)당 한 번만 표시합니다.
+- 극장은 FastMarkerCluster, 역은 단일 GeoJSON 레이어로 추가합니다(map_layers).
 
 출력:
 - outputs/updated_map_with_stations_and_new_places.html
+- outputs/theater_station_accessibility.csv (극장별 가까운 역/거리, 반경 내 역 수)
 """
 
 from __future__ import annotations
 
 import os
-import re
 from pathlib import Path
 
 import folium
+import numpy as np
 import pandas as pd
-import requests
 import yaml
 from dotenv import load_dotenv
-from folium.plugins import MarkerCluster
+
+from address_normalizer import normalize_series, normalize_unique
+from geocoding import (
+    BatchGeocoder,
+    GeocodeCache,
+    format_latency_summary,
+)
+from http_transport import replay_credential
+from ingest import read_sheet
+from map_layers import add_circle_layer, add_fast_cluster_layer
+from proximity import accessibility_summary, theater_accessibility
 
 
 ROOT = Path(__file__).resolve().parent
@@ -43,40 +54,84 @@ def get_kakao_key(cfg: dict) -> str:
     return ""
 
 
-def get_coordinates(address: str, api_key: str, url: str) -> tuple[str | None, str | None]:
-    headers = {"Authorization": f"KakaoAK {api_key}"}
-    params = {"query": address}
-
-    r = requests.get(url, headers=headers, params=params, timeout=30)
-    if r.status_code != 200:
-        return None, None
-    result = r.json()
-    if result.get("documents"):
-        return result["documents"][0].get("y"), result["documents"][0].get("x")
-    return None, None
-
-
-def clean_address(address: str) -> str:
-    address = address.strip()
-    address = re.sub(r"\s+", " ", address)
-    address = re.sub(r"\(.*?\)", "", address)
-    address = re.sub(r"\s*\d+층", "", address)
-    address = re.sub(r"\s*\d+~", "", address)
-    address = re.sub(r"\s*(로|길|번길)\s+", r"\1", address)
-    address = re.sub(r"\s*(로|길|번길)", r"\1", address)
-    address = re.sub(r"(\d+)(번길|길|로|대로|가|동)", r"\1 \2", address)
-    address = re.sub(r"(\d+)\s*번\s*길", r"\1번길", address)
-    address = re.sub(r"(\w+)\s*(로|길|대로|번길)", r"\1\2", address)
-    address = re.sub(r"(\d+)([A-Za-z])", r"\1 \2", address)
-    address = re.sub(r"\s*(스퀘어|플라자|타워|아울렛|현대시티|드림어반|W)$", "", address)
-    return address.strip()
-
-
-def load_station_coordinates(file_path: Path) -> pd.DataFrame:
-    data = pd.read_excel(file_path, engine="openpyxl")
-    if "역위도" not in data.columns or "역경도" not in data.columns:
+STATION_COLUMNS = ["역사명", "노선명", "운영기관명", "역위도", "역경도", "역사도로명주소"]
+# resolve_stations는 이 컬럼들이 없어도 동작하므로 시트에 없으면 빼고 읽습니다.
+STATION_OPTIONAL_COLUMNS = ["운영기관명", "역사도로명주소"]
+
+# 국내 좌표 유효 범위(위도/경도). 범위를 벗어나면 누락/오입력으로 간주합니다.
+KOREA_LAT_RANGE = (33.0, 39.0)
+KOREA_LNG_RANGE = (124.0, 132.0)
+
+
+def _in_korea(lat: pd.Series, lng: pd.Series) -> pd.Series:
+    return lat.between(*KOREA_LAT_RANGE) & lng.between(*KOREA_LNG_RANGE)
+
+
+def resolve_stations(station_raw: pd.DataFrame, geocoder: BatchGeocoder | None = None) -> pd.DataFrame:
+    """역 좌표를 하나의 중복 없는 테이블로 정리합니다.
+
+    - 엑셀 '역위도'/'역경도'가 유효하면 그대로 사용합니다(source=sheet).
+    - 위도/경도가 뒤바뀐 행은 교환해 사용합니다(source=sheet_swapped).
+    - 좌표가 없거나 잘못된 행만 '역사도로명주소'를 주소→좌표 변환합니다(source=geocoded).
+    - (역사명, 노선명) 기준으로 중복을 제거합니다.
+
+    반환 컬럼: 역사명, 노선명, 운영기관명, lat, lng, source
+    """
+    if "역위도" not in station_raw.columns or "역경도" not in station_raw.columns:
         raise KeyError("열 이름 '역위도' 또는 '역경도'가 없습니다.")
-    return data[["역위도", "역경도"]].dropna()
+
+    df = pd.DataFrame(index=station_raw.index)
+    for col in ["역사명", "노선명", "운영기관명"]:
+        df[col] = station_raw[col] if col in station_raw.columns else None
+
+    sheet_lat = pd.to_numeric(station_raw["역위도"], errors="coerce")
+    sheet_lng = pd.to_numeric(station_raw["역경도"], errors="coerce")
+    valid = _in_korea(sheet_lat, sheet_lng)
+    swapped = ~valid & _in_korea(sheet_lng, sheet_lat)
+
+    df["lat"] = sheet_lat.where(valid, sheet_lng.where(swapped))
+    df["lng"] = sheet_lng.where(valid, sheet_lat.where(swapped))
+    df["source"] = "sheet"
+    df.loc[swapped, "source"] = "sheet_swapped"
+
+    need_geocode = ~(valid | swapped)
+    if "역사도로명주소" in station_raw.columns:
+        need_geocode &= station_raw["역사도로명주소"].notna()
+    else:
+        need_geocode &= False
+
+    if geocoder is not None and need_geocode.any():
+        addresses = normalize_series(station_raw.loc[need_geocode, "역사도로명주소"].astype(str)).tolist()
+        results = geocoder.geocode_many(addresses)
+        print(format_latency_summary("stations", results))
+        idx = station_raw.index[need_geocode]
+        # 변환 실패는 None이 아니라 NaN으로 둡니다(float 컬럼에 None을 넣으면 pandas가 TypeError).
+        df.loc[idx, "lat"] = [r.coord[0] if r.coord else np.nan for r in results]
+        df.loc[idx, "lng"] = [r.coord[1] if r.coord else np.nan for r in results]
+        df.loc[idx, "source"] = "geocoded"
+
+    df = df.dropna(subset=["lat", "lng"])
+    df = df.drop_duplicates(subset=["역사명", "노선명"], keep="first")
+    return df.reset_index(drop=True)
+
+
+THEATER_BRANDS = ["CGV", "롯데시네마", "메가박스"]
+
+
+def build_theater_table(data: pd.DataFrame, coords: dict) -> pd.DataFrame:
+    """브랜드 극장 행(영화관명, 브랜드, 정규화 주소)에 지오코딩 좌표를 붙입니다. 좌표 없는 행은 제외합니다."""
+    table = pd.DataFrame({"영화관명": data["영화관명"], "주소": normalize_series(data["소재지"])})
+    table["브랜드"] = None
+    for brand in THEATER_BRANDS:
+        mask = data["영화관명"].str.contains(brand, na=False) & table["브랜드"].isna()
+        table.loc[mask, "브랜드"] = brand
+    table = table.dropna(subset=["브랜드", "주소"])
+
+    resolved = table["주소"].map(lambda a: coords.get(a))
+    table = table[resolved.notna()].copy()
+    table["lat"] = [c[0] for c in resolved.dropna()]
+    table["lng"] = [c[1] for c in resolved.dropna()]
+    return table[["영화관명", "브랜드", "주소", "lat", "lng"]].reset_index(drop=True)
 
 
 def main() -> None:
@@ -87,68 +142,28 @@ def main() -> None:
         out_dir = ROOT / out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    api_key = get_kakao_key(cfg)
-    geocode_url = cfg.get("kakao_api", {}).get(
-        "geocode_url", "https://dapi.kakao.com/v2/local/search/address.json"
-    )
+    api_key = replay_credential(get_kakao_key(cfg), cfg)
     if not api_key:
         raise RuntimeError(
             "KAKAO API 키가 필요합니다. config.yaml의 kakao_api.rest_api_key 또는 "
             "환경변수 KAKAO_REST_API_KEY를 설정하세요."
         )
 
+    geocode_cache = GeocodeCache.from_config(cfg)
+
     theater_xlsx = ROOT / cfg.get("paths", {}).get("theater_xlsx", "Domestic_theater.xlsx")
     station_xlsx = ROOT / cfg.get("paths", {}).get("station_xlsx", "Domestic_station.xlsx")
 
     sheet_name = "2023년 전국 극장 리스트"
-    data = pd.read_excel(theater_xlsx, sheet_name=sheet_name, engine="openpyxl")
-    data.columns = data.columns.str.strip()
-
-    if "영화관명" not in data.columns or "소재지" not in data.columns:
-        raise KeyError("엑셀에 '영화관명' 또는 '소재지' 컬럼이 없습니다. 파일/시트를 확인하세요.")
+    data = read_sheet(theater_xlsx, sheet_name=sheet_name, columns=["영화관명", "소재지"], cfg=cfg)
 
     cgv_addresses = list(set(data[data["영화관명"].str.contains("CGV", na=False)]["소재지"]))
     lotte_addresses = list(set(data[data["영화관명"].str.contains("롯데시네마", na=False)]["소재지"]))
     mega_addresses = list(set(data[data["영화관명"].str.contains("메가박스", na=False)]["소재지"]))
 
-    def process_addresses(address_list: list[str]) -> list[str]:
-        cleaned = [clean_address(addr) for addr in address_list if isinstance(addr, str)]
-        return sorted(set(cleaned))
-
-    processed_cgv = process_addresses(cgv_addresses)
-    processed_lotte = process_addresses(lotte_addresses)
-    processed_mega = process_addresses(mega_addresses)
-
-    mymap = folium.Map(location=(37.5665, 126.9780), zoom_start=10)
-    cluster = MarkerCluster().add_to(mymap)
-
-    def add_markers(addresses: list[str], color: str) -> None:
-        for addr in addresses:
-            lat, lng = get_coordinates(addr, api_key, geocode_url)
-            if lat and lng:
-                folium.Marker(
-                    location=[float(lat), float(lng)],
-                    popup=addr,
-                    tooltip="주소",
-                    icon=folium.Icon(color=color, icon="info-sign"),
-                ).add_to(cluster)
-
-    add_markers(processed_cgv, "green")
-    add_markers(processed_lotte, "red")
-    add_markers(processed_mega, "purple")
-
-    # 역 좌표(엑셀 컬럼 사용)
-    station_data = load_station_coordinates(station_xlsx)
-    for _, row in station_data.iterrows():
-        folium.CircleMarker(
-            location=[row["역위도"], row["역경도"]],
-            radius=4,
-            color="blue",
-            fill=True,
-            fill_color="blue",
-            fill_opacity=0.9,
-            tooltip="역",
-        ).add_to(mymap)
+    processed_cgv = normalize_unique(cgv_addresses)
+    processed_lotte = normalize_unique(lotte_addresses)
+    processed_mega = normalize_unique(mega_addresses)
 
     # 추가 POI(예시)
     new_places = [
@@ -159,38 +174,77 @@ def main() -> None:
         "경기도 양주시 은현면 두리길 155",
     ]
 
+    # 극장+POI 주소를 한 번의 배치로 동시 변환(캐시 우선, 입력 순서 유지)
+    geocoder = BatchGeocoder.from_config(cfg, api_key, geocode_cache)
+    all_addresses = processed_cgv + processed_lotte + processed_mega + new_places
+    results = geocoder.geocode_many(all_addresses)
+    print(format_latency_summary("Integrate_stations", results))
+    coords = {r.address: r.coord for r in results}
+
+    # 역 좌표: 엑셀 좌표 우선, 누락/오류 행만 주소 기반 변환
+    station_raw = read_sheet(
+        station_xlsx, columns=STATION_COLUMNS, cfg=cfg, optional_columns=STATION_OPTIONAL_COLUMNS
+    )
+    stations = resolve_stations(station_raw, geocoder)
+    geocoder.close()
+    print(f"[stations] {len(stations)}개 역: " + ", ".join(
+        f"{k}={v}" for k, v in stations["source"].value_counts().items()
+    ))
+
+    mymap = folium.Map(location=(37.5665, 126.9780), zoom_start=10)
+
+    # 극장 마커: 브랜드별 색상을 컬럼으로 두고 하나의 FastMarkerCluster로 추가
+    theater_rows = [
+        (addr, coords[addr], color)
+        for addresses, color in [(processed_cgv, "green"), (processed_lotte, "red"), (processed_mega, "purple")]
+        for addr in addresses
+        if coords.get(addr)
+    ]
+    add_fast_cluster_layer(
+        mymap,
+        lat=[c[0] for _, c, _ in theater_rows],
+        lng=[c[1] for _, c, _ in theater_rows],
+        color=[color for _, _, color in theater_rows],
+        popup=[addr for addr, _, _ in theater_rows],
+        tooltip="주소",
+    )
+
+    # 역 마커(역당 1개, 단일 GeoJSON 레이어). 주소 기반으로 변환한 역은 navy로 구분합니다.
+    add_circle_layer(
+        mymap,
+        lat=stations["lat"].to_numpy(),
+        lng=stations["lng"].to_numpy(),
+        color=np.where(stations["source"] == "geocoded", "navy", "blue").tolist(),
+        tooltip=(stations["역사명"].astype(str) + " (" + stations["노선명"].astype(str) + ")").tolist(),
+    )
+
     for place in new_places:
-        lat, lng = get_coordinates(place, api_key, geocode_url)
-        if lat and lng:
+        coord = coords.get(place)
+        if coord:
             folium.Marker(
-                location=[float(lat), float(lng)],
+                location=list(coord),
                 popup=place,
                 tooltip="POI",
                 icon=folium.Icon(color="black", icon="info-sign"),
             ).add_to(mymap)
 
-    # (선택) 서울교통공사 역 주소 기반 추가 표시
-    station_raw = pd.read_excel(station_xlsx, engine="openpyxl")
-    if "운영기관명" in station_raw.columns and "역사도로명주소" in station_raw.columns:
-        filtered = station_raw[station_raw["운영기관명"] == "서울교통공사"]
-        addresses = filtered["역사도로명주소"].dropna().astype(str).apply(clean_address).tolist()
-        for addr in addresses:
-            lat, lng = get_coordinates(addr, api_key, geocode_url)
-            if lat and lng:
-                folium.CircleMarker(
-                    location=[float(lat), float(lng)],
-                    radius=4,
-                    color="navy",
-                    fill=True,
-                    fill_color="navy",
-                    fill_opacity=0.7,
-                    tooltip="서울교통공사(주소기반)",
-                ).add_to(mymap)
-
     out_path = out_dir / cfg.get("outputs", {}).get("map_theaters_and_stations", "map_theaters_stations.html")
     mymap.save(str(out_path))
+    geocode_cache.close()
     print(f"Saved: {out_path}")
 
+    # 극장-역 접근성 표(가까운 역 N개, 반경 내 역 수)
+    prox_cfg = cfg.get("proximity", {})
+    radii_m = prox_cfg.get("radii_m", [500, 1000])
+    theater_table = build_theater_table(data, coords)
+    access = theater_accessibility(theater_table, stations, k=int(prox_cfg.get("nearest_k", 3)), radii_m=radii_m)
+    access_path = out_dir / cfg.get("outputs", {}).get(
+        "theater_station_accessibility_csv", "theater_station_accessibility.csv"
+    )
+    access.to_csv(access_path, index=False, encoding="utf-8-sig")
+    print(f"[proximity] {accessibility_summary(access, radii_m)}")
+    print(f"Saved: {access_path}")
+
 
 if __name__ == "__main__":
     main()
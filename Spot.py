@@ -1,6 +1,7 @@
 """상위 매출 극장(예시 주소)과 주요 쇼핑몰(예시 주소)을 카카오 로컬 API(주소→좌표)로 변환해 지도에 시각화합니다.
 
 - API 키는 config.yaml 또는 환경변수로 주입합니다(코드에 직접 하드코딩 금지).
+- 주소는 geocoding.BatchGeocoder로 동시 배치 변환하며, 결과는 .cache/geocode.sqlite3에 캐시되어 재실행 시 API를 다시 호출하지 않습니다.
 - 주소 목록(theaters/domestic_mall)은 예시 데이터이며, 필요 시 교체/확장하세요.
 
 출력:
@@ -13,10 +14,12 @@ import os
 from pathlib import Path
 
 import folium
-import requests
 import yaml
 from dotenv import load_dotenv
 
+from geocoding import BatchGeocoder, GeocodeCache, format_latency_summary
+from http_transport import replay_credential
+
 
 ROOT = Path(__file__).resolve().parent
 CONFIG_PATH = ROOT / "config.yaml"
@@ -39,22 +42,6 @@ def get_kakao_key(cfg: dict) -> str:
     return ""
 
 
-def get_coordinates_kakao(address: str, api_key: str, url: str) -> tuple[float, float] | None:
-    headers = {"Authorization": f"KakaoAK {api_key}"}
-    params = {"query": address}
-
-    r = requests.get(url, headers=headers, params=params, timeout=30)
-    r.raise_for_status()
-    data = r.json()
-
-    if data.get("documents"):
-        x = data["documents"][0].get("x")  # longitude
-        y = data["documents"][0].get("y")  # latitude
-        if x is not None and y is not None:
-            return float(y), float(x)
-    return None
-
-
 def main() -> None:
     cfg = load_config()
 
@@ -63,16 +50,15 @@ def main() -> None:
         out_dir = ROOT / out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    api_key = get_kakao_key(cfg)
-    geocode_url = cfg.get("kakao_api", {}).get(
-        "geocode_url", "https://dapi.kakao.com/v2/local/search/address.json"
-    )
+    api_key = replay_credential(get_kakao_key(cfg), cfg)
     if not api_key:
         raise RuntimeError(
             "KAKAO API 키가 필요합니다. config.yaml의 kakao_api.rest_api_key 또는 "
             "환경변수 KAKAO_REST_API_KEY를 설정하세요."
         )
 
+    geocode_cache = GeocodeCache.from_config(cfg)
+
     # 예시 주소(프로젝트 목적에 맞게 교체 가능)
     theaters = {
         "CGV": [
@@ -119,13 +105,25 @@ def main() -> None:
         "경기도 파주시 회동길 390",
     ]
 
+    # 극장+쇼핑몰 주소를 한 번의 배치로 동시 변환(캐시 우선, 입력 순서 유지)
+    geocoder = BatchGeocoder.from_config(cfg, api_key, geocode_cache)
+    all_addresses = [addr for addresses in theaters.values() for addr in addresses] + domestic_mall
+    results = geocoder.geocode_many(all_addresses)
+    geocoder.close()
+    print(format_latency_summary("Spot", results))
+
+    errors = [r for r in results if r.source == "error"]
+    if errors:
+        raise RuntimeError(f"Kakao 주소 변환 실패 {len(errors)}건: {errors[0].address} ({errors[0].error})")
+    coords = {r.address: r.coord for r in results}
+
     mymap = folium.Map(location=(37.5665, 126.9780), zoom_start=10)
 
     # 극장 마커
     color_map = {"CGV": "green", "롯데시네마": "red", "메가박스": "purple"}
     for theater_type, addresses in theaters.items():
         for addr in addresses:
-            coord = get_coordinates_kakao(addr, api_key, geocode_url)
+            coord = coords.get(addr)
             if coord:
                 folium.Marker(
                     location=list(coord),
@@ -136,7 +134,7 @@ def main() -> None:
 
     # 쇼핑몰 마커
     for addr in domestic_mall:
-        coord = get_coordinates_kakao(addr, api_key, geocode_url)
+        coord = coords.get(addr)
         if coord:
             folium.Marker(
                 location=list(coord),
@@ -147,6 +145,7 @@ def main() -> None:
 
     out_path = out_dir / cfg.get("outputs", {}).get("map_spot", "map_spot_theaters_malls.html")
     mymap.save(str(out_path))
+    geocode_cache.close()
     print(f"Saved: {out_path}")
 
 
@@ -1,74 +1,72 @@
+"""영화 지표(연도 × 한국/외국영화) 차트 렌더링.
+
+- 데이터는 `movie_indicators.load_cube()`의 지표 큐브(타입 고정 + 파생 지표, `.cache/indicators/` 캐시)에서 읽고,
+  분류별(연도 정렬) 배열을 한 번만 만들어 모든 지표 차트가 같은 배열을 씁니다.
+- 렌더링은 `chart_render`가 맡습니다(차트별 독립 Agg Figure, `visualization.render_workers`개 프로세스에서 동시 렌더).
+- `visualization.layout`: separate(지표별 PNG) | small_multiples(모든 지표를 한 그림에) | both
+- `visualization.backend`: png(래스터) | json(계열 값 JSON, 대시보드가 인라인 SVG로 그리고 마우스를 올리면 값 표시)
+
+지표는 `CHARTS`에 큐브 컬럼으로 `ChartSpec`을 추가하면 됩니다(원본 CSV에 없어 큐브에 없는 지표는 건너뜀).
+"""
+
 from __future__ import annotations
 
-import os
+from dataclasses import dataclass
 from pathlib import Path
+
+import numpy as np
 import yaml
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib import font_manager
+
+from chart_render import BACKENDS, ChartJob, render_all
+from movie_indicators import category_series, load_cube
 
 
 ROOT = Path(__file__).resolve().parent
 CONFIG_PATH = ROOT / "config.yaml"
 
+CATEGORY_LABELS = {"한국영화": "Korean Films", "외국영화": "Foreign Films"}
+LAYOUTS = ("separate", "small_multiples", "both")
+
+
+@dataclass(frozen=True)
+class ChartSpec:
+    column: str  # 지표 큐브 컬럼(movie_indicators)
+    title: str
+    ylabel: str
+    output_key: str
+    default_name: str
+
+
+CHARTS = [
+    ChartSpec(
+        "releases",
+        "Number of Releases by Year (Korean vs Foreign Films)",
+        "Number of Releases",
+        "movie_releases_plot",
+        "movie_releases_by_year.png",
+    ),
+    ChartSpec(
+        "audience_10k",
+        "Audience (10k) by Year (Korean vs Foreign Films)",
+        "Audience (10k)",
+        "movie_audience_plot",
+        "movie_audience_by_year.png",
+    ),
+    ChartSpec(
+        "sales_100m",
+        "Sales by Year (Korean vs Foreign Films)",
+        "Sales (100M KRW)",
+        "movie_sales_plot",
+        "movie_sales_by_year.png",
+    ),
+]
+
 
 def load_config() -> dict:
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
 
-def _resolve_korean_font_path() -> str | None:
-    env_path = os.getenv("KOREAN_FONT_PATH", "").strip()
-    if env_path and Path(env_path).exists():
-        return env_path
-
-    preferred_names = [
-        "NanumGothic",
-        "Nanum Gothic",
-        "Apple SD Gothic Neo",
-        "AppleGothic",
-        "Malgun Gothic",
-        "Noto Sans CJK KR",
-        "Noto Sans KR",
-    ]
-    for name in preferred_names:
-        try:
-            path = font_manager.findfont(name, fallback_to_default=False)
-            if path and Path(path).exists():
-                return path
-        except Exception:
-            continue
-    return None
-
-
-def _apply_plot_font() -> None:
-    plt.rcParams["axes.unicode_minus"] = False
-    font_path = _resolve_korean_font_path()
-    if font_path:
-        font_name = font_manager.FontProperties(fname=font_path).get_name()
-        plt.rcParams["font.family"] = font_name
-
-
-def _plot_two_series(df: pd.DataFrame, x_col: str, y_col: str, cat_col: str, out_path: Path, title: str, ylabel: str) -> None:
-    # 카테고리별로 분리(예: Korean vs Foreign)
-    categories = list(df[cat_col].dropna().unique())
-
-    plt.figure(figsize=(14, 8))
-    for cat in categories:
-        sub = df[df[cat_col] == cat].sort_values(x_col)
-        plt.plot(sub[x_col], sub[y_col], marker="o", label=str(cat))
-
-    plt.xticks(sorted(df[x_col].unique()), rotation=45)
-    plt.grid(axis="x", linestyle="--")
-    plt.title(title)
-    plt.xlabel("Year")
-    plt.ylabel(ylabel)
-    plt.legend(title="Category")
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=200)
-    plt.close()
-
-
 def main() -> None:
     cfg = load_config()
 
@@ -77,51 +75,49 @@ def main() -> None:
         out_dir = ROOT / out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    vis_cfg = cfg.get("visualization", {})
+    layout = vis_cfg.get("layout", "separate")
+    if layout not in LAYOUTS:
+        raise ValueError(f"지원하지 않는 visualization.layout입니다: {layout} (가능: {', '.join(LAYOUTS)})")
+    backend = vis_cfg.get("backend", "png")
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 visualization.backend입니다: {backend} (가능: {', '.join(BACKENDS)})")
     outputs = cfg.get("outputs", {})
-    releases_png = outputs.get("movie_releases_plot", "movie_releases_by_year.png")
-    audience_png = outputs.get("movie_audience_plot", "movie_audience_by_year.png")
-    sales_png = outputs.get("movie_sales_plot", "movie_sales_by_year.png")
 
     csv_name = cfg.get("paths", {}).get("movie_indicators_csv", "data_movie_indicators_by_year.csv")
-    data = pd.read_csv(ROOT / csv_name, encoding="utf-8-sig")
-
-    data["Year of 연도"] = data["Year of 연도"].astype(int)
-    data["분류"] = data["분류"].replace({"한국영화": "Korean Films", "외국영화": "Foreign Films"})
-
-    _apply_plot_font()
-
-    _plot_two_series(
-        data,
-        x_col="Year of 연도",
-        y_col="개봉편수",
-        cat_col="분류",
-        out_path=out_dir / releases_png,
-        title="Number of Releases by Year (Korean vs Foreign Films)",
-        ylabel="Number of Releases",
-    )
-
-    _plot_two_series(
-        data,
-        x_col="Year of 연도",
-        y_col="관객수(만)",
-        cat_col="분류",
-        out_path=out_dir / audience_png,
-        title="Audience (10k) by Year (Korean vs Foreign Films)",
-        ylabel="Audience (10k)",
-    )
-
-        # CSV에 따라 매출 컬럼명이 다를 수 있어 fallback 처리
-    sales_col = "매출액(억원)" if "매출액(억원)" in data.columns else ("매출액(억)" if "매출액(억)" in data.columns else "매출액")
-
-    _plot_two_series(
-        data,
-        x_col="Year of 연도",
-        y_col=sales_col,
-        cat_col="분류",
-        out_path=out_dir / sales_png,
-        title="Sales by Year (Korean vs Foreign Films)",
-        ylabel=sales_col,
-    )
+    cube = load_cube(ROOT / csv_name, cfg)
+
+    charts = []
+    for spec in CHARTS:
+        if spec.column not in cube.columns:
+            print(f"[WARN] 지표 컬럼이 없어 차트를 건너뜁니다: {spec.column}")
+            continue
+        charts.append(spec)
+
+    groups = category_series(cube, [spec.column for spec in charts])
+    xticks = np.sort(cube["year"].unique())
+    jobs = [
+        ChartJob(
+            spec.title,
+            spec.ylabel,
+            xticks,
+            [(CATEGORY_LABELS.get(cat, cat), g["year"], g[spec.column]) for cat, g in groups.items()],
+            out_dir / outputs.get(spec.output_key, spec.default_name),
+        )
+        for spec in charts
+    ]
+
+    tasks: list[tuple[str, object, Path | None]] = []
+    if layout in ("separate", "both"):
+        tasks += [("chart", job, None) for job in jobs]
+    if layout in ("small_multiples", "both"):
+        sm_path = out_dir / outputs.get("movie_small_multiples_plot", "movie_indicators_small_multiples.png")
+        tasks.append(("small_multiples", jobs, sm_path))
+
+    saved = render_all(tasks, int(vis_cfg.get("render_workers", 3)), cfg, backend)
+
+    for path in saved:
+        print(f"Saved: {path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+"""지오코딩용 주소 정규화 엔진.
+
+- 정규식은 모듈 로드 시 한 번만 컴파일합니다.
+- 단건 정규화(`normalize_address`)는 LRU 메모이제이션으로 반복 주소를 즉시 반환합니다.
+- 대량 정규화(`normalize_series`)는 고유값만 한 번씩 정규화하고 NumPy 인덱싱으로 원래 순서에 펼칩니다.
+
+두 경로의 결과는 항상 동일합니다.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+# (패턴, 치환) 순서가 결과에 영향을 주므로 순서를 바꾸지 마세요.
+_RULES: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(r"\s+"), " "),
+    (re.compile(r"\(.*?\)"), ""),
+    (re.compile(r"\s*\d+층"), ""),
+    (re.compile(r"\s*\d+~"), ""),
+    (re.compile(r"\s*(로|길|번길)\s+"), r"\1"),
+    (re.compile(r"\s*(로|길|번길)"), r"\1"),
+    (re.compile(r"(\d+)(번길|길|로|대로|가|동)"), r"\1 \2"),
+    (re.compile(r"(\d+)\s*번\s*길"), r"\1번길"),
+    (re.compile(r"(\w+)\s*(로|길|대로|번길)"), r"\1\2"),
+    (re.compile(r"(\d+)([A-Za-z])"), r"\1 \2"),
+    (re.compile(r"\s*(스퀘어|플라자|타워|아울렛|현대시티|드림어반|W)$"), ""),
+]
+
+MEMO_SIZE = 65536
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def normalize_address(address: str) -> str:
+    address = address.strip()
+    for pattern, repl in _RULES:
+        address = pattern.sub(repl, address)
+    return address.strip()
+
+
+def normalize_series(addresses: pd.Series) -> pd.Series:
+    """문자열 Series를 정규화합니다. 결측/비문자열 값은 NaN으로 남깁니다.
+
+    `pd.factorize`로 고유 주소만 한 번씩 정규화한 뒤 코드 배열로 원래 위치에 펼칩니다.
+    """
+    is_str = addresses.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+    out = np.full(len(addresses), np.nan, dtype=object)
+    if not is_str.any():
+        return pd.Series(out, index=addresses.index, dtype=object)
+
+    codes, uniques = pd.factorize(addresses[is_str])
+    normalized = np.array([normalize_address(a) for a in uniques], dtype=object)
+    out[is_str] = normalized[codes]
+    return pd.Series(out, index=addresses.index, dtype=object)
+
+
+def normalize_unique(addresses: list) -> list[str]:
+    """문자열만 정규화해 중복 없이 정렬한 목록을 반환합니다."""
+    normalized = normalize_series(pd.Series(addresses, dtype=object)).dropna()
+    return sorted(set(normalized))
@@ -0,0 +1,98 @@
+"""주소 정규화 마이크로 벤치마크(합성 한국 주소 10만 건).
+
+실행:
+    python benchmarks/bench_address_normalizer.py [--n 100000] [--unique-ratio 0.3]
+
+- legacy: 기존 clean_address(매 호출 12회 re.sub, 미컴파일 패턴)
+- single: address_normalizer.normalize_address (컴파일 패턴 + LRU 메모)
+- series: address_normalizer.normalize_series (factorize 고유값 + 코드 배열 펼침)
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from address_normalizer import normalize_address, normalize_series  # noqa: E402
+
+
+SIDO = ["서울특별시", "부산광역시", "대구광역시", "인천광역시", "경기도", "강원특별자치도", "충청남도", "전라남도"]
+SIGUNGU = ["중구", "남구", "해운대구", "수원시 권선구", "성남시 분당구", "천안시 동남구", "용산구", "강남구"]
+ROADS = ["한강대로", "세화로", "판교역로", "올림픽로", "무진대로", "만남로", "중앙대로", "삼산로"]
+SUFFIXES = ["", " 3층", " (신천동 29)", " 타워", " 5~7층", " 스퀘어", " B1층", ""]
+
+
+def legacy_clean_address(address: str) -> str:
+    address = address.strip()
+    address = re.sub(r"\s+", " ", address)
+    address = re.sub(r"\(.*?\)", "", address)
+    address = re.sub(r"\s*\d+층", "", address)
+    address = re.sub(r"\s*\d+~", "", address)
+    address = re.sub(r"\s*(로|길|번길)\s+", r"\1", address)
+    address = re.sub(r"\s*(로|길|번길)", r"\1", address)
+    address = re.sub(r"(\d+)(번길|길|로|대로|가|동)", r"\1 \2", address)
+    address = re.sub(r"(\d+)\s*번\s*길", r"\1번길", address)
+    address = re.sub(r"(\w+)\s*(로|길|대로|번길)", r"\1\2", address)
+    address = re.sub(r"(\d+)([A-Za-z])", r"\1 \2", address)
+    address = re.sub(r"\s*(스퀘어|플라자|타워|아울렛|현대시티|드림어반|W)$", "", address)
+    return address.strip()
+
+
+def synthetic_addresses(n: int, unique_ratio: float, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    pool_size = max(1, int(n * unique_ratio))
+    pool = []
+    for _ in range(pool_size):
+        road = rng.choice(ROADS)
+        if rng.random() < 0.3:
+            road = f"{road}{rng.randint(1, 200)}번길"
+        pool.append(
+            f"  {rng.choice(SIDO)} {rng.choice(SIGUNGU)}  {road} {rng.randint(1, 2000)}{rng.choice(SUFFIXES)} "
+        )
+    return [rng.choice(pool) for _ in range(n)]
+
+
+def _time(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--unique-ratio", type=float, default=0.3)
+    args = parser.parse_args()
+
+    addresses = synthetic_addresses(args.n, args.unique_ratio)
+    series = pd.Series(addresses)
+
+    expected = [legacy_clean_address(a) for a in addresses]
+    normalize_address.cache_clear()
+    assert [normalize_address(a) for a in addresses] == expected
+    assert normalize_series(series).tolist() == expected
+
+    normalize_address.cache_clear()
+    timings = {
+        "legacy": _time(lambda: [legacy_clean_address(a) for a in addresses]),
+        "single(cold memo)": _time(lambda: [normalize_address(a) for a in addresses]),
+        "single(warm memo)": _time(lambda: [normalize_address(a) for a in addresses]),
+        "series(cold memo)": _time(lambda: (normalize_address.cache_clear(), normalize_series(series))),
+        "series(warm memo)": _time(lambda: normalize_series(series)),
+    }
+
+    print(f"addresses={args.n} unique={series.nunique()}")
+    for name, seconds in timings.items():
+        print(f"{name:>18}: total={seconds:.3f}s per-address={seconds / args.n * 1e6:.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""지도 레이어 빌드 벤치마크: 행 단위 마커 vs 단일 GeoJSON vs FastMarkerCluster.
+
+실행:
+    python benchmarks/bench_map_layers.py [--sizes 1000 10000 100000] [--per-row-max 10000]
+
+점 개수별로 레이어 구성 + HTML 렌더 시간과 HTML 크기를 출력합니다.
+행 단위 마커는 `--per-row-max`보다 큰 크기에서는 건너뜁니다(10만 건은 수 분 이상 소요).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import folium
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from map_layers import add_circle_layer, add_fast_cluster_layer  # noqa: E402
+
+
+def _per_row_circles(m: folium.Map, lat: np.ndarray, lng: np.ndarray, colors: list[str], tips: list[str]) -> None:
+    for a, b, c, t in zip(lat, lng, colors, tips):
+        folium.CircleMarker(location=[a, b], radius=4, color=c, fill=True, fill_color=c, tooltip=t).add_to(m)
+
+
+def _per_row_markers(m: folium.Map, lat: np.ndarray, lng: np.ndarray, colors: list[str], tips: list[str]) -> None:
+    for a, b, c, t in zip(lat, lng, colors, tips):
+        folium.Marker(location=[a, b], popup=t, icon=folium.Icon(color=c, icon="info-sign")).add_to(m)
+
+
+def _geojson(m: folium.Map, lat: np.ndarray, lng: np.ndarray, colors: list[str], tips: list[str]) -> None:
+    add_circle_layer(m, lat, lng, color=colors, tooltip=tips)
+
+
+def _fast_cluster(m: folium.Map, lat: np.ndarray, lng: np.ndarray, colors: list[str], tips: list[str]) -> None:
+    add_fast_cluster_layer(m, lat, lng, color=colors, popup=tips)
+
+
+BUILDERS = {
+    "per-row CircleMarker": (_per_row_circles, True),
+    "per-row Marker": (_per_row_markers, True),
+    "GeoJSON layer": (_geojson, False),
+    "FastMarkerCluster": (_fast_cluster, False),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--per-row-max", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'points':>8} {'builder':>22} {'build_s':>9} {'html_kb':>10}")
+    for n in args.sizes:
+        lat = rng.uniform(33.2, 38.5, n)
+        lng = rng.uniform(126.0, 129.5, n)
+        colors = np.where(rng.random(n) < 0.5, "blue", "red").tolist()
+        tips = [f"point {i}" for i in range(n)]
+
+        for name, (build, per_row) in BUILDERS.items():
+            if per_row and n > args.per_row_max:
+                print(f"{n:>8} {name:>22} {'skipped':>9} {'-':>10}")
+                continue
+            started = time.perf_counter()
+            m = folium.Map(location=(36.5, 127.8), zoom_start=7)
+            build(m, lat, lng, colors, tips)
+            html = m.get_root().render()
+            elapsed = time.perf_counter() - started
+            print(f"{n:>8} {name:>22} {elapsed:>9.3f} {len(html.encode('utf-8')) / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
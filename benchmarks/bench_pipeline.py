@@ -0,0 +1,276 @@
+"""파이프라인 단계별 오프라인 벤치마크(합성 데이터 + 로컬 stub API).
+
+실행:
+    python benchmarks/bench_pipeline.py [--scales 1 10 100] [--repeat 3] [--latency-ms 0]
+                                        [--targets Integrate_stations Visualization ...] [--kakao-rate 1000]
+                                        [--warm-cache] [--out results.json] [--compare baseline.json]
+
+배율마다 임시 폴더에 합성 입력(synthetic_data)을 만들고, stub 서버(stub_api)를 띄운 뒤
+config의 입력 경로/출력 폴더/캐시 폴더/API URL을 그쪽으로 바꿔 각 단계 main()과
+`pipeline.build_dashboard`를 시간 측정합니다. 네트워크 접근은 없습니다.
+
+- 반복마다 새 파이썬 프로세스에서 대상을 실행하므로 프로세스 안 메모(폰트/지표 큐브/주소 정규화/카세트 등)는
+  매번 비어 있습니다. 기본은 캐시 폴더(지오코딩/시트/이미지)도 비운 콜드 실행이고, `--warm-cache`면 폴더를 유지합니다.
+- 네이버 블로그 글 수는 검색어 수로 늘립니다(검색어당 최대 1000건, `synthetic_data.blog_workload`).
+- 대상이 import/실행 중 실패하면 status=error로 남기고 시간 통계는 null입니다.
+- 결과는 JSON(기본 benchmarks/results/bench-<커밋>-<시각>.json)으로 저장됩니다.
+- `--compare`로 이전 결과를 주면 (배율, 대상)별 중앙값 비율을 출력하고 `--threshold`를 넘으면 종료 코드 1입니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import importlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+import yaml  # noqa: E402
+
+from brand_keywords import configured_queries  # noqa: E402
+from step_metrics import measure  # noqa: E402
+from stub_api import StubApiServer  # noqa: E402
+from synthetic_data import blog_workload, write_inputs  # noqa: E402
+
+
+STEP_TARGETS = [
+    "Integrate_stations",
+    "Spot",
+    "Visualization",
+    "Graph3D",
+    "Consumtion_Share_Analysis",
+    "text_analysis",
+]
+DASHBOARD_TARGET = "pipeline.build_dashboard"
+ALL_TARGETS = STEP_TARGETS + [DASHBOARD_TARGET]
+
+
+def _merge(base: dict, override: dict) -> dict:
+    out = copy.deepcopy(base)
+    for k, v in override.items():
+        out[k] = _merge(out.get(k, {}), v) if isinstance(v, dict) and isinstance(out.get(k), dict) else v
+    return out
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def load_base_config() -> dict:
+    with open(ROOT / "config.yaml", "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def bench_config(
+    work: Path, inputs: dict[str, Path], stub: StubApiServer, kakao_rate: float, queries: list[str]
+) -> dict:
+    return _merge(
+        load_base_config(),
+        {
+            **stub.config_overrides(),
+            "naver_api": {**stub.config_overrides()["naver_api"], "queries": queries},
+            # 실 API 쿼터용 레이트 리밋은 stub에서는 측정 대상이 아니므로 풀어 둡니다.
+            "kakao_api": {
+                **stub.config_overrides()["kakao_api"],
+                "rate_limit_per_sec": kakao_rate,
+                "burst": max(1, int(kakao_rate)),
+            },
+            "paths": {**{k: str(v) for k, v in inputs.items()}, "output_dir": str(work / "outputs")},
+            "cache": {"dir": str(work / "cache")},
+            "dashboard": {"inline_map_assets": False},
+        },
+    )
+
+
+def _run_target(target: str, cfg: dict):
+    if target == DASHBOARD_TARGET:
+        import pipeline
+
+        return lambda: pipeline.build_dashboard(cfg["paths"]["output_dir"], cfg, {})
+
+    module = importlib.import_module(target)
+    # 단계 모듈은 저장소의 config.yaml을 직접 읽으므로 벤치마크 config로 바꿔 끼웁니다.
+    module.load_config = lambda *args, **kwargs: copy.deepcopy(cfg)
+    return module.main
+
+
+def run_once(target: str, cfg_path: Path, result_path: Path, verbose: bool) -> None:
+    """(자식 프로세스) 대상을 한 번 실행해 계측값을 `result_path`에 JSON으로 씁니다."""
+    cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
+    result: dict = {"status": "ok", "error": "", "metrics": None}
+    try:
+        fn = _run_target(target, cfg)
+    except Exception as e:
+        result.update(status="error", error=f"{type(e).__name__}: {e}")
+    else:
+        sink = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        with measure() as m, sink:
+            try:
+                fn()
+            except Exception as e:
+                result.update(status="error", error=f"{type(e).__name__}: {e}")
+                if verbose:
+                    traceback.print_exc()
+        result["metrics"] = m.to_dict()
+    result_path.write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+
+
+def _run_isolated(target: str, cfg_path: Path, verbose: bool) -> dict:
+    """새 파이썬 프로세스에서 `run_once`를 실행합니다(프로세스 안 메모가 이전 반복에서 이어지지 않게)."""
+    result_path = cfg_path.with_name(f"result-{target}.json")
+    result_path.unlink(missing_ok=True)
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--run-once", target, str(cfg_path), str(result_path)]
+    if verbose:
+        cmd.append("--verbose")
+    out = None if verbose else subprocess.DEVNULL
+    proc = subprocess.run(cmd, cwd=ROOT, stdout=out, stderr=out)
+    if not result_path.exists():
+        return {"status": "error", "error": f"벤치마크 자식 프로세스가 종료 코드 {proc.returncode}로 끝났습니다.", "metrics": None}
+    return json.loads(result_path.read_text(encoding="utf-8"))
+
+
+def bench_target(target: str, cfg: dict, repeat: int, warm_cache: bool, verbose: bool) -> dict:
+    record: dict = {"target": target, "status": "ok", "error": "", "runs": []}
+    cfg_path = Path(cfg["cache"]["dir"]).parent / "bench-config.json"
+    cfg_path.write_text(json.dumps(cfg, ensure_ascii=False), encoding="utf-8")
+
+    cache = Path(cfg["cache"]["dir"])
+    for _ in range(repeat):
+        if not warm_cache and target != DASHBOARD_TARGET:
+            shutil.rmtree(cache, ignore_errors=True)
+        result = _run_isolated(target, cfg_path, verbose)
+        if result["metrics"] is not None:
+            record["runs"].append(result["metrics"])
+        if result["status"] != "ok":
+            record.update(status="error", error=result["error"])
+            break
+
+    runs = record["runs"]
+    walls = [r["wall_seconds"] for r in runs]
+    record["wall_min"] = min(walls) if walls else None
+    record["wall_median"] = round(statistics.median(walls), 3) if walls else None
+    record["cpu_median"] = round(statistics.median(r["cpu_seconds"] for r in runs), 3) if runs else None
+    record["peak_rss_mb"] = max((r["peak_rss_mb"] or 0) for r in runs) if runs else None
+    record["http_requests"] = runs[0]["http_requests"] if runs else None
+    return record
+
+
+def _fmt(value, spec: str, width: int) -> str:
+    return format(value, spec) if value is not None else "-".rjust(width)
+
+
+def run(args: argparse.Namespace) -> dict:
+    results: list[dict] = []
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory(prefix=f"bench-x{scale:g}-") as tmp:
+            work = Path(tmp)
+            inputs = write_inputs(work / "data", scale, seed=args.seed)
+            base_queries = configured_queries(load_base_config())
+            queries, blog_total = blog_workload(base_queries, scale)
+            with StubApiServer(latency_ms=args.latency_ms, blog_total=blog_total) as stub:
+                cfg = bench_config(work, inputs, stub, args.kakao_rate, queries)
+                for target in args.targets:
+                    record = bench_target(target, cfg, args.repeat, args.warm_cache, args.verbose)
+                    record["scale"] = scale
+                    record["blog_queries"] = len(queries)
+                    results.append(record)
+                    status = record["status"] if record["status"] == "ok" else f"error ({record['error'][:60]})"
+                    print(
+                        f"x{scale:<5g} {target:<28} median {_fmt(record['wall_median'], '>8.3f', 8)}s  "
+                        f"cpu {_fmt(record['cpu_median'], '>7.3f', 7)}s  "
+                        f"rss {_fmt(record['peak_rss_mb'], '>7.1f', 7)}MB  "
+                        f"http {_fmt(record['http_requests'], '>6', 6)}  {status}"
+                    )
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "scales": args.scales,
+            "repeat": args.repeat,
+            "latency_ms": args.latency_ms,
+            "warm_cache": args.warm_cache,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> bool:
+    """(배율, 대상)별 중앙값 비율을 출력하고, 회귀(비율 > threshold)가 없으면 True."""
+    base = {(r["scale"], r["target"]): r for r in baseline.get("results", [])}
+    ok = True
+    print(f"\n비교 기준: {baseline.get('meta', {}).get('commit', '?')} -> {current['meta']['commit']}")
+    for r in current["results"]:
+        b = base.get((r["scale"], r["target"]))
+        if b is None or r["status"] != "ok" or b.get("status") != "ok":
+            continue
+        if not r.get("wall_median") or not b.get("wall_median"):
+            continue
+        ratio = r["wall_median"] / b["wall_median"]
+        flag = "  <-- 회귀" if ratio > threshold else ""
+        ok &= ratio <= threshold
+        print(f"x{r['scale']:<5g} {r['target']:<28} {b['wall_median']:>8.3f}s -> {r['wall_median']:>8.3f}s ({ratio:.2f}x){flag}")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", type=float, nargs="+", default=[1, 10])
+    parser.add_argument("--targets", nargs="+", default=ALL_TARGETS, choices=ALL_TARGETS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--kakao-rate", type=float, default=1000.0, help="stub 대상 Kakao 초당 요청 상한")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--warm-cache", action="store_true")
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--out", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=1.2)
+    parser.add_argument("--run-once", nargs=3, metavar=("TARGET", "CONFIG", "RESULT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_once:
+        target, cfg_path, result_path = args.run_once
+        run_once(target, Path(cfg_path), Path(result_path), args.verbose)
+        return 0
+
+    report = run(args)
+    out = args.out or BENCH_DIR / "results" / f"bench-{report['meta']['commit']}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {out}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        return 0 if compare(report, baseline, args.threshold) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,46 @@
+"""블로그 문서 토큰화 처리량(docs/sec) 벤치마크.
+
+실행:
+    python benchmarks/bench_tokenizer.py [--docs 100 1000 10000 50000] [--workers 1 4] [--backend auto]
+
+`synthetic_data.blog_items`로 만든 문서(제목 + 요약)를 `TokenizerService`로 토큰화합니다.
+Okt는 워밍업(JVM 기동)을 따로 재고, 이후 문서 수/워커 수별 처리량을 출력합니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+from synthetic_data import blog_items  # noqa: E402
+from tokenizer import TokenizerService, get_okt, okt_error  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1])
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--backend", default="auto")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    okt = get_okt()
+    print(f"Okt 워밍업: {time.perf_counter() - t0:.2f}s" if okt else f"Okt 사용 불가(정규식 폴백): {okt_error()}")
+
+    corpus = [f"{i['title']} {i['description']}" for i in blog_items("메가박스", 1, max(args.docs), max(args.docs))]
+    for n in args.docs:
+        for workers in args.workers:
+            service = TokenizerService(args.backend, args.batch_size, workers, parallel_min_docs=0)
+            _, stats = service.tokenize(corpus[:n])
+            print(f"docs={n:<7} {stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
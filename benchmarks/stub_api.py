@@ -0,0 +1,152 @@
+"""Kakao 주소 검색 / 네이버 블로그 검색을 흉내 내는 로컬 stub HTTP 서버.
+
+네트워크 없는 머신에서 벤치마크를 돌리기 위한 것으로, config의 `kakao_api.geocode_url`,
+`naver_api.blog_search_url`을 이 서버 주소로 바꿔 쓰면 됩니다(`StubApiServer.config_overrides()`).
+
+- `.../address.json?query=...`: 주소 해시로 정한 국내 좌표 1건(약 2%는 빈 결과)
+- `.../blog.json?query=&display=&start=`: `synthetic_data.blog_items`로 만든 페이지(total = `blog_total`)
+- `latency_ms`: 응답마다 넣는 인위적 지연(실 API 왕복 시간 흉내)
+
+단독 실행:
+    python benchmarks/stub_api.py [--port 8799] [--latency-ms 30] [--blog-total 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_data import BASE_BLOG_ITEMS, blog_items  # noqa: E402
+
+
+KAKAO_PATH = "/v2/local/search/address.json"
+NAVER_PATH = "/v1/search/blog.json"
+
+
+def kakao_document(query: str) -> list[dict]:
+    digest = hashlib.sha1(query.encode("utf-8")).digest()
+    if digest[0] < 5:  # 약 2%는 주소를 찾지 못한 응답
+        return []
+    lat = 34.8 + int.from_bytes(digest[1:5], "big") / 2**32 * 3.0
+    lng = 126.5 + int.from_bytes(digest[5:9], "big") / 2**32 * 2.7
+    return [{"address_name": query, "x": f"{lng:.6f}", "y": f"{lat:.6f}"}]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_StubHTTPServer"
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # 헤더/본문을 따로 보내므로 Nagle + delayed ACK로 요청마다 ~40ms가 붙습니다.
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        q = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+
+        if url.path.endswith("address.json"):
+            docs = kakao_document(q.get("query", ""))
+            body = {"documents": docs, "meta": {"total_count": len(docs)}}
+        elif url.path.endswith("blog.json"):
+            query = q.get("query", "")
+            start = max(1, int(q.get("start", 1)))
+            display = min(100, max(1, int(q.get("display", 10))))
+            total = self.server.blog_total
+            items = blog_items(query, start, display, total)
+            body = {"total": total, "start": start, "display": len(items), "items": items}
+        else:
+            self.send_error(404)
+            return
+
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        with self.server.lock:
+            self.server.request_count += 1
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr, latency_ms: float, blog_total: int) -> None:
+        super().__init__(addr, _Handler)
+        self.latency_ms = latency_ms
+        self.blog_total = blog_total
+        self.request_count = 0
+        self.lock = threading.Lock()
+
+
+class StubApiServer:
+    """백그라운드 스레드에서 도는 stub 서버. `with StubApiServer() as stub:`로 사용합니다."""
+
+    def __init__(self, port: int = 0, latency_ms: float = 0.0, blog_total: int = BASE_BLOG_ITEMS) -> None:
+        self._server = _StubHTTPServer(("127.0.0.1", port), latency_ms, blog_total)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        return self._server.request_count
+
+    def config_overrides(self) -> dict:
+        return {
+            "kakao_api": {"geocode_url": self.base_url + KAKAO_PATH, "rest_api_key": "stub-key"},
+            "naver_api": {
+                "blog_search_url": self.base_url + NAVER_PATH,
+                "client_id": "stub-id",
+                "client_secret": "stub-secret",
+            },
+        }
+
+    def start(self) -> "StubApiServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubApiServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--blog-total", type=int, default=BASE_BLOG_ITEMS)
+    args = parser.parse_args()
+
+    stub = StubApiServer(args.port, args.latency_ms, args.blog_total)
+    print(f"stub API: {stub.base_url}{KAKAO_PATH} , {stub.base_url}{NAVER_PATH} (Ctrl+C로 종료)")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
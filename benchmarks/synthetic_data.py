@@ -0,0 +1,177 @@
+"""벤치마크용 합성 입력 데이터 생성기.
+
+실제 입력과 같은 시트/컬럼 구조를 갖는 파일을 배율(scale)에 맞춰 만듭니다.
+1x는 실제 데이터와 비슷한 크기이고, 같은 (scale, seed)면 항상 같은 파일이 나옵니다.
+
+- 극장 워크북: "2023년 전국 극장 리스트" 시트(영화관명/소재지/총 스크린 수/총 좌석수 등)
+- 역 워크북: 첫 시트에 역사명/노선명/운영기관명/역위도/역경도/역사도로명주소
+  (일부 행은 좌표 누락·위경도 뒤바뀜으로 만들어 지오코딩/보정 경로를 탑니다)
+- 영화 지표 CSV: 연도 × 한국/외국영화 행
+- 네이버 블로그 검색 항목: stub 서버가 페이지 단위로 돌려주는 items
+  (검색 API가 검색어당 1000건까지만 주므로 배율은 검색어 수로 늘립니다, `blog_workload`)
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+BASE_THEATERS = 600
+BASE_STATIONS = 1000
+BASE_MOVIE_YEARS = 20
+BASE_BLOG_ITEMS = 1000  # 1x 검색어당 글 수(= 검색 API가 검색어 하나로 줄 수 있는 최대치)
+
+SIDO = ["서울특별시", "부산광역시", "대구광역시", "인천광역시", "경기도", "강원특별자치도", "충청남도", "전라남도"]
+SIGUNGU = ["중구", "남구", "해운대구", "수원시 권선구", "성남시 분당구", "천안시 동남구", "용산구", "강남구"]
+ROADS = ["한강대로", "세화로", "판교역로", "올림픽로", "무진대로", "만남로", "중앙대로", "삼산로"]
+SUFFIXES = ["", " 3층", " (신천동 29)", " 타워", " 5~7층", " 스퀘어", " B1층", ""]
+BRANDS = ["CGV", "롯데시네마", "메가박스", "씨네Q", "작은영화관"]
+LINES = ["1호선", "2호선", "3호선", "4호선", "5호선", "분당선", "경의중앙선", "부산 1호선"]
+OPERATORS = ["서울교통공사", "코레일", "부산교통공사", "인천교통공사"]
+BLOG_WORDS = [
+    "영화", "관람", "주차", "팝콘", "좌석", "리클라이너", "돌비", "아이맥스", "사운드", "스크린",
+    "주말", "조조", "할인", "멤버십", "데이트", "가족", "아이", "상영관", "매점", "콤보",
+    "예매", "시간표", "후기", "추천", "분위기", "청결", "직원", "친절", "주변", "맛집",
+    "쇼핑몰", "지하철", "역세권", "접근성", "혼영", "개봉", "신작", "애니메이션", "공포", "액션",
+]
+
+
+def _address(rng: random.Random) -> str:
+    return (
+        f"{rng.choice(SIDO)} {rng.choice(SIGUNGU)} {rng.choice(ROADS)}"
+        f"{rng.choice(['', ' ', '번길 ', '길 '])}{rng.randint(1, 999)}{rng.choice(SUFFIXES)}"
+    )
+
+
+def write_theater_workbook(path: Path, scale: float = 1, seed: int = 0) -> int:
+    rng = random.Random(seed)
+    n = max(1, int(BASE_THEATERS * scale))
+    rows = []
+    for i in range(n):
+        brand = rng.choices(BRANDS, weights=[30, 25, 20, 5, 20])[0]
+        screens = rng.randint(1, 20)
+        rows.append(
+            {
+                "번호": i + 1,
+                "광역단체": rng.choice(SIDO),
+                "기초단체": rng.choice(SIGUNGU),
+                "영화관명": f"{brand} 지점{i + 1}",
+                "소재지": _address(rng),
+                "총 스크린 수": screens,
+                "총 좌석수": screens * rng.randint(80, 220),
+                "특별관 스크린수": rng.randint(0, min(3, screens)),
+            }
+        )
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame(rows).to_excel(writer, sheet_name="2023년 전국 극장 리스트", index=False)
+    return n
+
+
+def write_station_workbook(path: Path, scale: float = 1, seed: int = 0, missing_ratio: float = 0.2) -> int:
+    rng = np.random.default_rng(seed)
+    py_rng = random.Random(seed)
+    n = max(1, int(BASE_STATIONS * scale))
+    lat = np.round(rng.uniform(34.8, 37.8, n), 6)
+    lng = np.round(rng.uniform(126.5, 129.2, n), 6)
+    df = pd.DataFrame(
+        {
+            "역번호": np.arange(1, n + 1),
+            "역사명": [f"역{i + 1}" for i in range(n)],
+            "노선명": [py_rng.choice(LINES) for _ in range(n)],
+            "역위도": lat,
+            "역경도": lng,
+            "운영기관명": [py_rng.choice(OPERATORS) for _ in range(n)],
+            "역사도로명주소": [_address(py_rng) for _ in range(n)],
+        }
+    )
+    u = rng.random(n)
+    missing = u < missing_ratio
+    swapped = (u >= missing_ratio) & (u < missing_ratio + 0.03)
+    df.loc[missing, ["역위도", "역경도"]] = np.nan
+    df.loc[swapped, "역위도"], df.loc[swapped, "역경도"] = lng[swapped], lat[swapped]
+    with pd.ExcelWriter(path) as writer:
+        df.to_excel(writer, sheet_name="표준데이터 역사(전체)", index=False)
+    return n
+
+
+def write_movie_indicators_csv(path: Path, scale: float = 1, seed: int = 0) -> int:
+    rng = np.random.default_rng(seed)
+    n_years = max(2, int(BASE_MOVIE_YEARS * scale))
+    rows = []
+    for year in range(2024 - n_years, 2024):
+        for cat in ("한국영화", "외국영화"):
+            releases = int(rng.integers(50, 1500))
+            audience = int(rng.integers(5_000_000, 120_000_000))
+            sales = audience * int(rng.integers(6000, 11000))
+            rows.append(
+                {
+                    "Year of 연도": year,
+                    "분류": cat,
+                    "개봉편수": releases,
+                    "관객수": audience,
+                    "관객수(만)": audience / 1e4,
+                    "매출액": sales,
+                    "매출액(억)": sales / 1e8,
+                    "상영편수": releases + int(rng.integers(0, 300)),
+                    "지표 선택에 따른 변수": sales / 1e8,
+                }
+            )
+    pd.DataFrame(rows).to_csv(path, index=False, encoding="utf-8-sig")
+    return len(rows)
+
+
+def blog_items(query: str, start: int, display: int, total: int, seed: int = 0) -> list[dict]:
+    """네이버 블로그 검색 응답의 items 한 페이지(start는 1부터). 같은 (query, 위치)는 항상 같은 항목입니다."""
+    items = []
+    for pos in range(start, min(start + display, total + 1)):
+        rng = random.Random(f"{seed}:{query}:{pos}")
+        words = rng.choices(BLOG_WORDS, k=rng.randint(12, 30))
+        highlight = rng.randrange(len(words))
+        words[highlight] = f"<b>{query}</b>"
+        items.append(
+            {
+                "title": f"{query} {' '.join(rng.choices(BLOG_WORDS, k=4))}",
+                "link": f"https://blog.example.com/{zlib.crc32(query.encode('utf-8')) % 997}/{pos}",
+                "description": " ".join(words),
+                "bloggername": f"blogger{rng.randint(1, 500)}",
+                "bloggerlink": f"https://blog.example.com/u{rng.randint(1, 500)}",
+                "postdate": f"2024{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+            }
+        )
+    return items
+
+
+def blog_workload(base_queries: list[str], scale: float = 1) -> tuple[list[str], int]:
+    """배율에 맞는 (검색어 목록, 검색어당 글 수).
+
+    1x는 `base_queries` 각각 `BASE_BLOG_ITEMS`건입니다. 검색어당 글 수는 API 상한을 넘길 수 없으므로
+    전체 글 수(검색어 수 × BASE_BLOG_ITEMS × scale)를 검색어를 늘려 나눠 담습니다(`CGV`, ..., `CGV 2`, ...).
+    """
+    base_queries = list(base_queries) or ["메가박스"]
+    posts = max(1, int(BASE_BLOG_ITEMS * len(base_queries) * scale))
+    n = math.ceil(posts / BASE_BLOG_ITEMS)
+    queries = [
+        base_queries[i % len(base_queries)] + ("" if i < len(base_queries) else f" {i // len(base_queries) + 1}")
+        for i in range(n)
+    ]
+    return queries, math.ceil(posts / n)
+
+
+def write_inputs(data_dir: Path, scale: float = 1, seed: int = 0) -> dict[str, Path]:
+    """배율에 맞는 입력 파일 세트를 만들고 config.paths에 넣을 경로를 반환합니다."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    paths = {
+        "theater_xlsx": data_dir / "theaters.xlsx",
+        "station_xlsx": data_dir / "stations.xlsx",
+        "movie_indicators_csv": data_dir / "movie_indicators.csv",
+    }
+    write_theater_workbook(paths["theater_xlsx"], scale, seed)
+    write_station_workbook(paths["station_xlsx"], scale, seed)
+    write_movie_indicators_csv(paths["movie_indicators_csv"], scale, seed)
+    return paths
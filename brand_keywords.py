@@ -0,0 +1,133 @@
+"""여러 검색어(브랜드)의 키워드 빈도를 한 번에 비교합니다.
+
+`KeywordStore`의 일별 빈도로 (브랜드, 작성일) 문서 × 키워드 희소 행렬(scipy CSR)을 만들고,
+브랜드별 특징 키워드를 벡터 연산으로 계산합니다.
+
+- TF-IDF: 브랜드별 상대 빈도 × idf. idf는 (브랜드, 작성일) 문서 기준 평활 idf(log((1+N)/(1+df)) + 1)입니다.
+- log-odds: 전체 빈도 × `prior_scale`을 사전분포로 쓰는 informative Dirichlet log-odds ratio의 z 점수
+  (해당 브랜드 vs 나머지 브랜드, Monroe et al. 2008).
+
+검색어 설정은 `naver_api.queries`(목록)이고, 없으면 `naver_api.query` 하나를 씁니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+from keyword_store import KeywordStore
+
+
+def configured_queries(cfg: dict) -> list[str]:
+    naver = cfg.get("naver_api", {})
+    queries = naver.get("queries") or [naver.get("query", "메가박스")]
+    if isinstance(queries, str):
+        queries = [queries]
+    return list(dict.fromkeys(str(q).strip() for q in queries if str(q).strip()))
+
+
+def brand_slug(brand: str) -> str:
+    slug = re.sub(r"[^\w가-힣]+", "_", brand).strip("_")
+    return slug or hashlib.sha1(brand.encode("utf-8")).hexdigest()[:8]
+
+
+def brand_output_path(path: Path, brand: str) -> Path:
+    """naver_keywords.csv → naver_keywords_<브랜드>.csv"""
+    return path.with_name(f"{path.stem}_{brand_slug(brand)}{path.suffix}")
+
+
+@dataclass
+class BrandMatrix:
+    matrix: sparse.csr_matrix  # (브랜드, 작성일) 문서 × 키워드 빈도
+    doc_brand: np.ndarray  # 행 → 브랜드 인덱스
+    brands: list[str]
+    vocab: np.ndarray  # 열 → 키워드
+
+    @cached_property
+    def brand_counts(self) -> sparse.csr_matrix:
+        """브랜드 × 키워드 빈도(문서 행을 브랜드별로 합친 것)."""
+        n_docs = self.matrix.shape[0]
+        indicator = sparse.csr_matrix(
+            (np.ones(n_docs), (self.doc_brand, np.arange(n_docs))), shape=(len(self.brands), n_docs)
+        )
+        return (indicator @ self.matrix).tocsr()
+
+    def total_counts(self) -> np.ndarray:
+        return np.asarray(self.matrix.sum(axis=0)).ravel()
+
+
+def build_brand_matrix(
+    store: KeywordStore,
+    brands: list[str],
+    since: str | None = None,
+    until: str | None = None,
+    exclude: set[str] | None = None,
+    min_len: int = 2,
+) -> BrandMatrix:
+    rows = store.daily_rows(brands, since, until)
+    exclude = exclude or set()
+    rows = [r for r in rows if len(r[2]) >= min_len and r[2] not in exclude]
+    if not rows:
+        return BrandMatrix(sparse.csr_matrix((0, 0)), np.zeros(0, dtype=np.int64), brands, np.array([], dtype=object))
+
+    queries, days, terms, counts = zip(*rows)
+    brand_index = {b: i for i, b in enumerate(brands)}
+    row_brand = np.fromiter((brand_index[q] for q in queries), dtype=np.int64, count=len(rows))
+    day_labels, day_idx = np.unique(np.array(days, dtype=object), return_inverse=True)
+    # 문서 = (브랜드, 작성일): 정수 코드로 묶어 행 번호를 매깁니다.
+    doc_codes, doc_idx = np.unique(row_brand * len(day_labels) + day_idx, return_inverse=True)
+    vocab, term_idx = np.unique(np.array(terms, dtype=object), return_inverse=True)
+    matrix = sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float64), (doc_idx, term_idx)), shape=(len(doc_codes), len(vocab))
+    )
+    doc_brand = doc_codes // len(day_labels)
+    return BrandMatrix(matrix, doc_brand, brands, vocab)
+
+
+def tfidf_by_brand(bm: BrandMatrix) -> np.ndarray:
+    """브랜드 × 키워드 TF-IDF(밀집 배열, 브랜드 수가 작다는 가정)."""
+    n_docs = bm.matrix.shape[0]
+    df = np.bincount(bm.matrix.indices, minlength=bm.matrix.shape[1])
+    idf = np.log((1 + n_docs) / (1 + df)) + 1.0
+    counts = bm.brand_counts.toarray()
+    totals = counts.sum(axis=1, keepdims=True)
+    tf = np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0)
+    return tf * idf
+
+
+def log_odds_by_brand(bm: BrandMatrix, prior_scale: float = 0.01) -> np.ndarray:
+    """브랜드 × 키워드 log-odds z 점수(양수면 해당 브랜드에서 상대적으로 많이 쓰임)."""
+    y = bm.brand_counts.toarray()
+    pooled = y.sum(axis=0)
+    alpha = prior_scale * pooled
+    alpha0 = alpha.sum()
+    n = y.sum(axis=1, keepdims=True)
+    y_rest = pooled - y
+    n_rest = n.sum() - n
+
+    delta = np.log((y + alpha) / (n + alpha0 - y - alpha)) - np.log(
+        (y_rest + alpha) / (n_rest + alpha0 - y_rest - alpha)
+    )
+    variance = 1.0 / (y + alpha) + 1.0 / (y_rest + alpha)
+    return delta / np.sqrt(variance)
+
+
+def distinctive_rows(
+    bm: BrandMatrix, tfidf: np.ndarray, z: np.ndarray, brand_idx: int, top: int | None = None
+) -> list[tuple[str, int, float, float]]:
+    """해당 브랜드에 나온 키워드를 log-odds z 내림차순으로 (키워드, 빈도, tfidf, z) 행으로 돌려줍니다."""
+    counts = bm.brand_counts[brand_idx].toarray().ravel()
+    cols = np.flatnonzero(counts)
+    cols = cols[np.lexsort((-counts[cols], -z[brand_idx, cols]))]
+    if top is not None:
+        cols = cols[:top]
+    return [
+        (str(bm.vocab[c]), int(counts[c]), round(float(tfidf[brand_idx, c]), 6), round(float(z[brand_idx, c]), 4))
+        for c in cols
+    ]
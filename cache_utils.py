@@ -0,0 +1,78 @@
+"""로컬 캐시 공통 유틸리티(캐시 폴더 경로, 파일 해시, 원자적 쓰기, 프로세스 간 잠금)."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+ROOT = Path(__file__).resolve().parent
+CACHE_DIR_DEFAULT = ROOT / ".cache"
+
+
+def cache_dir(cfg: dict, *parts: str) -> Path:
+    """config.yaml의 `cache.dir`(기본 .cache) 아래 하위 폴더를 만들고 반환합니다."""
+    path = Path(cfg.get("cache", {}).get("dir", str(CACHE_DIR_DEFAULT)))
+    if not path.is_absolute():
+        path = ROOT / path
+    path = path.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@contextmanager
+def atomic_write_path(path: Path) -> Iterator[Path]:
+    """`path`와 같은 폴더의 고유한 임시 파일 경로를 주고, 블록이 끝나면 `path`로 바꿔 넣습니다.
+
+    여러 프로세스가 같은 캐시 파일을 동시에 만들어도 서로의 임시 파일을 덮어쓰지 않고,
+    절반만 쓴 파일이 `path`로 옮겨지지 않습니다. 예외가 나면 임시 파일을 지웁니다.
+    """
+    path = Path(path)
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp = Path(name)
+    try:
+        yield tmp
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """잠금 파일 `path`로 프로세스 간 배타 구간을 만듭니다(블로킹)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,110 @@
+"""`chart_render`의 json 백엔드 산출물을 대시보드에 인라인 벡터 차트로 임베드합니다.
+
+카드에는 계열 값 JSON(<script type="application/json">)만 넣고, 페이지 끝에 한 번 넣는 공유 렌더러가
+각 JSON을 SVG 꺾은선 차트로 그립니다. 마우스를 올리면 가장 가까운 x의 계열별 값을 툴팁으로 보여 줍니다.
+연도 36개 × 계열 2개 수준의 차트는 PNG(수백 KB) 대신 1~2KB로 들어갑니다.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TextIO
+
+
+CHART_CSS = """
+.vchart { position: relative; }
+.vchart svg { width: 100%; height: auto; display: block; font: 11px -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; }
+.vchart .t { font-size: 13px; font-weight: 600; }
+.vchart .g { stroke: #e5e7eb; }
+.vchart .a { stroke: #9ca3af; }
+.vchart .tip { position: absolute; pointer-events: none; background: rgba(17, 24, 39, 0.9); color: #fff; padding: 6px 8px; border-radius: 6px; font-size: 12px; white-space: nowrap; }
+.vchart .tip[hidden] { display: none; }
+"""
+
+CHART_RENDERER_JS = """
+(function () {
+  var NS = 'http://www.w3.org/2000/svg', C = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b'];
+  function el(tag, attrs, parent, text) {
+    var e = document.createElementNS(NS, tag);
+    for (var k in attrs) e.setAttribute(k, attrs[k]);
+    if (text != null) e.textContent = text;
+    return parent.appendChild(e);
+  }
+  function fmt(v) { return v == null ? '-' : v.toLocaleString(undefined, { maximumFractionDigits: 2 }); }
+  function draw(box, c) {
+    var W = 640, H = 380, L = 70, R = 14, T = 30, B = 50, ys = [];
+    c.series.forEach(function (s) { s.y.forEach(function (v) { if (v != null) ys.push(v); }); });
+    var x0 = Math.min.apply(null, c.x), x1 = Math.max.apply(null, c.x);
+    var y0 = Math.min(0, Math.min.apply(null, ys)), y1 = Math.max(0, Math.max.apply(null, ys));
+    if (y1 === y0) y1 = y0 + 1;
+    function px(x) { return L + (x - x0) / ((x1 - x0) || 1) * (W - L - R); }
+    function py(y) { return T + (y1 - y) / (y1 - y0) * (H - T - B); }
+    var svg = el('svg', { viewBox: '0 0 ' + W + ' ' + H, role: 'img', 'aria-label': c.title }, box);
+    el('text', { x: L, y: 16, 'class': 't' }, svg, c.title);
+    for (var i = 0; i <= 4; i++) {
+      var v = y0 + (y1 - y0) * i / 4;
+      el('line', { x1: L, x2: W - R, y1: py(v), y2: py(v), 'class': 'g' }, svg);
+      el('text', { x: L - 6, y: py(v) + 4, 'text-anchor': 'end' }, svg, fmt(v));
+    }
+    var step = Math.ceil(c.x.length / 12);
+    c.x.forEach(function (x, j) {
+      if (j % step === 0) el('text', { x: px(x), y: H - B + 16, 'text-anchor': 'middle' }, svg, x);
+    });
+    el('line', { x1: L, x2: W - R, y1: H - B, y2: H - B, 'class': 'a' }, svg);
+    el('text', { x: (L + W - R) / 2, y: H - 8, 'text-anchor': 'middle' }, svg, c.xlabel);
+    el('text', { x: 14, y: (T + H - B) / 2, 'text-anchor': 'middle', transform: 'rotate(-90 14 ' + (T + H - B) / 2 + ')' }, svg, c.ylabel);
+    c.series.forEach(function (s, k) {
+      var d = '', color = C[k % C.length];
+      s.x.forEach(function (x, j) {
+        if (s.y[j] == null) return;
+        d += (d ? 'L' : 'M') + px(x).toFixed(1) + ' ' + py(s.y[j]).toFixed(1);
+        el('circle', { cx: px(x), cy: py(s.y[j]), r: 2.5, fill: color }, svg);
+      });
+      el('path', { d: d, fill: 'none', stroke: color, 'stroke-width': 2 }, svg);
+      el('rect', { x: W - R - 150, y: T + 4 + k * 16, width: 10, height: 10, fill: color }, svg);
+      el('text', { x: W - R - 134, y: T + 13 + k * 16 }, svg, s.name);
+    });
+    var cross = el('line', { y1: T, y2: H - B, 'class': 'a', visibility: 'hidden' }, svg);
+    var tip = box.appendChild(document.createElement('div'));
+    tip.className = 'tip';
+    tip.hidden = true;
+    var hit = el('rect', { x: L, y: T, width: W - L - R, height: H - T - B, fill: 'transparent' }, svg);
+    hit.addEventListener('mousemove', function (e) {
+      var r = svg.getBoundingClientRect(), mx = (e.clientX - r.left) * W / r.width, best = c.x[0];
+      c.x.forEach(function (x) { if (Math.abs(px(x) - mx) < Math.abs(px(best) - mx)) best = x; });
+      cross.setAttribute('x1', px(best));
+      cross.setAttribute('x2', px(best));
+      cross.setAttribute('visibility', 'visible');
+      tip.textContent = '';
+      tip.appendChild(document.createTextNode(c.xlabel + ' ' + best));
+      c.series.forEach(function (s) {
+        var j = s.x.indexOf(best);
+        tip.appendChild(document.createElement('br'));
+        tip.appendChild(document.createTextNode(s.name + ': ' + fmt(j < 0 ? null : s.y[j])));
+      });
+      tip.hidden = false;
+      tip.style.left = Math.min(e.clientX - r.left + 12, r.width - tip.offsetWidth) + 'px';
+      tip.style.top = (e.clientY - r.top + 12) + 'px';
+    });
+    hit.addEventListener('mouseleave', function () { tip.hidden = true; cross.setAttribute('visibility', 'hidden'); });
+  }
+  document.querySelectorAll('script.vchart-data').forEach(function (node) {
+    JSON.parse(node.textContent).charts.forEach(function (c) {
+      var box = node.parentNode.insertBefore(document.createElement('div'), node);
+      box.className = 'vchart';
+      draw(box, c);
+    });
+  });
+})();
+"""
+
+
+def write_chart_data(out: TextIO, path: Path) -> None:
+    """차트 JSON을 <script> 안에 안전하게 넣습니다(`</`가 스크립트를 닫지 않도록 이스케이프)."""
+    out.write("<script type='application/json' class='vchart-data'>")
+    out.write(Path(path).read_text(encoding="utf-8").replace("</", "<\\/"))
+    out.write("</script>")
+
+
+def write_renderer(out: TextIO) -> None:
+    out.write(f"<style>{CHART_CSS}</style><script>{CHART_RENDERER_JS}</script>")
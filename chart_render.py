@@ -0,0 +1,146 @@
+"""차트 렌더링 엔진(matplotlib Agg `Figure` 직접 사용, pyplot 전역 상태 없음).
+
+- `ChartJob`: 미리 정렬된 (계열 이름, x, y) 배열 묶음. 데이터 준비(groupby 등)는 호출하는 단계 모듈이 한 번만 합니다.
+- `render_all()`: 작업이 여럿이고 CPU가 2개 이상이면 spawn 프로세스 풀에서 동시에 그립니다.
+  워커는 이 모듈(numpy/matplotlib)만 import하므로 pandas 등 단계 모듈의 무거운 import 비용이 들지 않습니다.
+  워커 수는 `workers`, 작업 수, CPU 수 중 가장 작은 값입니다.
+- `backend="json"`이면 래스터 대신 계열 값만 담은 작은 JSON(`.json`)을 씁니다. 대시보드가 이 JSON을 인라인하고
+  공유 렌더러(`chart_embed`)로 SVG를 그리므로 matplotlib이 필요 없고, 프로세스 풀도 쓰지 않습니다.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from korean_font import apply_plot_font
+
+
+BACKENDS = ("png", "json")
+JSON_SIGNIFICANT_DIGITS = 6
+
+
+@dataclass
+class ChartJob:
+    title: str
+    ylabel: str
+    xticks: np.ndarray
+    series: list[tuple[str, np.ndarray, np.ndarray]]  # (계열 이름, x, y)
+    out_path: Path
+    xlabel: str = "Year"
+    legend_title: str = "Category"
+
+
+def _draw(ax, job: ChartJob, title_size: float | None = None) -> None:
+    for label, x, y in job.series:
+        ax.plot(x, y, marker="o", label=label)
+    ax.set_xticks(job.xticks)
+    ax.tick_params(axis="x", labelrotation=45)
+    ax.grid(axis="x", linestyle="--")
+    ax.set_title(job.title, fontsize=title_size)
+    ax.set_xlabel(job.xlabel)
+    ax.set_ylabel(job.ylabel)
+    ax.legend(title=job.legend_title)
+
+
+def render_chart(job: ChartJob, cfg: dict | None = None) -> Path:
+    from matplotlib.figure import Figure
+
+    apply_plot_font(cfg)
+    fig = Figure(figsize=(14, 8))
+    _draw(fig.add_subplot(), job)
+    fig.tight_layout()
+    fig.savefig(job.out_path, dpi=200)
+    return job.out_path
+
+
+def render_small_multiples(jobs: list[ChartJob], out_path: Path, cfg: dict | None = None) -> Path:
+    from matplotlib.figure import Figure
+
+    apply_plot_font(cfg)
+    cols = 2 if len(jobs) > 1 else 1
+    rows = -(-len(jobs) // cols)
+    fig = Figure(figsize=(8 * cols, 4.5 * rows))
+    axes = fig.subplots(rows, cols, squeeze=False, sharex=True).ravel()
+    for ax, job in zip(axes, jobs):
+        _draw(ax, job, title_size=11)
+    for ax in axes[len(jobs) :]:
+        ax.set_visible(False)
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=150)
+    return out_path
+
+
+def chart_output_path(path: Path, backend: str) -> Path:
+    """백엔드에 맞는 산출물 경로(json이면 확장자만 .json으로 바꿉니다)."""
+    return path.with_suffix(".json") if backend == "json" else path
+
+
+def _compact(value) -> float | int | None:
+    v = float(value)
+    if math.isnan(v) or math.isinf(v):
+        return None
+    if v.is_integer() and abs(v) < 2**53:
+        return int(v)
+    return float(f"{v:.{JSON_SIGNIFICANT_DIGITS}g}")
+
+
+def chart_payload(job: ChartJob) -> dict:
+    """클라이언트 렌더러가 쓰는 차트 데이터(유효 숫자 `JSON_SIGNIFICANT_DIGITS`자리)."""
+    return {
+        "title": job.title,
+        "xlabel": job.xlabel,
+        "ylabel": job.ylabel,
+        "legend": job.legend_title,
+        "x": [_compact(v) for v in job.xticks],
+        "series": [
+            {"name": label, "x": [_compact(v) for v in x], "y": [_compact(v) for v in y]}
+            for label, x, y in job.series
+        ],
+    }
+
+
+def write_chart_json(jobs: list[ChartJob], out_path: Path) -> Path:
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    tmp.write_text(
+        json.dumps({"charts": [chart_payload(job) for job in jobs]}, ensure_ascii=False, separators=(",", ":")),
+        encoding="utf-8",
+    )
+    tmp.replace(out_path)
+    return out_path
+
+
+def _render_task(kind: str, payload, out_path: Path | None, cfg: dict | None) -> Path:
+    # 프로세스 풀 작업 단위(spawn 워커에서 import 가능한 최상위 함수)
+    if kind == "small_multiples":
+        return render_small_multiples(payload, out_path, cfg)
+    return render_chart(payload, cfg)
+
+
+def render_all(
+    tasks: list[tuple[str, object, Path | None]],
+    workers: int = 1,
+    cfg: dict | None = None,
+    backend: str = "png",
+) -> list[Path]:
+    """(종류, ChartJob 또는 ChartJob 목록, 출력 경로) 작업들을 렌더링하고 저장 경로를 순서대로 반환합니다."""
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 차트 백엔드입니다: {backend} (가능: {', '.join(BACKENDS)})")
+    if backend == "json":
+        saved = []
+        for kind, payload, path in tasks:
+            jobs = payload if kind == "small_multiples" else [payload]
+            saved.append(write_chart_json(jobs, chart_output_path(path or payload.out_path, "json")))
+        return saved
+    workers = min(int(workers), len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        return [_render_task(kind, payload, path, cfg) for kind, payload, path in tasks]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return list(pool.map(_render_task, *zip(*tasks), [cfg] * len(tasks)))
@@ -0,0 +1,311 @@
+"""Kakao 주소→좌표 변환(단건/배치)과 결과 영속 캐시를 제공합니다.
+
+- 캐시 키는 (geocode URL, clean_address(주소)) 입니다.
+- 좌표를 찾은 결과는 `geocode_ttl_days`, 찾지 못한 결과(negative)는 `geocode_negative_ttl_days` 동안 유지합니다.
+- 항목 수가 `geocode_max_entries`를 넘으면 마지막 조회 시각이 오래된 순(LRU)으로 정리합니다.
+- TTL이 지난 항목은 조회 시 무시되고, `GeocodeCache.from_config`가 프로세스마다 캐시 파일별로 한 번 삭제합니다.
+- HTTP 오류(비 200 응답, 타임아웃 등)는 일시적 실패로 보고 캐시하지 않습니다.
+
+Integrate_stations, Spot 모듈이 같은 캐시 파일을 공유합니다.
+
+배치 변환(BatchGeocoder.geocode_many):
+- 주소 목록을 스레드 풀로 동시에 변환하고, 입력 순서대로 결과를 반환합니다.
+- 하나의 requests.Session(keep-alive 커넥션 풀)을 재사용합니다. 세션은 `http_transport`가 만들므로
+  녹화/재생 모드(`http.mode`)를 그대로 따릅니다. record 모드에서는 캐시를 읽지 않고 모든 주소를 호출합니다
+  (결과는 캐시에 다시 저장합니다).
+- 토큰 버킷(`kakao_api.rate_limit_per_sec`, `kakao_api.burst`)으로 API 호출 속도를 제한합니다.
+  버킷은 프로세스마다 따로 있으므로, 파이프라인이 Integrate_stations와 Spot을 서로 다른 워커에서 동시에 돌리면
+  실제 Kakao 호출 상한은 (동시에 도는 지오코딩 단계 수) × `rate_limit_per_sec`입니다.
+- 결과마다 호출 지연(ms)과 출처(cache/api/error)를 기록합니다.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+
+from address_normalizer import normalize_address as clean_address
+from cache_utils import cache_dir
+from http_transport import create_session, is_recording
+
+
+GEOCODE_DB_NAME = "geocode.sqlite3"
+
+GEOCODE_URL_DEFAULT = "https://dapi.kakao.com/v2/local/search/address.json"
+
+DAY_SECONDS = 24 * 60 * 60
+
+Coordinate = tuple[float, float]  # (latitude, longitude)
+
+_purged_paths: set[str] = set()
+
+
+class GeocodeCache:
+    """(URL, 정규화 주소) → 좌표 영속 캐시. 스레드 간 공유해도 안전합니다."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_days: float = 90,
+        negative_ttl_days: float = 7,
+        max_entries: int = 50000,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.ttl_seconds = float(ttl_days) * DAY_SECONDS
+        self.negative_ttl_seconds = float(negative_ttl_days) * DAY_SECONDS
+        self.max_entries = int(max_entries)
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            " url TEXT NOT NULL,"
+            " address TEXT NOT NULL,"
+            " lat REAL,"
+            " lng REAL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " PRIMARY KEY (url, address))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS geocode_accessed_at ON geocode (accessed_at)")
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "GeocodeCache":
+        cache_cfg = cfg.get("cache", {})
+        cache = cls(
+            cache_dir(cfg) / GEOCODE_DB_NAME,
+            ttl_days=cache_cfg.get("geocode_ttl_days", 90),
+            negative_ttl_days=cache_cfg.get("geocode_negative_ttl_days", 7),
+            max_entries=cache_cfg.get("geocode_max_entries", 50000),
+        )
+        # 만료 항목은 조회 시 무시될 뿐 남아 있으므로, 프로세스마다 캐시 파일별로 한 번 지웁니다.
+        key = str(cache.db_path.resolve())
+        if key not in _purged_paths:
+            _purged_paths.add(key)
+            cache.purge_expired()
+        return cache
+
+    def lookup(self, address: str, url: str) -> tuple[bool, Coordinate | None]:
+        """(hit 여부, 좌표)를 반환합니다. negative hit이면 (True, None)입니다."""
+        key = clean_address(address)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT lat, lng, created_at FROM geocode WHERE url = ? AND address = ?",
+                (url, key),
+            ).fetchone()
+            if row is None:
+                return False, None
+
+            lat, lng, created_at = row
+            ttl = self.ttl_seconds if lat is not None else self.negative_ttl_seconds
+            if now - created_at > ttl:
+                self._conn.execute("DELETE FROM geocode WHERE url = ? AND address = ?", (url, key))
+                self._conn.commit()
+                return False, None
+
+            self._conn.execute(
+                "UPDATE geocode SET accessed_at = ? WHERE url = ? AND address = ?",
+                (now, url, key),
+            )
+            self._conn.commit()
+
+        if lat is None or lng is None:
+            return True, None
+        return True, (float(lat), float(lng))
+
+    def store(self, address: str, url: str, coord: Coordinate | None) -> None:
+        key = clean_address(address)
+        now = time.time()
+        lat, lng = coord if coord is not None else (None, None)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode (url, address, lat, lng, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (url, key, lat, lng, now, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM geocode WHERE rowid IN ("
+                " SELECT rowid FROM geocode ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,),
+            )
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM geocode WHERE"
+                " (lat IS NOT NULL AND created_at < ?) OR (lat IS NULL AND created_at < ?)",
+                (now - self.ttl_seconds, now - self.negative_ttl_seconds),
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TokenBucket:
+    """초당 `rate`개 토큰이 채워지고 최대 `burst`개까지 쌓이는 블로킹 레이트 리미터."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+@dataclass
+class GeocodeResult:
+    address: str
+    coord: Coordinate | None
+    latency_ms: float
+    source: str  # cache | api | error
+    error: str = ""
+
+
+def parse_kakao_response(data: dict) -> Coordinate | None:
+    docs = data.get("documents") or []
+    if docs:
+        x = docs[0].get("x")  # longitude
+        y = docs[0].get("y")  # latitude
+        if x is not None and y is not None:
+            return float(y), float(x)
+    return None
+
+
+class BatchGeocoder:
+    """풀링된 세션 + 토큰 버킷 + 스레드 풀 기반 Kakao 주소 배치 변환기."""
+
+    def __init__(
+        self,
+        api_key: str,
+        url: str = GEOCODE_URL_DEFAULT,
+        cache: GeocodeCache | None = None,
+        max_workers: int = 8,
+        rate_per_sec: float = 10.0,
+        burst: int = 10,
+        timeout: float = 30.0,
+        session: requests.Session | None = None,
+        read_cache: bool = True,
+    ) -> None:
+        self.api_key = api_key
+        self.url = url
+        self.cache = cache
+        self.read_cache = read_cache
+        self.max_workers = max(1, int(max_workers))
+        self.timeout = float(timeout)
+        self.bucket = TokenBucket(rate_per_sec, burst)
+
+        self.session = session if session is not None else create_session(pool_maxsize=self.max_workers)
+        self.session.headers.update({"Authorization": f"KakaoAK {api_key}"})
+
+    @classmethod
+    def from_config(cls, cfg: dict, api_key: str, cache: GeocodeCache | None = None) -> "BatchGeocoder":
+        kakao = cfg.get("kakao_api", {})
+        return cls(
+            api_key,
+            url=kakao.get("geocode_url", GEOCODE_URL_DEFAULT),
+            cache=cache,
+            max_workers=kakao.get("max_workers", 8),
+            rate_per_sec=kakao.get("rate_limit_per_sec", 10.0),
+            burst=kakao.get("burst", 10),
+            timeout=kakao.get("timeout_seconds", 30.0),
+            session=create_session(cfg, pool_maxsize=kakao.get("max_workers", 8)),
+            read_cache=not is_recording(cfg),
+        )
+
+    def geocode(self, address: str) -> GeocodeResult:
+        started = time.perf_counter()
+
+        if self.cache is not None and self.read_cache:
+            hit, coord = self.cache.lookup(address, self.url)
+            if hit:
+                return GeocodeResult(address, coord, (time.perf_counter() - started) * 1000, "cache")
+
+        self.bucket.acquire()
+        started = time.perf_counter()
+        try:
+            r = self.session.get(self.url, params={"query": address}, timeout=self.timeout)
+            r.raise_for_status()
+            coord = parse_kakao_response(r.json())
+        except Exception as e:
+            return GeocodeResult(
+                address, None, (time.perf_counter() - started) * 1000, "error", f"{type(e).__name__}: {e}"
+            )
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        if self.cache is not None:
+            self.cache.store(address, self.url, coord)
+        return GeocodeResult(address, coord, latency_ms, "api")
+
+    def geocode_many(self, addresses: list[str]) -> list[GeocodeResult]:
+        """입력 순서를 유지한 결과 목록을 반환합니다. 중복 주소는 한 번만 호출합니다."""
+        unique = list(dict.fromkeys(addresses))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            resolved = dict(zip(unique, pool.map(self.geocode, unique)))
+        return [resolved[a] for a in addresses]
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def latency_summary(results: list[GeocodeResult]) -> dict:
+    api_ms = sorted(r.latency_ms for r in results if r.source != "cache")
+
+    def pct(q: float) -> float:
+        if not api_ms:
+            return 0.0
+        return round(api_ms[min(len(api_ms) - 1, int(q * len(api_ms)))], 1)
+
+    return {
+        "total": len(results),
+        "cache_hits": sum(r.source == "cache" for r in results),
+        "api_calls": sum(r.source == "api" for r in results),
+        "errors": sum(r.source == "error" for r in results),
+        "resolved": sum(r.coord is not None for r in results),
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "max_ms": round(api_ms[-1], 1) if api_ms else 0.0,
+    }
+
+
+def format_latency_summary(label: str, results: list[GeocodeResult]) -> str:
+    s = latency_summary(results)
+    return (
+        f"[geocode] {label}: total={s['total']} cache={s['cache_hits']} api={s['api_calls']} "
+        f"errors={s['errors']} resolved={s['resolved']} "
+        f"p50={s['p50_ms']}ms p95={s['p95_ms']}ms max={s['max_ms']}ms"
+    )
@@ -0,0 +1,234 @@
+"""Kakao/Naver API 호출이 공유하는 HTTP 전송 계층(실호출 / 녹화 / 재생).
+
+모든 외부 호출은 `create_session()`이 만든 `requests.Session`을 거칩니다.
+세션에는 `CassetteAdapter`가 붙어 모드에 따라 동작이 달라집니다.
+
+- live: 그대로 네트워크 호출
+- record: 네트워크 호출 후 요청/응답을 카세트에 기록(5xx/429 같은 일시 오류는 기록하지 않음)
+- replay: 네트워크 없이 카세트에서 응답을 돌려줌(없는 요청은 `CassetteMissError`)
+
+모드는 환경변수 `HTTP_TRANSPORT_MODE` > config `http.mode` > live 순으로 정합니다.
+(`pipeline.py --http-mode`는 환경변수로 워커 프로세스에 전달합니다.)
+
+record 모드에서는 로컬 캐시(지오코딩 캐시, 네이버 페이지 캐시, 단계 산출물 캐시)를 읽지 않습니다(`is_recording`).
+캐시가 먼저 답하면 그 호출은 카세트에 남지 않아, 깨끗한 캐시에서 재생할 때 `CassetteMissError`가 나기 때문입니다.
+파이프라인은 `begin_recording()`으로 임시 폴더(`.cache/cassettes.recording/`)에 녹화하고,
+실행이 실패 없이 끝난 뒤 `commit_recording()`으로 기존 카세트를 교체합니다.
+
+카세트는 `.cache/cassettes/`의 gzip JSON Lines 파일들입니다. 단계가 별도 프로세스에서 동시에 기록하므로
+(호스트, PID)별 파일에 나눠 쓰고, 재생할 때는 폴더의 모든 파일을 합쳐 읽습니다(같은 키는 나중 파일 우선).
+요청 키는 메서드 + 쿼리 파라미터를 정렬한 URL(+본문 해시)이며, 인증 헤더는 키에 넣지 않습니다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from cache_utils import cache_dir
+
+
+MODES = ("live", "record", "replay")
+MODE_ENV = "HTTP_TRANSPORT_MODE"
+CASSETTE_DIR_ENV = "HTTP_CASSETTE_DIR"
+CASSETTE_SUFFIX = ".jsonl.gz"
+RECORDING_DIR_NAME = "cassettes.recording"
+REPLAY_CREDENTIAL = "replay"  # 카세트 키에 인증 헤더가 없으므로 replay에서는 아무 값이나 됩니다.
+
+
+class CassetteMissError(requests.ConnectionError):
+    """replay 모드에서 카세트에 없는 요청."""
+
+
+def resolve_mode(cfg: dict | None = None) -> str:
+    mode = (os.getenv(MODE_ENV) or (cfg or {}).get("http", {}).get("mode") or "live").strip().lower()
+    if mode not in MODES:
+        raise ValueError(f"지원하지 않는 HTTP 모드입니다: {mode} (가능: {', '.join(MODES)})")
+    return mode
+
+
+def is_recording(cfg: dict | None = None) -> bool:
+    """record 모드면 True. 이때 호출부는 로컬 캐시를 읽지 말고 실제로 호출해 모두 녹화되게 해야 합니다."""
+    return resolve_mode(cfg) == "record"
+
+
+def replay_credential(value: str, cfg: dict | None = None) -> str:
+    """API 키/시크릿. 비어 있어도 replay 모드면 더미 값을 돌려줘 키 없이(CI 등) 재생할 수 있게 합니다."""
+    if not value and resolve_mode(cfg) == "replay":
+        return REPLAY_CREDENTIAL
+    return value
+
+
+def cassette_dir(cfg: dict | None = None) -> Path:
+    """카세트 폴더. 녹화 중에는 환경변수 `HTTP_CASSETTE_DIR`의 임시 폴더입니다."""
+    override = os.getenv(CASSETTE_DIR_ENV)
+    if override:
+        path = Path(override)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    return cache_dir(cfg or {}, "cassettes")
+
+
+def begin_recording(cfg: dict | None = None) -> Path:
+    """빈 임시 폴더에 새 녹화를 시작합니다. 기존 카세트는 `commit_recording()` 전까지 그대로 둡니다."""
+    staging = cache_dir(cfg or {}, RECORDING_DIR_NAME)
+    for path in staging.glob(f"*{CASSETTE_SUFFIX}"):
+        path.unlink(missing_ok=True)
+    os.environ[CASSETTE_DIR_ENV] = str(staging)  # spawn 워커도 환경변수를 물려받습니다.
+    return staging
+
+
+def commit_recording(staging: Path, cfg: dict | None = None) -> int:
+    """임시 폴더의 녹화로 기존 카세트를 교체하고 옮긴 파일 수를 반환합니다."""
+    flush_cassettes()
+    os.environ.pop(CASSETTE_DIR_ENV, None)
+    target = cassette_dir(cfg)
+    for old in target.glob(f"*{CASSETTE_SUFFIX}"):
+        old.unlink(missing_ok=True)
+    moved = 0
+    for path in sorted(staging.glob(f"*{CASSETTE_SUFFIX}")):
+        path.replace(target / path.name)
+        moved += 1
+    shutil.rmtree(staging, ignore_errors=True)
+    with _registry_lock:
+        _replay_cache.pop(target, None)
+    return moved
+
+
+def discard_recording(staging: Path) -> None:
+    """실패한 녹화를 버립니다. 기존 카세트는 건드리지 않습니다."""
+    flush_cassettes()
+    os.environ.pop(CASSETTE_DIR_ENV, None)
+    shutil.rmtree(staging, ignore_errors=True)
+
+
+def request_key(request: requests.PreparedRequest) -> str:
+    parts = urlsplit(request.url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    key = f"{request.method} {urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))}"
+    body = request.body
+    if body:
+        key += " #" + hashlib.sha256(body if isinstance(body, bytes) else str(body).encode("utf-8")).hexdigest()[:16]
+    return key
+
+
+class _CassetteWriter:
+    """기록을 모아 두었다가 flush 때 gzip 멤버 하나로 덧붙입니다(멀티 멤버 gzip은 그대로 읽힘)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._buffer: list[str] = []
+
+    def add(self, entry: dict) -> None:
+        with self._lock:
+            self._buffer.append(json.dumps(entry, ensure_ascii=False))
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._buffer:
+                return
+            data = ("\n".join(self._buffer) + "\n").encode("utf-8")
+            self._buffer.clear()
+        with gzip.open(self.path, "ab") as f:
+            f.write(data)
+
+
+_writers: dict[Path, _CassetteWriter] = {}
+_replay_cache: dict[Path, dict[str, dict]] = {}
+_registry_lock = threading.Lock()
+
+
+def _writer(directory: Path, host: str) -> _CassetteWriter:
+    path = directory / f"{host.replace(':', '_')}-{os.getpid()}{CASSETTE_SUFFIX}"
+    with _registry_lock:
+        if path not in _writers:
+            _writers[path] = _CassetteWriter(path)
+        return _writers[path]
+
+
+def flush_cassettes() -> None:
+    """기록 중인 카세트를 디스크에 씁니다. 단계 종료 시(워커 프로세스 포함)와 인터프리터 종료 시 호출됩니다."""
+    with _registry_lock:
+        writers = list(_writers.values())
+    for w in writers:
+        w.flush()
+
+
+atexit.register(flush_cassettes)
+
+
+def _load_cassettes(directory: Path) -> dict[str, dict]:
+    with _registry_lock:
+        if directory in _replay_cache:
+            return _replay_cache[directory]
+        entries: dict[str, dict] = {}
+        for path in sorted(directory.glob(f"*{CASSETTE_SUFFIX}"), key=lambda p: p.stat().st_mtime):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        entries[entry["key"]] = entry
+        _replay_cache[directory] = entries
+        return entries
+
+
+def _replayed_response(entry: dict, request: requests.PreparedRequest) -> requests.Response:
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.reason = entry.get("reason", "")
+    response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+    response._content = entry["body"].encode("utf-8")
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class CassetteAdapter(HTTPAdapter):
+    """모드에 따라 실제 전송/기록/재생을 하는 requests 어댑터."""
+
+    def __init__(self, mode: str, directory: Path, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.mode = mode
+        self.directory = directory
+
+    def send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+        if self.mode == "replay":
+            entry = _load_cassettes(self.directory).get(request_key(request))
+            if entry is None:
+                raise CassetteMissError(f"카세트에 없는 요청입니다(replay 모드): {request.method} {request.url}")
+            return _replayed_response(entry, request)
+
+        response = super().send(request, *args, **kwargs)
+        if self.mode == "record" and response.status_code < 500 and response.status_code != 429:
+            _writer(self.directory, urlsplit(request.url).netloc).add(
+                {
+                    "key": request_key(request),
+                    "status": response.status_code,
+                    "reason": response.reason,
+                    "headers": {"Content-Type": response.headers.get("Content-Type", "application/json")},
+                    "body": response.content.decode(response.encoding or "utf-8", errors="replace"),
+                }
+            )
+        return response
+
+
+def create_session(cfg: dict | None = None, pool_maxsize: int = 10) -> requests.Session:
+    """모드에 맞는 어댑터를 붙인 새 세션(배치 호출처럼 커넥션 풀 크기를 정해야 할 때)."""
+    adapter = CassetteAdapter(resolve_mode(cfg), cassette_dir(cfg), pool_connections=1, pool_maxsize=pool_maxsize)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
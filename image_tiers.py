@@ -0,0 +1,104 @@
+"""대시보드 임베드용 차트 이미지 인코딩 티어.
+
+차트 모듈은 dpi=200 PNG를 그대로 저장하고, 대시보드는 그 파일을 base64로 인라인합니다.
+여기서는 원본 PNG에서 두 티어를 만들어 캐시에 둡니다.
+
+- thumbnail: 카드에 보이는 축소본(`thumbnail_width`px, 0이면 생략)
+- full: 클릭 시 확대해 보는 원본 해상도(`full_max_width`px로 상한, 0이면 원본 크기)
+
+포맷은 PNG 또는 WebP이고, PNG는 팔레트 양자화(`quantize_colors`색, 0이면 생략)를 선택할 수 있습니다.
+인코딩 결과는 `.cache/images/`에 (원본 해시, 설정) 키로 저장되어 같은 차트는 다시 인코딩하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from PIL import Image
+
+from cache_utils import file_sha256
+
+
+IMAGE_FORMATS = ("png", "webp")
+
+
+@dataclass(frozen=True)
+class ImageTierConfig:
+    format: str = "png"
+    quantize_colors: int = 0
+    thumbnail_width: int = 960
+    full_max_width: int = 0
+    webp_quality: int = 85
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "ImageTierConfig":
+        dash = cfg.get("dashboard", {})
+        fmt = str(dash.get("image_format", cls.format)).lower()
+        if fmt not in IMAGE_FORMATS:
+            raise ValueError(f"지원하지 않는 이미지 포맷입니다: {fmt} (가능: {', '.join(IMAGE_FORMATS)})")
+        return cls(
+            format=fmt,
+            quantize_colors=int(dash.get("image_quantize_colors", cls.quantize_colors)),
+            thumbnail_width=int(dash.get("image_thumbnail_width", cls.thumbnail_width)),
+            full_max_width=int(dash.get("image_full_max_width", cls.full_max_width)),
+            webp_quality=int(dash.get("image_webp_quality", cls.webp_quality)),
+        )
+
+
+@dataclass
+class ImageTiers:
+    full: Path
+    thumbnail: Path | None = None
+
+
+def base64_size(n_bytes: int) -> int:
+    return 4 * ((n_bytes + 2) // 3)
+
+
+def _encode(img: Image.Image, max_width: int, tier_cfg: ImageTierConfig) -> bytes:
+    if max_width and img.width > max_width:
+        height = max(1, round(img.height * max_width / img.width))
+        img = img.resize((max_width, height), Image.Resampling.LANCZOS)
+
+    buf = io.BytesIO()
+    if tier_cfg.format == "webp":
+        img.save(buf, "WEBP", quality=tier_cfg.webp_quality, method=4)
+    else:
+        if tier_cfg.quantize_colors:
+            img = img.quantize(colors=min(tier_cfg.quantize_colors, 256), method=Image.Quantize.FASTOCTREE)
+        img.save(buf, "PNG", optimize=True)
+    return buf.getvalue()
+
+
+def encode_tiers(path: Path, tier_cfg: ImageTierConfig, cache: Path) -> ImageTiers:
+    """원본 이미지에서 티어 파일을 만들거나 캐시에서 찾아 경로를 반환합니다."""
+    settings = hashlib.sha256(repr(sorted(asdict(tier_cfg).items())).encode("utf-8")).hexdigest()[:8]
+    stem = f"{path.stem}.{file_sha256(path)[:16]}.{settings}"
+    suffix = f".{tier_cfg.format}"
+    full_path = cache / f"{stem}.full{suffix}"
+    thumb_path = cache / f"{stem}.thumb{suffix}" if tier_cfg.thumbnail_width else None
+
+    # full 파일을 마지막에 쓰므로 full이 있으면 해당 설정의 티어가 모두 만들어진 상태입니다.
+    if not full_path.exists():
+        for old in cache.glob(f"{path.stem}.*"):
+            if not old.name.startswith(stem):
+                old.unlink(missing_ok=True)  # 원본/설정이 바뀐 이전 티어
+        with Image.open(path) as src:
+            src.load()
+            img = src.convert("RGBA") if src.mode not in ("RGB", "RGBA") else src.copy()
+        # 원본이 썸네일보다 작으면 축소본이 의미가 없으므로 full 하나만 씁니다.
+        if thumb_path is not None and img.width > tier_cfg.thumbnail_width:
+            thumb_path.write_bytes(_encode(img, tier_cfg.thumbnail_width, tier_cfg))
+        if tier_cfg.format == "png" and not tier_cfg.quantize_colors and not (
+            tier_cfg.full_max_width and img.width > tier_cfg.full_max_width
+        ):
+            full_path.write_bytes(path.read_bytes())  # 변환할 것이 없으면 원본 PNG를 그대로 씁니다.
+        else:
+            full_path.write_bytes(_encode(img, tier_cfg.full_max_width, tier_cfg))
+    if thumb_path is not None and not thumb_path.exists():
+        thumb_path = None
+
+    return ImageTiers(full=full_path, thumbnail=thumb_path)
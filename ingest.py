@@ -0,0 +1,152 @@
+"""원본 엑셀 통합문서를 시트 단위 컬럼형 캐시(Parquet)로 변환해 읽습니다.
+
+- 시트는 처음 요청될 때 한 번만 `pd.read_excel`로 파싱되어 `.cache/sheets/`에 저장됩니다.
+- 원본 파일의 (mtime, size)가 그대로면 해시 계산 없이 캐시를 사용하고,
+  바뀌었으면 SHA-256을 다시 계산해 내용이 달라진 경우에만 재파싱합니다.
+- `columns`를 지정하면 필요한 컬럼만 읽습니다(Parquet 컬럼 프로젝션). `optional_columns`는 시트에 있을 때만 읽습니다.
+- pyarrow가 없으면 pickle 캐시로 폴백합니다.
+- 컬럼명 앞뒤 공백은 제거하고, 타입이 섞인 object 컬럼은 문자열로 통일합니다.
+
+파이프라인 단계는 서로 다른 프로세스에서 같은 시트를 동시에 읽을 수 있으므로, 캐시 파일은 쓰는 쪽마다
+고유한 임시 파일에 쓴 뒤 교체하고, manifest 읽기-수정-쓰기는 `manifest.lock` 파일 잠금으로 보호합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from cache_utils import atomic_write_path, cache_dir, file_lock, file_sha256
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_LOCK_NAME = "manifest.lock"
+
+_manifest_lock = threading.Lock()
+
+
+def has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df.columns = [str(c).strip() for c in df.columns]
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        values = df[col].dropna()
+        if values.map(type).nunique() > 1:
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v))
+    return df
+
+
+def _load_manifest(directory: Path) -> dict:
+    path = directory / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(directory: Path, manifest: dict) -> None:
+    with atomic_write_path(directory / MANIFEST_NAME) as tmp:
+        tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def source_digest(path: Path, directory: Path) -> str:
+    """(mtime, size)가 같으면 manifest의 해시를 재사용하고, 아니면 다시 계산합니다."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = str(path)
+    with _manifest_lock, file_lock(directory / MANIFEST_LOCK_NAME):
+        manifest = _load_manifest(directory)
+        entry = manifest.get(key)
+        if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            return entry["sha256"]
+
+        digest = file_sha256(path)
+        manifest[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+        _save_manifest(directory, manifest)
+        return digest
+
+
+def _source_tag(source: Path) -> str:
+    """같은 이름(stem)의 다른 통합문서와 캐시 파일이 섞이지 않도록 절대 경로로 구분합니다."""
+    return hashlib.sha1(str(Path(source).resolve()).encode("utf-8")).hexdigest()[:8]
+
+
+def _cache_file(directory: Path, source: Path, digest: str, sheet_name: str | int, suffix: str) -> Path:
+    sheet_tag = hashlib.sha1(str(sheet_name).encode("utf-8")).hexdigest()[:10]
+    return directory / f"{source.stem}.{_source_tag(source)}.{digest[:16]}.{sheet_tag}{suffix}"
+
+
+def _drop_stale(directory: Path, source: Path, digest: str) -> None:
+    """같은 원본의 이전 내용(digest) 캐시만 지웁니다. 다른 통합문서나 쓰는 중인 임시 파일은 건드리지 않습니다."""
+    pattern = re.compile(
+        rf"{re.escape(source.stem)}\.{_source_tag(source)}\.([0-9a-f]{{16}})\.[0-9a-f]{{10}}\.(?:parquet|pkl)"
+    )
+    for old in directory.iterdir():
+        m = pattern.fullmatch(old.name)
+        if m and m.group(1) != digest[:16]:
+            old.unlink(missing_ok=True)
+
+
+def read_sheet(
+    path: Path,
+    sheet_name: str | int = 0,
+    columns: list[str] | None = None,
+    cfg: dict | None = None,
+    optional_columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """엑셀 시트를 캐시에서 읽습니다. 캐시가 없거나 원본이 바뀌었으면 파싱 후 저장합니다.
+
+    `columns` 중 시트에 없는 컬럼은 KeyError이고, `optional_columns`에 든 컬럼은 없으면 빼고 읽습니다.
+    """
+    path = Path(path)
+    directory = cache_dir(cfg or {}, "sheets")
+    digest = source_digest(path, directory)
+
+    use_parquet = has_pyarrow()
+    cached = _cache_file(directory, path, digest, sheet_name, ".parquet" if use_parquet else ".pkl")
+
+    if not cached.exists():
+        _drop_stale(directory, path, digest)
+        df = _normalize_frame(pd.read_excel(path, sheet_name=sheet_name, engine="openpyxl"))
+        with atomic_write_path(cached) as tmp:
+            if use_parquet:
+                df.to_parquet(tmp, index=False)
+            else:
+                df.to_pickle(tmp)
+
+    df = None
+    if use_parquet:
+        import pyarrow.parquet as pq
+
+        available = pq.read_schema(cached).names
+    else:
+        df = pd.read_pickle(cached)
+        available = list(df.columns)
+
+    if columns is not None:
+        optional = set(optional_columns or ())
+        missing = [c for c in columns if c not in available and c not in optional]
+        if missing:
+            raise KeyError(f"{path.name} 시트 '{sheet_name}'에 컬럼이 없습니다: {', '.join(missing)}")
+        columns = [c for c in columns if c in available]
+
+    if use_parquet:
+        return pd.read_parquet(cached, columns=columns)
+    return df[columns] if columns is not None else df
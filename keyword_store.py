@@ -0,0 +1,237 @@
+"""블로그 키워드 빈도 영속 저장소(SQLite).
+
+실행마다 전체 글을 다시 토큰화하지 않도록, 이미 반영한 글과 일별 키워드 빈도를 저장합니다.
+
+- posts: (검색어, 글 키) — 글 키는 sha1(link + postdate)입니다. 이미 있는 글은 다시 집계하지 않습니다.
+- vocab: 키워드 → 정수 id
+- daily_counts: (검색어, 작성일, 키워드 id) → 빈도
+
+새 글만 토큰화해 `ingest()`로 더하므로 갱신 비용은 새 글 수에 비례합니다.
+기간 집계(`counts`)와 급상승 키워드(`trending`)는 저장된 일별 빈도만으로 계산합니다.
+불용어는 저장 시가 아니라 조회 시 거르므로, 불용어 목록을 바꿔도 과거 글을 다시 처리할 필요가 없습니다.
+
+HTTP record/replay 모드에서는 누적 저장소 대신 빈 메모리 저장소를 씁니다. 녹화 결과가 그동안 쌓인 글에
+좌우되지 않고(깨끗한 캐시에서 재생해도 같은 산출물), 재생한 과거 응답이 누적 빈도에 섞이지 않습니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable
+
+from cache_utils import cache_dir
+from http_transport import resolve_mode
+
+
+KEYWORD_DB_NAME = "keywords.sqlite3"
+
+_SQL_CHUNK = 500  # SQLite 바인딩 변수 개수 제한 대응
+
+
+def post_key(item: dict) -> str:
+    link = item.get("link") or f"{item.get('title', '')}\x00{item.get('description', '')}"
+    return hashlib.sha1(f"{link}\x00{item.get('postdate', '')}".encode("utf-8")).hexdigest()
+
+
+def post_day(item: dict) -> str:
+    """postdate(YYYYMMDD)를 YYYY-MM-DD로 바꿉니다. 없거나 형식이 다르면 오늘 날짜입니다."""
+    d = str(item.get("postdate") or "")
+    if len(d) == 8 and d.isdigit():
+        return f"{d[:4]}-{d[4:6]}-{d[6:]}"
+    return date.today().isoformat()
+
+
+def _chunks(values: list, size: int = _SQL_CHUNK) -> Iterable[list]:
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
+
+class KeywordStore:
+    """(검색어, 일자)별 키워드 빈도 저장소. 스레드 간 공유해도 안전합니다."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS posts ("
+            " query TEXT NOT NULL,"
+            " post_key TEXT NOT NULL,"
+            " day TEXT NOT NULL,"
+            " ingested_at REAL NOT NULL,"
+            " PRIMARY KEY (query, post_key)) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS vocab ("
+            " id INTEGER PRIMARY KEY,"
+            " term TEXT NOT NULL UNIQUE);"
+            "CREATE TABLE IF NOT EXISTS daily_counts ("
+            " query TEXT NOT NULL,"
+            " day TEXT NOT NULL,"
+            " term_id INTEGER NOT NULL,"
+            " count INTEGER NOT NULL,"
+            " PRIMARY KEY (query, day, term_id)) WITHOUT ROWID;"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "KeywordStore":
+        if resolve_mode(cfg) != "live":
+            return cls(Path(":memory:"))
+        name = cfg.get("text_analysis", {}).get("keyword_db", KEYWORD_DB_NAME)
+        return cls(cache_dir(cfg) / name)
+
+    def new_items(self, query: str, items: list[dict]) -> list[dict]:
+        """아직 반영하지 않은 글만 입력 순서대로 돌려줍니다(같은 실행 안의 중복도 제거)."""
+        keys = [post_key(it) for it in items]
+        seen: set[str] = set()
+        with self._lock:
+            for chunk in _chunks(list(dict.fromkeys(keys))):
+                rows = self._conn.execute(
+                    f"SELECT post_key FROM posts WHERE query = ? AND post_key IN ({','.join('?' * len(chunk))})",
+                    (query, *chunk),
+                ).fetchall()
+                seen.update(r[0] for r in rows)
+        out = []
+        for key, item in zip(keys, items):
+            if key not in seen:
+                seen.add(key)
+                out.append(item)
+        return out
+
+    def _term_ids_locked(self, terms: list[str]) -> dict[str, int]:
+        self._conn.executemany("INSERT OR IGNORE INTO vocab (term) VALUES (?)", [(t,) for t in terms])
+        ids: dict[str, int] = {}
+        for chunk in _chunks(terms):
+            rows = self._conn.execute(
+                f"SELECT term, id FROM vocab WHERE term IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            ids.update(rows)
+        return ids
+
+    def ingest(self, query: str, items: list[dict], tokens: list[list[str]]) -> int:
+        """새 글과 글별 토큰을 한 트랜잭션으로 반영하고 반영한 글 수를 반환합니다.
+
+        `items`는 `new_items()` 결과여야 합니다. 이미 있는 글은 건너뜁니다(빈도 중복 방지).
+        """
+        if len(items) != len(tokens):
+            raise ValueError("items와 tokens의 길이가 다릅니다.")
+        now = time.time()
+        daily: Counter[tuple[str, str]] = Counter()
+        with self._lock:
+            added = 0
+            for item, toks in zip(items, tokens):
+                day = post_day(item)
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO posts (query, post_key, day, ingested_at) VALUES (?, ?, ?, ?)",
+                    (query, post_key(item), day, now),
+                )
+                if cur.rowcount:
+                    added += 1
+                    daily.update((day, t) for t in toks)
+
+            ids = self._term_ids_locked(sorted({t for _, t in daily}))
+            self._conn.executemany(
+                "INSERT INTO daily_counts (query, day, term_id, count) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (query, day, term_id) DO UPDATE SET count = count + excluded.count",
+                [(query, day, ids[t], n) for (day, t), n in daily.items()],
+            )
+            self._conn.commit()
+        return added
+
+    def counts(self, query: str, since: str | None = None, until: str | None = None) -> Counter[str]:
+        """[since, until] 기간(YYYY-MM-DD, 생략 시 전체)의 키워드 빈도 합계."""
+        sql = (
+            "SELECT v.term, SUM(c.count) FROM daily_counts c JOIN vocab v ON v.id = c.term_id"
+            " WHERE c.query = ?"
+        )
+        params: list = [query]
+        if since:
+            sql += " AND c.day >= ?"
+            params.append(since)
+        if until:
+            sql += " AND c.day <= ?"
+            params.append(until)
+        sql += " GROUP BY c.term_id"
+        with self._lock:
+            return Counter(dict(self._conn.execute(sql, params).fetchall()))
+
+    def daily_rows(
+        self, queries: list[str], since: str | None = None, until: str | None = None
+    ) -> list[tuple[str, str, str, int]]:
+        """여러 검색어의 (검색어, 작성일, 키워드, 빈도) 행(문서-단어 행렬 구성용)."""
+        sql = (
+            "SELECT c.query, c.day, v.term, c.count FROM daily_counts c JOIN vocab v ON v.id = c.term_id"
+            f" WHERE c.query IN ({','.join('?' * len(queries))})"
+        )
+        params: list = list(queries)
+        if since:
+            sql += " AND c.day >= ?"
+            params.append(since)
+        if until:
+            sql += " AND c.day <= ?"
+            params.append(until)
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def post_count(self, query: str) -> int:
+        with self._lock:
+            (n,) = self._conn.execute("SELECT COUNT(*) FROM posts WHERE query = ?", (query,)).fetchone()
+        return n
+
+    def latest_day(self, query: str) -> str | None:
+        with self._lock:
+            (d,) = self._conn.execute("SELECT MAX(day) FROM daily_counts WHERE query = ?", (query,)).fetchone()
+        return d
+
+    def trending(
+        self,
+        query: str,
+        window_days: int = 7,
+        baseline_days: int = 28,
+        min_count: int = 3,
+        exclude: set[str] | None = None,
+        end: str | None = None,
+        min_len: int = 2,
+    ) -> list[tuple[str, int, int, float]]:
+        """최근 `window_days`일과 그 직전 `baseline_days`일의 상대 빈도를 비교해 급상승 키워드를 찾습니다.
+
+        점수는 add-one 평활한 상대 빈도의 로그 비율입니다. (키워드, 최근 빈도, 기준 빈도, 점수)를
+        점수 내림차순으로 반환합니다. `end`를 생략하면 저장된 마지막 작성일 기준입니다.
+        `min_len`보다 짧은 키워드는 `build_brand_matrix`와 같이 제외합니다(평활 분모에도 넣지 않음).
+        """
+        end = end or self.latest_day(query)
+        if end is None:
+            return []
+        end_day = date.fromisoformat(end)
+        recent_start = end_day - timedelta(days=window_days - 1)
+        base_end = recent_start - timedelta(days=1)
+        base_start = base_end - timedelta(days=baseline_days - 1)
+
+        exclude = exclude or set()
+        recent = self.counts(query, recent_start.isoformat(), end_day.isoformat())
+        base = self.counts(query, base_start.isoformat(), base_end.isoformat())
+        vocab = {t for t in set(recent) | set(base) if len(t) >= min_len} - exclude
+        recent_total = sum(recent[t] for t in vocab) + len(vocab)
+        base_total = sum(base[t] for t in vocab) + len(vocab)
+
+        rows = []
+        for t in vocab:
+            if recent[t] < min_count:
+                continue
+            score = math.log((recent[t] + 1) / recent_total) - math.log((base[t] + 1) / base_total)
+            rows.append((t, recent[t], base[t], round(score, 4)))
+        rows.sort(key=lambda r: (-r[3], -r[1], r[0]))
+        return rows
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,123 @@
+"""차트/워드클라우드가 공유하는 한글 폰트 탐색(결과 영속 캐시).
+
+탐색 순서:
+1. 환경변수 `KOREAN_FONT_PATH`(파일이 있으면 그대로 사용)
+2. matplotlib `findfont`로 선호 폰트 이름(NanumGothic, AppleGothic, Malgun Gothic, Noto Sans CJK KR 등)
+3. `fontManager.ttflist` 전체에서 이름에 nanum/gothic/malgun 등이 들어간 폰트
+
+찾은 결과(찾지 못한 경우 포함)는 `.cache/fonts/korean_font.json`에 저장합니다. 키는 matplotlib 버전,
+matplotlib 폰트 목록 캐시 파일(fontlist-*.json)의 크기/수정 시각, `KOREAN_FONT_PATH` 값이므로
+폰트를 새로 설치해 matplotlib이 목록을 다시 만들면 자동으로 다시 탐색합니다.
+캐시가 맞으면 `font_manager`의 폰트 스캔 없이 경로를 돌려주며, 같은 프로세스에서는 메모리에서 재사용합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from cache_utils import cache_dir
+
+
+PREFERRED_FONT_NAMES = [
+    "NanumGothic",
+    "Nanum Gothic",
+    "Apple SD Gothic Neo",
+    "AppleGothic",
+    "Malgun Gothic",
+    "Noto Sans CJK KR",
+    "Noto Sans KR",
+]
+FALLBACK_NAME_KEYWORDS = ["nanum", "gothic", "malgun", "noto sans cjk kr", "applegothic"]
+
+FONT_CACHE_NAME = "korean_font.json"
+
+_resolved: dict[str, dict] = {}
+
+
+def _font_state_key() -> str:
+    import matplotlib
+
+    env_path = os.getenv("KOREAN_FONT_PATH", "").strip()
+    parts = [matplotlib.__version__, env_path]
+    for p in sorted(Path(matplotlib.get_cachedir()).glob("fontlist-*.json")):
+        st = p.stat()
+        parts.append(f"{p.name}:{st.st_size}:{int(st.st_mtime)}")
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()[:24]
+
+
+def _discover() -> str | None:
+    env_path = os.getenv("KOREAN_FONT_PATH", "").strip()
+    if env_path and Path(env_path).exists():
+        return env_path
+
+    from matplotlib import font_manager
+
+    for name in PREFERRED_FONT_NAMES:
+        try:
+            path = font_manager.findfont(name, fallback_to_default=False)
+            if path and Path(path).exists():
+                return path
+        except Exception:
+            continue
+
+    for f in font_manager.fontManager.ttflist:
+        name = (f.name or "").lower()
+        if any(k in name for k in FALLBACK_NAME_KEYWORDS):
+            if f.fname and Path(f.fname).exists():
+                return f.fname
+    return None
+
+
+def _font_name(path: str) -> str:
+    from matplotlib import font_manager
+
+    return font_manager.FontProperties(fname=path).get_name()
+
+
+def _resolve(cfg: dict | None) -> dict:
+    key = _font_state_key()
+    if key in _resolved:
+        return _resolved[key]
+
+    cache_file = cache_dir(cfg or {}, "fonts") / FONT_CACHE_NAME
+    try:
+        entry = json.loads(cache_file.read_text(encoding="utf-8"))
+        if entry.get("key") == key and (entry.get("path") is None or Path(entry["path"]).exists()):
+            _resolved[key] = entry
+            return entry
+    except (OSError, ValueError):
+        pass
+
+    path = _discover()
+    # 첫 font_manager 임포트가 fontlist-*.json을 새로 만들면 키가 바뀌므로, 탐색 후의 상태로 저장합니다.
+    key = _font_state_key()
+    entry = {"key": key, "path": path, "name": _font_name(path) if path else None}
+    tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, cache_file)
+    _resolved[key] = entry
+    return entry
+
+
+def resolve_korean_font_path(cfg: dict | None = None) -> str | None:
+    """한글 폰트 파일 경로(없으면 None)."""
+    return _resolve(cfg)["path"]
+
+
+def apply_plot_font(cfg: dict | None = None) -> str | None:
+    """matplotlib 기본 글꼴을 한글 폰트로 바꾸고 마이너스 기호 깨짐을 막습니다. 적용한 폰트 경로를 반환합니다."""
+    import matplotlib
+
+    matplotlib.rcParams["axes.unicode_minus"] = False
+    entry = _resolve(cfg)
+    if entry["path"]:
+        from matplotlib import font_manager
+
+        # KOREAN_FONT_PATH처럼 matplotlib 폰트 목록에 없는 파일도 이름으로 찾을 수 있게 등록합니다.
+        if all(f.fname != entry["path"] for f in font_manager.fontManager.ttflist):
+            font_manager.fontManager.addfont(entry["path"])
+        matplotlib.rcParams["font.family"] = entry["name"]
+    return entry["path"]
@@ -0,0 +1,270 @@
+"""Folium 지도 HTML을 대시보드에 직접 임베드하기 위한 분해/공유 자산 처리.
+
+folium 문서는 지도마다 Leaflet/jQuery/awesome-markers 등의 <script>/<link>와 인라인 CSS/JS를
+각자 들고 있습니다. iframe srcdoc으로 넣으면 지도 수만큼 자산 참조가 중복되고, 문서 전체가
+HTML 이스케이프되어 크기가 더 커집니다. 여기서는
+
+- 각 지도 문서의 <head>에서 외부 자산(URL)과 인라인 블록을 뽑아 대시보드 <head>에 한 번만 넣고,
+- 지도 본문(<div class="folium-map">)과 지도별 스크립트(마커/피처 데이터)만 카드 안에 넣습니다.
+
+`inline_assets=True`이면 외부 자산을 `.cache/map_assets/`에 한 번 내려받아 인라인으로 넣어
+네트워크 없이도 열리는 단일 파일을 만듭니다(`AssetFetcher`).
+
+- CSS가 참조하는 폰트/이미지(`url(...)`)도 내려받아 `data:` URI로 넣습니다. `@font-face`는 woff2(없으면 woff)
+  소스만 남겨 크기를 줄입니다.
+- 내려받기는 `http_transport` 세션을 거치므로 record 모드에서는 녹화되고, replay 모드에서는 카세트로만 응답합니다.
+  record 모드에서는 자산 캐시를 읽지 않습니다.
+- 내려받기에 실패한 자산은 URL 참조로 남기고 `.failed` 표시를 남겨 하루 동안 다시 시도하지 않습니다
+  (오프라인 실행마다 자산별 타임아웃을 기다리지 않도록). replay 모드의 실패는 표시하지 않습니다.
+
+페이지 전체 스타일을 바꾸는 자산(`html, body {...}`, Bootstrap 5 CSS/JS)은 제외합니다.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import mimetypes
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import TextIO
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+import requests
+
+from http_transport import create_session, is_recording, resolve_mode
+
+
+# 대시보드 레이아웃을 덮어쓰므로 공유 자산에서 제외하는 URL 패턴(지도 렌더링에는 불필요)
+EXCLUDED_ASSET_PATTERNS = [r"/bootstrap@5[^/]*/dist/(css|js)/bootstrap"]
+
+_SCRIPT_SRC = re.compile(r"<script\s+src=\"([^\"]+)\"\s*>\s*</script>", re.S)
+_LINK_HREF = re.compile(r"<link\s+rel=\"stylesheet\"\s+href=\"([^\"]+)\"\s*/?>", re.S)
+_INLINE_BLOCK = re.compile(r"<(style|script)>(.*?)</\1>", re.S)
+_PAGE_GLOBAL_STYLE = re.compile(r"^\s*(html,\s*body|#map)\s*\{", re.S)
+_CSS_URL = re.compile(r"url\(\s*(['\"]?)(?!data:)([^'\")]+)\1\s*\)")
+_FONT_FACE = re.compile(r"@font-face\s*\{[^}]*\}", re.S)
+_FONT_SRC = re.compile(r"src\s*:[^;}]*;?")
+
+FAILURE_RETRY_SECONDS = 24 * 60 * 60
+
+# mimetypes 기본 표에 없거나 플랫폼마다 다른 폰트 형식
+_DATA_MIME = {
+    ".woff2": "font/woff2",
+    ".woff": "font/woff",
+    ".ttf": "font/ttf",
+    ".otf": "font/otf",
+    ".eot": "application/vnd.ms-fontobject",
+    ".svg": "image/svg+xml",
+}
+
+
+@dataclass
+class MapAssets:
+    """여러 지도에서 모은 공유 자산(입력 순서 유지, 중복 제거)."""
+
+    scripts: list[str] = field(default_factory=list)
+    stylesheets: list[str] = field(default_factory=list)
+    inline_blocks: list[tuple[str, str]] = field(default_factory=list)  # (tag, content)
+
+    def add(self, other: "MapAssets") -> None:
+        for src in other.scripts:
+            if src not in self.scripts:
+                self.scripts.append(src)
+        for href in other.stylesheets:
+            if href not in self.stylesheets:
+                self.stylesheets.append(href)
+        for block in other.inline_blocks:
+            if block not in self.inline_blocks:
+                self.inline_blocks.append(block)
+
+
+def _excluded(url: str) -> bool:
+    return any(re.search(p, url) for p in EXCLUDED_ASSET_PATTERNS)
+
+
+def _read_head(path: Path) -> str:
+    lines: list[str] = []
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            lines.append(line)
+            if "</head>" in line:
+                break
+    return "".join(lines)
+
+
+def read_map_assets(path: Path) -> MapAssets:
+    """folium 문서의 <head>만 읽어 외부 자산/인라인 블록을 추출합니다."""
+    head = _read_head(path)
+    assets = MapAssets()
+    for src in _SCRIPT_SRC.findall(head):
+        if not _excluded(src) and src not in assets.scripts:
+            assets.scripts.append(src)
+    for href in _LINK_HREF.findall(head):
+        if not _excluded(href) and href not in assets.stylesheets:
+            assets.stylesheets.append(href)
+    for tag, content in _INLINE_BLOCK.findall(head):
+        if tag == "style" and _PAGE_GLOBAL_STYLE.match(content):
+            continue
+        block = (tag, "\n".join(line.strip() for line in content.strip().splitlines()))
+        if block not in assets.inline_blocks:
+            assets.inline_blocks.append(block)
+    return assets
+
+
+def _prefer_woff2(css: str) -> str:
+    """`@font-face`마다 마지막 `src`만 남기고, 그중 woff2(없으면 woff) 소스만 남깁니다(인라인 크기 절감)."""
+
+    def face(m: re.Match) -> str:
+        block = m.group(0)
+        decls = _FONT_SRC.findall(block)
+        if not decls:
+            return block
+        last = decls[-1]
+        items = last.split(":", 1)[1].rstrip(";").split(",")
+        for pattern in (r"\.woff2\b", r"\.woff(?!2)\b"):
+            kept = [item for item in items if re.search(pattern, item)]
+            if kept:
+                last = "src:" + ",".join(kept) + ";"
+                break
+        for decl in decls[:-1]:
+            block = block.replace(decl, "", 1)
+        return block.replace(decls[-1], last, 1)
+
+    return _FONT_FACE.sub(face, css)
+
+
+class AssetFetcher:
+    """지도 공유 자산을 내려받아 `cache` 폴더에 보관합니다(CSS는 참조 리소스까지 `data:` URI로 인라인)."""
+
+    def __init__(self, cache: Path, cfg: dict | None = None, timeout: float = 20.0) -> None:
+        self.cache = Path(cache)
+        self.cfg = cfg
+        self.timeout = float(timeout)
+        self.replay = resolve_mode(cfg) == "replay"
+        self.read_cache = not is_recording(cfg)
+        self._session: requests.Session | None = None
+
+    def _get(self, url: str) -> requests.Response | None:
+        if self._session is None:
+            self._session = create_session(self.cfg)
+        try:
+            r = self._session.get(urldefrag(url)[0], timeout=self.timeout)
+            r.raise_for_status()
+        except Exception:
+            return None
+        return r
+
+    def _failed_recently(self, marker: Path) -> bool:
+        try:
+            return time.time() - marker.stat().st_mtime < FAILURE_RETRY_SECONDS
+        except OSError:
+            return False
+
+    def _mark_failed(self, marker: Path) -> None:
+        if not self.replay:
+            marker.touch()
+
+    def _data_uri(self, url: str, fetched: dict[str, str | None]) -> str | None:
+        key = urldefrag(url)[0]
+        if key not in fetched:
+            r = self._get(key)
+            if r is None:
+                fetched[key] = None
+            else:
+                suffix = PurePosixPath(urlsplit(key).path).suffix.lower()
+                mime = _DATA_MIME.get(suffix) or mimetypes.guess_type(urlsplit(key).path)[0]
+                mime = mime or r.headers.get("Content-Type", "application/octet-stream").split(";")[0]
+                fetched[key] = f"data:{mime};base64,{base64.b64encode(r.content).decode('ascii')}"
+        return fetched[key]
+
+    def _inline_css(self, url: str, text: str) -> tuple[str, bool]:
+        """CSS의 url(...) 참조를 `data:` URI로 바꿉니다. 실패한 참조는 절대 URL로 남기고 complete=False."""
+        fetched: dict[str, str | None] = {}
+        complete = True
+
+        def replace(m: re.Match) -> str:
+            nonlocal complete
+            absolute = urljoin(url, m.group(2).strip())
+            data = self._data_uri(absolute, fetched)
+            if data is None:
+                complete = False
+                return f"url('{absolute}')"
+            return f"url('{data}')"
+
+        return _CSS_URL.sub(replace, _prefer_woff2(text)), complete
+
+    def text(self, url: str) -> str | None:
+        """자산 내용(인라인용)을 반환합니다. 받지 못하면 None이고 호출부는 URL 참조로 남깁니다."""
+        suffix = ".css" if urlsplit(url).path.endswith(".css") else ".js"
+        path = self.cache / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}{suffix}"
+        marker = path.with_name(path.name + ".failed")
+        if self.read_cache and path.exists():
+            return path.read_text(encoding="utf-8", errors="ignore")
+        if self._failed_recently(marker):
+            return None
+
+        r = self._get(url)
+        if r is None:
+            self._mark_failed(marker)
+            return None
+        text = r.text
+        complete = True
+        if suffix == ".css":
+            text, complete = self._inline_css(url, text)
+        if complete:
+            path.write_text(text, encoding="utf-8")
+            marker.unlink(missing_ok=True)
+        else:
+            self._mark_failed(marker)  # 일부 리소스가 빠진 CSS는 저장하지 않고 나중에 다시 받습니다.
+        return text
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+
+def _safe_inline(tag: str, content: str) -> str:
+    return content.replace(f"</{tag}", f"<\\/{tag}")
+
+
+def write_shared_assets(
+    out: TextIO, assets: MapAssets, inline_cache: Path | None = None, cfg: dict | None = None
+) -> None:
+    """공유 자산을 대시보드 <head>에 씁니다. `inline_cache`가 있으면 내용을 인라인합니다."""
+    fetcher = AssetFetcher(inline_cache, cfg) if inline_cache else None
+    try:
+        for href in assets.stylesheets:
+            text = fetcher.text(href) if fetcher else None
+            if text is None:
+                out.write(f'<link rel="stylesheet" href="{href}"/>\n')
+            else:
+                out.write(f"<style>/* {href} */\n{_safe_inline('style', text)}\n</style>\n")
+        for src in assets.scripts:
+            text = fetcher.text(src) if fetcher else None
+            if text is None:
+                out.write(f'<script src="{src}"></script>\n')
+            else:
+                out.write(f"<script>/* {src} */\n{_safe_inline('script', text)}\n</script>\n")
+    finally:
+        if fetcher is not None:
+            fetcher.close()
+    for tag, content in assets.inline_blocks:
+        out.write(f"<{tag}>\n{content}\n</{tag}>\n")
+
+
+def write_map_body(out: TextIO, path: Path) -> None:
+    """folium 문서에서 지도 컨테이너 <div>와 지도별 스크립트만 씁니다(지도 한 개만 메모리에 올림)."""
+    text = path.read_text(encoding="utf-8", errors="ignore")
+    body_start = text.find("<body>")
+    body_end = text.find("</body>", body_start)
+    if body_start < 0 or body_end < 0:
+        raise ValueError(f"folium 문서 구조를 해석할 수 없습니다: {path.name}")
+    out.write(text[body_start + len("<body>") : body_end].strip())
+
+    tail = text[body_end + len("</body>") :]
+    for match in _INLINE_BLOCK.finditer(tail):
+        if match.group(1) == "script":
+            out.write(f"<script>{match.group(2)}</script>")
@@ -0,0 +1,136 @@
+"""좌표 배열을 한 번에 Folium 레이어로 만드는 벌크 빌더.
+
+행마다 `folium.Marker`/`folium.CircleMarker`를 만들면 점 하나당 JS 객체 선언이 HTML에 생기고,
+Python 빌드 시간과 브라우저 로드 시간이 모두 점 개수에 비례해 큰 상수로 늘어납니다.
+여기서는 점 전체를 데이터(JSON 배열)로 한 번만 직렬화합니다.
+
+- `add_circle_layer`: 단일 GeoJSON FeatureCollection + CircleMarker 스타일(컬럼 기반 색상/툴팁)
+- `add_fast_cluster_layer`: FastMarkerCluster + 공용 JS 콜백(컬럼 기반 색상/아이콘/팝업/툴팁)
+
+팝업/툴팁 문자열은 Leaflet이 HTML로 넣으므로 데이터에 넣기 전에 `html.escape`로 이스케이프합니다.
+"""
+
+from __future__ import annotations
+
+import html
+from typing import Sequence
+
+import folium
+import numpy as np
+from folium.plugins import FastMarkerCluster
+
+
+def _as_list(values: Sequence | np.ndarray | str, n: int) -> list:
+    if isinstance(values, str):
+        return [values] * n
+    values = list(values)
+    if len(values) != n:
+        raise ValueError(f"컬럼 길이({len(values)})가 좌표 개수({n})와 다릅니다.")
+    return values
+
+
+def _escaped(values: Sequence | np.ndarray | str, n: int) -> list[str]:
+    """팝업/툴팁용 텍스트 컬럼(주소/역명 등에 `<`, `&`가 있어도 마크업으로 해석되지 않게)."""
+    return [html.escape(str(v)) for v in _as_list(values, n)]
+
+
+def _coords(lat: Sequence[float] | np.ndarray, lng: Sequence[float] | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    lat = np.asarray(lat, dtype=float)
+    lng = np.asarray(lng, dtype=float)
+    if lat.shape != lng.shape or lat.ndim != 1:
+        raise ValueError("lat/lng는 길이가 같은 1차원 배열이어야 합니다.")
+    return lat, lng
+
+
+def points_to_geojson(
+    lat: Sequence[float] | np.ndarray,
+    lng: Sequence[float] | np.ndarray,
+    properties: dict[str, Sequence] | None = None,
+) -> dict:
+    """좌표 배열 + 속성 컬럼을 Point FeatureCollection(dict)으로 변환합니다."""
+    lat, lng = _coords(lat, lng)
+    n = len(lat)
+    columns = {k: _as_list(v, n) for k, v in (properties or {}).items()}
+    lng_list = np.round(lng, 6).tolist()
+    lat_list = np.round(lat, 6).tolist()
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "id": i,
+                "geometry": {"type": "Point", "coordinates": [lng_list[i], lat_list[i]]},
+                "properties": {k: v[i] for k, v in columns.items()},
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def add_circle_layer(
+    target: folium.Map | folium.FeatureGroup,
+    lat: Sequence[float] | np.ndarray,
+    lng: Sequence[float] | np.ndarray,
+    color: Sequence[str] | str = "blue",
+    tooltip: Sequence[str] | None = None,
+    name: str | None = None,
+    radius: float = 4,
+    fill_opacity: float = 0.9,
+) -> folium.GeoJson:
+    """모든 점을 하나의 GeoJSON 레이어(CircleMarker)로 추가합니다. `color`는 단일 값 또는 점별 컬럼입니다."""
+    properties: dict[str, Sequence] = {"color": color}
+    if tooltip is not None:
+        properties["tooltip"] = _escaped(tooltip, len(np.asarray(lat)))
+    data = points_to_geojson(lat, lng, properties)
+    if not data["features"]:
+        tooltip = None  # GeoJsonTooltip은 빈 레이어에서 필드 검증에 실패합니다.
+
+    layer = folium.GeoJson(
+        data,
+        name=name,
+        marker=folium.CircleMarker(radius=radius, fill=True, fill_opacity=fill_opacity),
+        style_function=lambda f: {"color": f["properties"]["color"], "fillColor": f["properties"]["color"]},
+        tooltip=folium.GeoJsonTooltip(fields=["tooltip"], labels=False) if tooltip is not None else None,
+    )
+    layer.add_to(target)
+    return layer
+
+
+_FAST_MARKER_CALLBACK = """
+function (row) {
+    var icon = L.AwesomeMarkers.icon({markerColor: row[2], icon: row[3], prefix: 'glyphicon'});
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    if (row[4]) { marker.bindPopup(row[4]); }
+    if (row[5]) { marker.bindTooltip(row[5]); }
+    return marker;
+}
+"""
+
+
+def add_fast_cluster_layer(
+    target: folium.Map | folium.FeatureGroup,
+    lat: Sequence[float] | np.ndarray,
+    lng: Sequence[float] | np.ndarray,
+    color: Sequence[str] | str = "blue",
+    icon: Sequence[str] | str = "info-sign",
+    popup: Sequence[str] | str = "",
+    tooltip: Sequence[str] | str = "",
+    name: str | None = None,
+) -> FastMarkerCluster:
+    """모든 점을 하나의 FastMarkerCluster로 추가합니다. 색상/아이콘/팝업/툴팁은 단일 값 또는 점별 컬럼입니다."""
+    lat, lng = _coords(lat, lng)
+    n = len(lat)
+    rows = [
+        list(r)
+        for r in zip(
+            np.round(lat, 6).tolist(),
+            np.round(lng, 6).tolist(),
+            _as_list(color, n),
+            _as_list(icon, n),
+            _escaped(popup, n),
+            _escaped(tooltip, n),
+        )
+    ]
+    layer = FastMarkerCluster(rows, callback=_FAST_MARKER_CALLBACK, name=name)
+    layer.add_to(target)
+    return layer
@@ -0,0 +1,158 @@
+"""영화 지표 데이터 큐브(연도 × 분류)와 파생 지표.
+
+`data_movie_indicators_by_year.csv`를 한 번 읽어 타입을 고정하고(연도 int, `분류` categorical, 수치 float64),
+차트/대시보드가 쓰는 파생 지표를 미리 계산해 둡니다. 각 소비자는 CSV를 다시 해석하지 않고 큐브 컬럼만 읽습니다.
+
+큐브 컬럼(행은 분류, 연도 순 정렬):
+- year, category
+- releases(개봉편수), screenings(상영편수), audience(관객수, 명), sales(매출액, 원)
+- audience_10k(관객수/1만), sales_100m(매출액/1억)
+- <지표>_yoy: 같은 분류의 전년 대비 증감률(직전 연도가 없으면 NaN)
+- <지표>_share: 같은 연도 전체 대비 비중(한국/외국영화 점유율)
+- revenue_per_viewer(관객 1명당 매출, 원), revenue_per_release(개봉 1편당 매출, 원), audience_per_release
+
+원본 CSV는 관객수/매출을 원 단위와 만/억 단위로 함께 갖고 있을 수 있습니다. 원 단위 컬럼이 있으면 그것을 쓰고,
+없으면 환산 단위 컬럼에 배수를 곱해 채우므로 만/억 단위 값은 항상 원 단위에서 다시 계산됩니다.
+
+큐브는 `.cache/indicators/`에 Parquet(pyarrow가 없으면 pickle)로 저장되며, 원본 CSV 내용 해시와
+`CUBE_VERSION`이 같으면 파싱/계산 없이 읽습니다. 같은 프로세스 안에서는 메모리에서 재사용합니다.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cache_utils import atomic_write_path, cache_dir
+from ingest import has_pyarrow, source_digest
+
+
+CUBE_VERSION = 1
+
+YEAR_COL = "Year of 연도"
+CAT_COL = "분류"
+CATEGORIES = ("한국영화", "외국영화")
+
+# 큐브 지표 → (원 단위 후보 컬럼, [(환산 단위 후보 컬럼, 배수)])
+MEASURES: dict[str, tuple[tuple[str, ...], list[tuple[str, float]]]] = {
+    "releases": (("개봉편수",), []),
+    "screenings": (("상영편수",), []),
+    "audience": (("관객수",), [("관객수(만)", 1e4)]),
+    "sales": (("매출액",), [("매출액(억원)", 1e8), ("매출액(억)", 1e8)]),
+}
+SCALED = {"audience_10k": ("audience", 1e4), "sales_100m": ("sales", 1e8)}
+GROWTH_MEASURES = ("releases", "audience", "sales")
+SHARE_MEASURES = ("releases", "audience", "sales")
+RATIOS = {
+    "revenue_per_viewer": ("sales", "audience"),
+    "revenue_per_release": ("sales", "releases"),
+    "audience_per_release": ("audience", "releases"),
+}
+
+_loaded: dict[str, pd.DataFrame] = {}
+
+
+def _safe_div(num: pd.Series, den: pd.Series) -> pd.Series:
+    return num / den.where(den != 0)
+
+
+def _measure_column(raw: pd.DataFrame, measure: str) -> pd.Series | None:
+    direct, scaled = MEASURES[measure]
+    for col in direct:
+        if col in raw.columns:
+            return pd.to_numeric(raw[col], errors="coerce").astype("float64")
+    for col, factor in scaled:
+        if col in raw.columns:
+            return pd.to_numeric(raw[col], errors="coerce").astype("float64") * factor
+    return None
+
+
+def build_cube(raw: pd.DataFrame) -> pd.DataFrame:
+    """원본 지표 표(연도, 분류, 수치 컬럼)로 큐브를 만듭니다."""
+    raw = raw.rename(columns=lambda c: str(c).strip())
+    missing = [c for c in (YEAR_COL, CAT_COL) if c not in raw.columns]
+    if missing:
+        raise KeyError(f"영화 지표 CSV에 컬럼이 없습니다: {', '.join(missing)}")
+    raw = raw.dropna(subset=[YEAR_COL, CAT_COL])
+
+    labels = raw[CAT_COL].astype(str).str.strip()
+    extra = [c for c in dict.fromkeys(labels) if c not in CATEGORIES]
+    cube = pd.DataFrame(
+        {
+            "year": raw[YEAR_COL].astype("int64").to_numpy(),
+            "category": pd.Categorical(labels, categories=[*CATEGORIES, *extra]),
+        }
+    )
+    for measure in MEASURES:
+        values = _measure_column(raw, measure)
+        if values is not None:
+            cube[measure] = values.to_numpy()
+    measures = [m for m in MEASURES if m in cube.columns]
+    if cube.duplicated(["category", "year"]).any():
+        cube = cube.groupby(["category", "year"], observed=True, as_index=False)[measures].sum()
+    cube = cube.sort_values(["category", "year"], kind="stable").reset_index(drop=True)
+
+    for col, (measure, factor) in SCALED.items():
+        if measure in cube.columns:
+            cube[col] = cube[measure] / factor
+
+    by_cat = cube.groupby("category", observed=True, sort=False)
+    consecutive = (cube["year"] - by_cat["year"].shift(1)) == 1
+    for measure in GROWTH_MEASURES:
+        if measure in cube.columns:
+            prev = by_cat[measure].shift(1).where(consecutive)
+            cube[f"{measure}_yoy"] = _safe_div(cube[measure] - prev, prev)
+
+    by_year = cube.groupby("year", sort=False)
+    for measure in SHARE_MEASURES:
+        if measure in cube.columns:
+            cube[f"{measure}_share"] = _safe_div(cube[measure], by_year[measure].transform("sum"))
+
+    for col, (num, den) in RATIOS.items():
+        if num in cube.columns and den in cube.columns:
+            cube[col] = _safe_div(cube[num], cube[den])
+    return cube
+
+
+def load_cube(csv_path: Path, cfg: dict | None = None) -> pd.DataFrame:
+    """CSV의 큐브를 캐시에서 읽습니다. 캐시가 없거나 CSV가 바뀌었으면 만들어 저장합니다."""
+    csv_path = Path(csv_path)
+    directory = cache_dir(cfg or {}, "indicators")
+    digest = source_digest(csv_path, directory)
+    key = f"{csv_path.stem}.{digest[:16]}.v{CUBE_VERSION}"
+    if key in _loaded:
+        return _loaded[key]
+
+    use_parquet = has_pyarrow()
+    cached = directory / f"{key}{'.parquet' if use_parquet else '.pkl'}"
+    if cached.exists():
+        cube = pd.read_parquet(cached) if use_parquet else pd.read_pickle(cached)
+    else:
+        cube = build_cube(pd.read_csv(csv_path, encoding="utf-8-sig"))
+        for old in directory.glob(f"{csv_path.stem}.*"):
+            if not old.name.startswith(key):
+                old.unlink(missing_ok=True)
+        with atomic_write_path(cached) as tmp:
+            if use_parquet:
+                cube.to_parquet(tmp, index=False)
+            else:
+                cube.to_pickle(tmp)
+    _loaded[key] = cube
+    return cube
+
+
+def category_series(cube: pd.DataFrame, columns: list[str]) -> dict[str, dict[str, np.ndarray]]:
+    """분류별 연도 배열과 지표 배열(큐브가 이미 분류, 연도 순으로 정렬돼 있어 재정렬하지 않음)."""
+    out: dict[str, dict[str, np.ndarray]] = {}
+    for cat, g in cube.groupby("category", observed=True, sort=True):
+        out[str(cat)] = {"year": g["year"].to_numpy(), **{c: g[c].to_numpy() for c in columns}}
+    return out
+
+
+def latest_summary(cube: pd.DataFrame) -> pd.DataFrame:
+    """가장 최근 연도의 분류별 행(대시보드 요약 표용)."""
+    if cube.empty:
+        return cube
+    return cube[cube["year"] == cube["year"].max()].reset_index(drop=True)
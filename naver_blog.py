@@ -0,0 +1,226 @@
+"""네이버 블로그 검색 API 페이지 수집기(동시 요청 + 레이트 리밋 + 원본 응답 캐시).
+
+- 검색 API는 `display` 최대 100건, `start` 최대 1000이므로 한 검색어로 최대 1000건까지 페이지를 넘기며 받습니다.
+  첫 페이지로 `total`을 확인한 뒤 나머지 페이지를 스레드 풀로 동시에 요청합니다.
+- 세션은 `http_transport.create_session()`(keep-alive 커넥션 풀, 녹화/재생 모드 적용)이고,
+  호출 속도는 `geocoding.TokenBucket`으로 제한합니다.
+- 원본 응답 JSON은 `.cache/naver_blog/<수집일>/<검색어 키>-<start>.json`에 저장합니다.
+  같은 날 다시 실행하면 저장된 페이지는 호출하지 않고, 받지 못한 페이지만 새로 요청합니다.
+  `naver_api.cache_days`보다 오래된 날짜 폴더는 정리합니다. record 모드에서는 캐시를 읽지 않고 모든 페이지를 호출합니다.
+- 항목은 `link` 기준으로 중복을 제거하고 페이지 순서를 유지합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import requests
+
+from cache_utils import cache_dir
+from geocoding import TokenBucket
+from http_transport import create_session, is_recording
+
+
+BLOG_SEARCH_URL_DEFAULT = "https://openapi.naver.com/v1/search/blog.json"
+MAX_DISPLAY = 100
+MAX_START = 1000
+
+
+@dataclass
+class BlogPage:
+    start: int
+    data: dict | None
+    source: str  # cache | api | error
+    error: str = ""
+
+
+@dataclass
+class CrawlStats:
+    query: str
+    total: int = 0
+    pages: int = 0
+    cache_hits: int = 0
+    api_calls: int = 0
+    errors: int = 0
+    items: int = 0
+    unique_items: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"[naver] {self.query}: total={self.total} pages={self.pages} cache={self.cache_hits} "
+            f"api={self.api_calls} errors={self.errors} items={self.items} unique={self.unique_items} "
+            f"{self.seconds:.2f}s"
+        )
+
+
+def page_starts(first_start: int, display: int, total: int, max_items: int) -> list[int]:
+    """수집할 페이지의 start 목록(API 상한 start<=1000 적용)."""
+    last = min(total, first_start - 1 + max_items)
+    return list(range(first_start, min(last, MAX_START) + 1, display))
+
+
+def dedupe_items(items: list[dict]) -> list[dict]:
+    """`link`가 같은 항목은 처음 것만 남깁니다(link가 없으면 제목+요약으로 비교)."""
+    seen: set[str] = set()
+    out = []
+    for item in items:
+        key = item.get("link") or f"{item.get('title', '')}\x00{item.get('description', '')}"
+        if key not in seen:
+            seen.add(key)
+            out.append(item)
+    return out
+
+
+class BlogPageCache:
+    """(수집일, URL, 검색어, 정렬, display, start) → 원본 응답 JSON 파일 캐시."""
+
+    def __init__(self, root: Path, retention_days: int = 7, today: date | None = None) -> None:
+        self.root = Path(root)
+        self.retention_days = max(1, int(retention_days))
+        self.day = (today or date.today()).strftime("%Y%m%d")
+
+    @staticmethod
+    def query_key(url: str, query: str, sort: str, display: int) -> str:
+        return hashlib.sha1(f"{url}\x00{query}\x00{sort}\x00{display}".encode("utf-8")).hexdigest()[:16]
+
+    def path(self, key: str, start: int) -> Path:
+        return self.root / self.day / f"{key}-{start}.json"
+
+    def load(self, key: str, start: int) -> dict | None:
+        try:
+            with open(self.path(key, start), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, start: int, data: dict) -> None:
+        path = self.path(key, start)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def prune(self) -> int:
+        cutoff = (datetime.strptime(self.day, "%Y%m%d") - timedelta(days=self.retention_days - 1)).strftime("%Y%m%d")
+        removed = 0
+        if self.root.exists():
+            for d in self.root.iterdir():
+                if d.is_dir() and d.name.isdigit() and d.name < cutoff:
+                    shutil.rmtree(d, ignore_errors=True)
+                    removed += 1
+        return removed
+
+
+class BlogCollector:
+    """검색어 하나의 블로그 검색 결과를 여러 페이지에 걸쳐 수집합니다."""
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        url: str = BLOG_SEARCH_URL_DEFAULT,
+        cache: BlogPageCache | None = None,
+        max_workers: int = 4,
+        rate_per_sec: float = 10.0,
+        burst: int = 10,
+        timeout: float = 30.0,
+        session: requests.Session | None = None,
+        read_cache: bool = True,
+    ) -> None:
+        self.url = url
+        self.cache = cache
+        self.read_cache = read_cache
+        self.max_workers = max(1, int(max_workers))
+        self.timeout = float(timeout)
+        self.bucket = TokenBucket(rate_per_sec, burst)
+        self.headers = {"X-Naver-Client-Id": client_id, "X-Naver-Client-Secret": client_secret}
+        self.session = session if session is not None else create_session(pool_maxsize=self.max_workers)
+
+    @classmethod
+    def from_config(cls, cfg: dict, client_id: str, client_secret: str) -> "BlogCollector":
+        naver = cfg.get("naver_api", {})
+        return cls(
+            client_id,
+            client_secret,
+            url=naver.get("blog_search_url", BLOG_SEARCH_URL_DEFAULT),
+            cache=BlogPageCache(cache_dir(cfg, "naver_blog"), naver.get("cache_days", 7)),
+            max_workers=naver.get("max_workers", 4),
+            rate_per_sec=naver.get("rate_limit_per_sec", 10.0),
+            burst=naver.get("burst", 10),
+            timeout=naver.get("timeout_seconds", 30.0),
+            session=create_session(cfg, pool_maxsize=naver.get("max_workers", 4)),
+            read_cache=not is_recording(cfg),
+        )
+
+    def fetch_page(self, query: str, sort: str, display: int, start: int) -> BlogPage:
+        key = BlogPageCache.query_key(self.url, query, sort, display)
+        if self.cache is not None and self.read_cache:
+            data = self.cache.load(key, start)
+            if data is not None:
+                return BlogPage(start, data, "cache")
+
+        self.bucket.acquire()
+        params = {"query": query, "display": display, "start": start, "sort": sort}
+        try:
+            r = self.session.get(self.url, headers=self.headers, params=params, timeout=self.timeout)
+            r.raise_for_status()
+            data = r.json()
+        except Exception as e:
+            return BlogPage(start, None, "error", f"{type(e).__name__}: {e}")
+
+        if self.cache is not None:
+            self.cache.store(key, start, data)
+        return BlogPage(start, data, "api")
+
+    def collect(
+        self, query: str, max_items: int = MAX_START, display: int = MAX_DISPLAY, sort: str = "sim", start: int = 1
+    ) -> tuple[list[dict], CrawlStats]:
+        """최대 `max_items`건을 수집해 (link 기준 중복 제거된 항목, 통계)를 반환합니다.
+
+        첫 페이지 요청이 실패하면 예외를 올리고, 이후 페이지 실패는 건너뛰고 통계에만 남깁니다.
+        """
+        started = time.perf_counter()
+        display = max(1, min(MAX_DISPLAY, int(display)))
+        start = max(1, min(MAX_START, int(start)))
+        stats = CrawlStats(query)
+        if self.cache is not None:
+            self.cache.prune()
+
+        first = self.fetch_page(query, sort, display, start)
+        if first.data is None:
+            raise RuntimeError(f"네이버 블로그 검색 첫 페이지 요청 실패: {first.error}")
+        stats.total = int(first.data.get("total", 0))
+
+        rest = page_starts(start, display, stats.total, int(max_items))[1:]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pages = [first] + list(pool.map(lambda s: self.fetch_page(query, sort, display, s), rest))
+
+        items: list[dict] = []
+        for page in pages:
+            stats.pages += 1
+            stats.cache_hits += page.source == "cache"
+            stats.api_calls += page.source == "api"
+            if page.data is None:
+                stats.errors += 1
+                print(f"[WARN] 네이버 블로그 검색 start={page.start} 요청 실패: {page.error}")
+                continue
+            items.extend(page.data.get("items", []))
+
+        unique = dedupe_items(items)
+        stats.items = len(items)
+        stats.unique_items = len(unique)
+        stats.seconds = time.perf_counter() - started
+        return unique, stats
+
+    def close(self) -> None:
+        self.session.close()
@@ -1,19 +1,46 @@
 from __future__ import annotations
 
+import argparse
+import ast
 import base64
 import csv
+import hashlib
 import html
+import importlib
+import json
 import mimetypes
+import multiprocessing
 import os
+import re
+import shutil
 import traceback
-from dataclasses import dataclass
-from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from pathlib import Path
-from typing import Callable, List
+from typing import Callable, List, TextIO
 
 import yaml
 from dotenv import load_dotenv
 
+from cache_utils import cache_dir, file_sha256
+from http_transport import (
+    MODE_ENV,
+    MODES,
+    begin_recording,
+    cassette_dir,
+    commit_recording,
+    discard_recording,
+    flush_cassettes,
+    is_recording,
+    resolve_mode,
+)
+from chart_embed import write_chart_data, write_renderer
+from image_tiers import ImageTierConfig, ImageTiers, base64_size, encode_tiers
+from korean_font import resolve_korean_font_path
+from map_embed import MapAssets, read_map_assets, write_map_body, write_shared_assets
+from step_metrics import measure
+
 
 ROOT = Path(__file__).resolve().parent
 CONFIG_PATH = ROOT / "config.yaml"
@@ -23,9 +50,10 @@ load_dotenv(ROOT / ".env")
 @dataclass
 class StepResult:
     name: str
-    status: str  # success | failed | skipped
+    status: str  # success | cached | failed | skipped
     message: str
     artifacts: List[Path]
+    metrics: dict = field(default_factory=dict)  # step_metrics.StepMetrics.to_dict()
 
 
 def load_config() -> dict:
@@ -47,18 +75,62 @@ def _configured_path(out_dir: Path, cfg: dict, key: str, default_name: str) -> P
     return p if p.is_absolute() else out_dir / p
 
 
+def _brand_keyword_paths(out_dir: Path, cfg: dict) -> list[tuple[str, Path, Path]]:
+    """검색어가 2개 이상일 때 text_analysis가 만드는 브랜드별 (검색어, CSV, 워드클라우드) 경로."""
+    from brand_keywords import brand_output_path, configured_queries
+
+    queries = configured_queries(cfg)
+    if len(queries) < 2:
+        return []
+    csv_path = _configured_path(out_dir, cfg, "text_keywords_csv", "naver_keywords.csv")
+    img_path = _configured_path(out_dir, cfg, "text_wordcloud", "naver_wordcloud.png")
+    return [(q, brand_output_path(csv_path, q), brand_output_path(img_path, q)) for q in queries]
+
+
+def _movie_chart_paths(out_dir: Path, cfg: dict) -> list[tuple[str, Path]]:
+    """Visualization이 `visualization.layout`/`backend`에 따라 만드는 (카드 제목, 경로) 목록."""
+    from chart_render import chart_output_path
+
+    vis_cfg = cfg.get("visualization", {})
+    layout = vis_cfg.get("layout", "separate")
+    backend = vis_cfg.get("backend", "png")
+    charts = []
+    if layout in ("separate", "both"):
+        charts += [
+            ("연도별 개봉편수", _configured_path(out_dir, cfg, "movie_releases_plot", "movie_releases_by_year.png")),
+            ("연도별 관객수", _configured_path(out_dir, cfg, "movie_audience_plot", "movie_audience_by_year.png")),
+            ("연도별 매출", _configured_path(out_dir, cfg, "movie_sales_plot", "movie_sales_by_year.png")),
+        ]
+    if layout in ("small_multiples", "both"):
+        charts.append(
+            (
+                "영화 지표 한눈에 보기",
+                _configured_path(
+                    out_dir, cfg, "movie_small_multiples_plot", "movie_indicators_small_multiples.png"
+                ),
+            )
+        )
+    return [(title, chart_output_path(path, backend)) for title, path in charts]
+
+
 def _known_artifact_paths(out_dir: Path, cfg: dict) -> list[Path]:
-    return [
+    brand_paths = [p for _, csv_path, img_path in _brand_keyword_paths(out_dir, cfg) for p in (csv_path, img_path)]
+    # 차트 백엔드를 바꾼 뒤에도 이전 백엔드의 산출물(.png/.json)이 남지 않도록 둘 다 정리합니다.
+    movie_charts = [
+        path.with_suffix(suffix)
+        for _, path in _movie_chart_paths(out_dir, {**cfg, "visualization": {"layout": "both"}})
+        for suffix in (".png", ".json")
+    ]
+    return brand_paths + movie_charts + [
         _configured_path(out_dir, cfg, "map_theaters_and_stations", "map_theaters_stations.html"),
         _configured_path(out_dir, cfg, "map_spot", "map_spot_theaters_malls.html"),
-        _configured_path(out_dir, cfg, "movie_releases_plot", "movie_releases_by_year.png"),
-        _configured_path(out_dir, cfg, "movie_audience_plot", "movie_audience_by_year.png"),
-        _configured_path(out_dir, cfg, "movie_sales_plot", "movie_sales_by_year.png"),
+        _configured_path(out_dir, cfg, "theater_station_accessibility_csv", "theater_station_accessibility.csv"),
         _configured_path(out_dir, cfg, "plot_3d_trendlines", "theater_3d_trendlines.png"),
         _configured_path(out_dir, cfg, "consumption_share_correlation", "consumption_share_correlation.png"),
         _configured_path(out_dir, cfg, "text_keywords_csv", "naver_keywords.csv"),
         _configured_path(out_dir, cfg, "text_wordcloud", "naver_wordcloud.png"),
         _configured_path(out_dir, cfg, "report_md", "report.md"),
+        _configured_path(out_dir, cfg, "run_metrics_json", "run_metrics.json"),
         out_dir / "dashboard.html",
     ]
 
@@ -114,10 +186,301 @@ def _step_skipped(name: str, reason: str) -> StepResult:
     return StepResult(name=name, status="skipped", message=reason, artifacts=[])
 
 
+@dataclass
+class StepSpec:
+    name: str
+    module: str  # main()을 가진 단계 모듈
+    config_flag: str  # config.pipeline.<flag>가 false면 스킵
+    inputs: List[Path]
+    outputs: List[Path]
+    config_keys: List[str] = field(default_factory=list)  # 캐시 키에 포함할 config 하위 트리(dotted)
+    uses_http: bool = False  # Kakao/Naver API를 호출하는 단계(산출물 캐시는 api_artifact_ttl_days 동안만 유효)
+
+
+def _step_specs(out_dir: Path, cfg: dict) -> list[StepSpec]:
+    paths = cfg.get("paths", {})
+    theater_xlsx = ROOT / paths.get("theater_xlsx", "data_theaters_domestic.xlsx")
+    station_xlsx = ROOT / paths.get("station_xlsx", "data_stations_domestic.xlsx")
+    movie_csv = ROOT / paths.get("movie_indicators_csv", "data_movie_indicators_by_year.csv")
+
+    return [
+        StepSpec(
+            "지도(극장+역)",
+            "Integrate_stations",
+            "run_maps",
+            [theater_xlsx, station_xlsx],
+            [
+                _configured_path(out_dir, cfg, "map_theaters_and_stations", "map_theaters_stations.html"),
+                _configured_path(out_dir, cfg, "theater_station_accessibility_csv", "theater_station_accessibility.csv"),
+            ],
+            ["kakao_api", "proximity"],
+            uses_http=True,
+        ),
+        StepSpec(
+            "지도(극장+쇼핑몰 예시)",
+            "Spot",
+            "run_maps",
+            [],
+            [_configured_path(out_dir, cfg, "map_spot", "map_spot_theaters_malls.html")],
+            ["kakao_api"],
+            uses_http=True,
+        ),
+        StepSpec(
+            "영화 지표 시각화",
+            "Visualization",
+            "run_movie_visualization",
+            [movie_csv],
+            [path for _, path in _movie_chart_paths(out_dir, cfg)],
+            ["visualization"],
+        ),
+        StepSpec(
+            "3D 분석",
+            "Graph3D",
+            "run_3d_analysis",
+            [theater_xlsx],
+            [_configured_path(out_dir, cfg, "plot_3d_trendlines", "theater_3d_trendlines.png")],
+            ["graph3d"],
+        ),
+        StepSpec(
+            "소비지출-점유율 상관",
+            "Consumtion_Share_Analysis",
+            "run_consumption_share_analysis",
+            [],
+            [_configured_path(out_dir, cfg, "consumption_share_correlation", "consumption_share_correlation.png")],
+        ),
+        StepSpec(
+            "텍스트 키워드 분석",
+            "text_analysis",
+            "run_text_analysis",
+            [],
+            [
+                _configured_path(out_dir, cfg, "text_keywords_csv", "naver_keywords.csv"),
+                _configured_path(out_dir, cfg, "text_wordcloud", "naver_wordcloud.png"),
+                *[p for _, csv_path, img_path in _brand_keyword_paths(out_dir, cfg) for p in (csv_path, img_path)],
+            ],
+            ["naver_api", "text_analysis"],
+            uses_http=True,
+        ),
+    ]
+
+
+def _run_module_step(spec: StepSpec, trace_memory: bool = False) -> StepResult:
+    """단계 모듈을 import해 main()을 실행하고 계측값을 붙입니다. 워커 프로세스에서도 호출됩니다.
+
+    무거운 import(pandas/matplotlib/konlpy 등)도 단계 비용이므로 계측 구간에 포함합니다.
+    """
+    with measure(trace_memory) as metrics:
+        try:
+            module = importlib.import_module(spec.module)
+        except Exception as e:
+            result = StepResult(spec.name, "failed", f"ImportError/InitError: {e}", [])
+        else:
+            result = _run_step(spec.name, module.main, spec.outputs)
+        finally:
+            flush_cassettes()  # 워커 프로세스는 atexit이 돌지 않으므로 단계마다 기록을 씁니다.
+    result.metrics = metrics.to_dict()
+    return result
+
+
+def _local_module_sources(module: str) -> list[Path]:
+    """단계 모듈과, 그 모듈이 (재귀적으로) import하는 저장소 내 모듈의 소스 경로."""
+    seen: dict[str, Path] = {}
+    stack = [module]
+    while stack:
+        name = stack.pop()
+        path = ROOT / f"{name}.py"
+        if name in seen or not path.exists():
+            continue
+        seen[name] = path
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                stack.extend(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                stack.append(node.module.split(".")[0])
+    return [seen[k] for k in sorted(seen)]
+
+
+def _config_subtree(cfg: dict, dotted: str):
+    cur = cfg
+    for part in dotted.split("."):
+        if not isinstance(cur, dict):
+            return None
+        cur = cur.get(part)
+    return cur
+
+
+def _api_artifact_ttl_days(cfg: dict) -> int:
+    """API 단계 산출물을 재사용할 기간(일). 0 이하면 API 단계는 복원하지 않습니다."""
+    return int(cfg.get("cache", {}).get("api_artifact_ttl_days", 1))
+
+
+def _step_cache_key(spec: StepSpec, cfg: dict, today: date | None = None) -> str:
+    """입력 파일 해시 + 관련 config 하위 트리 + 단계 소스 해시로 캐시 키를 만듭니다.
+
+    API를 호출하는 단계(`uses_http`)는 입력 파일이 없어도 외부 데이터가 바뀌므로,
+    `cache.api_artifact_ttl_days`일 단위의 수집 기간도 키에 넣어 기간이 바뀌면 다시 실행합니다.
+    """
+    h = hashlib.sha256()
+    h.update(spec.module.encode("utf-8"))
+    if spec.uses_http:
+        ttl = max(1, _api_artifact_ttl_days(cfg))
+        h.update(f"period:{(today or date.today()).toordinal() // ttl}".encode("ascii"))
+    for p in spec.inputs:
+        h.update(str(p.name).encode("utf-8"))
+        h.update(file_sha256(p).encode("ascii") if p.exists() else b"<missing>")
+    for key in sorted(spec.config_keys):
+        h.update(key.encode("utf-8"))
+        h.update(json.dumps(_config_subtree(cfg, key), sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+    for src in _local_module_sources(spec.module):
+        h.update(src.name.encode("utf-8"))
+        h.update(file_sha256(src).encode("ascii"))
+    return h.hexdigest()
+
+
+def _artifact_cache_root(cfg: dict, spec: StepSpec) -> Path:
+    return cache_dir(cfg, "artifacts") / spec.module
+
+
+def _restore_cached_step(spec: StepSpec, key: str, cfg: dict) -> StepResult | None:
+    entry = _artifact_cache_root(cfg, spec) / key[:32]
+    if not (entry / "meta.json").exists():
+        return None
+    cached = [entry / f"{i}{p.suffix}" for i, p in enumerate(spec.outputs)]
+    if not all(c.exists() for c in cached):
+        return None
+    for src, dst in zip(cached, spec.outputs):
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(src, dst)
+    os.utime(entry)
+    return StepResult(spec.name, "cached", f"캐시 복원 ({key[:12]})", list(spec.outputs))
+
+
+def _store_cached_step(spec: StepSpec, key: str, cfg: dict) -> None:
+    root = _artifact_cache_root(cfg, spec)
+    entry = root / key[:32]
+    tmp = root / f"{key[:32]}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    for i, p in enumerate(spec.outputs):
+        shutil.copyfile(p, tmp / f"{i}{p.suffix}")
+    (tmp / "meta.json").write_text(
+        json.dumps({"step": spec.name, "key": key, "stored_at": datetime.now().isoformat()}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    shutil.rmtree(entry, ignore_errors=True)
+    tmp.rename(entry)
+
+    keep = int(cfg.get("cache", {}).get("artifact_entries_per_step", 3))
+    entries = sorted((d for d in root.iterdir() if d.is_dir() and d != entry), key=lambda d: d.stat().st_mtime)
+    for old in entries[: max(0, len(entries) - (keep - 1))]:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def _step_dependencies(specs: list[StepSpec]) -> dict[str, set[str]]:
+    """다른 단계의 outputs를 inputs로 쓰는 경우 그 단계를 선행 단계로 봅니다."""
+    producers = {p: s.name for s in specs for p in s.outputs}
+    return {
+        s.name: {producers[p] for p in s.inputs if p in producers and producers[p] != s.name} for s in specs
+    }
+
+
+def run_steps(specs: list[StepSpec], cfg: dict) -> list[StepResult]:
+    """선행 단계가 끝난 단계부터 프로세스 풀에서 동시에 실행합니다. 결과는 specs 순서로 반환합니다.
+
+    워커 수는 min(config.pipeline.max_workers, 실행할 단계 수, CPU 수)이고, 1 이하이면 현재 프로세스에서 순차 실행합니다
+    (CPU가 하나면 spawn 워커 기동 비용만 늘어나므로 순차 실행이 더 빠릅니다).
+    config.pipeline.incremental이 true면 캐시 키가 같은 단계는 실행하지 않고 산출물을 복원합니다(status=cached).
+    API를 호출하는 단계(`uses_http`)는 `cache.api_artifact_ttl_days` 기간 안에서만 복원하고(0이면 복원 안 함),
+    HTTP record 모드에서는 복원하지 않고 실행해 호출이 모두 녹화되게 합니다.
+    """
+    pipeline_cfg = cfg.get("pipeline", {})
+    incremental = bool(pipeline_cfg.get("incremental", False))
+    trace_memory = bool(pipeline_cfg.get("trace_memory", False))
+    restore_api_steps = _api_artifact_ttl_days(cfg) > 0 and not is_recording(cfg)
+    deps = _step_dependencies(specs)
+
+    results: dict[str, StepResult] = {}
+    pending: dict[str, StepSpec] = {}
+    cache_keys: dict[str, str] = {}
+    for spec in specs:
+        if pipeline_cfg.get(spec.config_flag, True):
+            pending[spec.name] = spec
+        else:
+            results[spec.name] = _step_skipped(spec.name, f"config.pipeline.{spec.config_flag}=false")
+    max_workers = min(int(pipeline_cfg.get("max_workers", os.cpu_count() or 1)), len(pending), os.cpu_count() or 1)
+
+    def ready() -> list[StepSpec]:
+        """실행 가능한 단계를 반환합니다. 스킵/캐시 복원으로 풀린 후속 단계도 같은 호출에서 처리합니다."""
+        out: list[StepSpec] = []
+        progressed = True
+        while progressed:
+            progressed = False
+            for name, spec in list(pending.items()):
+                if spec in out:
+                    continue
+                blocked = [d for d in deps[name] if d in results and results[d].status not in ("success", "cached")]
+                if blocked:
+                    results[name] = _step_skipped(name, f"선행 단계가 완료되지 않음: {', '.join(sorted(blocked))}")
+                    del pending[name]
+                    progressed = True
+                elif all(d in results for d in deps[name]):
+                    if incremental and (restore_api_steps or not spec.uses_http):
+                        # 선행 단계 산출물이 준비된 뒤에 키를 계산해야 입력 해시가 정확합니다.
+                        cache_keys[name] = _step_cache_key(spec, cfg)
+                        restored = _restore_cached_step(spec, cache_keys[name], cfg)
+                        if restored is not None:
+                            results[name] = restored
+                            del pending[name]
+                            progressed = True
+                            continue
+                    out.append(spec)
+        return out
+
+    def finish(name: str, result: StepResult) -> None:
+        results[name] = result
+        if incremental and result.status == "success" and name in cache_keys:
+            spec = next(s for s in specs if s.name == name)
+            try:
+                _store_cached_step(spec, cache_keys[name], cfg)
+            except OSError as e:
+                print(f"[WARN] 산출물 캐시 저장 실패({name}): {e}")
+
+    if max_workers <= 1:
+        while pending:
+            batch = ready()
+            if not batch:
+                break
+            for spec in batch:
+                del pending[spec.name]
+                finish(spec.name, _run_module_step(spec, trace_memory))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            running: dict[Future, str] = {}
+            while pending or running:
+                for spec in ready():
+                    del pending[spec.name]
+                    running[pool.submit(_run_module_step, spec, trace_memory)] = spec.name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        finish(name, future.result())
+                    except Exception as e:
+                        results[name] = StepResult(name, "failed", f"WorkerError: {type(e).__name__}: {e}", [])
+
+    for name in pending:
+        results[name] = StepResult(name, "failed", "선행 단계 순환 참조로 실행할 수 없습니다.", [])
+    return [results[s.name] for s in specs]
+
+
 def _build_run_summary(results: List[StepResult], started_at: datetime, finished_at: datetime, out_dir: Path) -> dict:
     generated_files: List[str] = []
     skipped_steps: List[str] = []
     failed_steps: List[str] = []
+    cached_steps: List[str] = []
 
     seen: set[str] = set()
     steps: list[dict] = []
@@ -137,6 +500,8 @@ def _build_run_summary(results: List[StepResult], started_at: datetime, finished
             skipped_steps.append(r.name)
         if r.status == "failed":
             failed_steps.append(r.name)
+        if r.status == "cached":
+            cached_steps.append(r.name)
 
         steps.append(
             {
@@ -144,6 +509,7 @@ def _build_run_summary(results: List[StepResult], started_at: datetime, finished
                 "status": r.status,
                 "message": r.message.splitlines()[0],
                 "artifacts": artifact_names,
+                "metrics": r.metrics,
             }
         )
 
@@ -155,13 +521,46 @@ def _build_run_summary(results: List[StepResult], started_at: datetime, finished
         "generated_files": generated_files,
         "skipped_steps": skipped_steps,
         "failed_steps": failed_steps,
+        "cached_steps": cached_steps,
+        "http_requests": sum(r.metrics.get("http_requests", 0) for r in results),
     }
 
 
-def _data_uri(path: Path) -> str:
+def _write_run_metrics(path: Path, run_summary: dict) -> None:
+    """단계별 계측값을 기계 판독용 JSON으로 저장합니다(대시보드와 함께 실행 후에도 남음)."""
+    payload = {
+        "started_at": run_summary.get("started_at"),
+        "finished_at": run_summary.get("finished_at"),
+        "duration_seconds": run_summary.get("duration_seconds"),
+        "http_requests": run_summary.get("http_requests", 0),
+        "http_mode": run_summary.get("http_mode", "live"),
+        "dashboard": run_summary.get("dashboard", {}),
+        "steps": [
+            {
+                "name": s["name"],
+                "status": s["status"],
+                "message": s.get("message", ""),  # 실패 사유(첫 줄)
+                "artifacts": s.get("artifacts", []),
+                **s.get("metrics", {}),
+            }
+            for s in run_summary.get("steps", [])
+        ],
+    }
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+STREAM_CHUNK_BYTES = 3 * 64 * 1024  # base64는 3바이트 단위로 끊어야 청크를 이어 붙여도 유효합니다.
+
+
+def _write_data_uri(out: TextIO, path: Path, chunk_size: int = STREAM_CHUNK_BYTES) -> None:
+    """파일을 디스크에서 청크 단위로 읽어 base64 data URI로 바로 씁니다."""
     mime = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
-    encoded = base64.b64encode(path.read_bytes()).decode("ascii")
-    return f"data:{mime};base64,{encoded}"
+    out.write(f"data:{mime};base64,")
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            out.write(base64.b64encode(chunk).decode("ascii"))
 
 
 def _read_csv_preview(csv_path: Path, max_rows: int = 10) -> tuple[list[str], list[list[str]]]:
@@ -183,9 +582,6 @@ def build_dashboard(outputs_dir: str, config: dict, run_summary: dict) -> str:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     discovered = {
-        "movie_releases": _configured_path(out_dir, config, "movie_releases_plot", "movie_releases_by_year.png"),
-        "movie_audience": _configured_path(out_dir, config, "movie_audience_plot", "movie_audience_by_year.png"),
-        "movie_sales": _configured_path(out_dir, config, "movie_sales_plot", "movie_sales_by_year.png"),
         "trend_3d": _configured_path(out_dir, config, "plot_3d_trendlines", "theater_3d_trendlines.png"),
         "consumption": _configured_path(
             out_dir, config, "consumption_share_correlation", "consumption_share_correlation.png"
@@ -194,9 +590,37 @@ def build_dashboard(outputs_dir: str, config: dict, run_summary: dict) -> str:
         "map_theaters": _configured_path(out_dir, config, "map_theaters_and_stations", "map_theaters_stations.html"),
         "map_spot": _configured_path(out_dir, config, "map_spot", "map_spot_theaters_malls.html"),
         "keywords_csv": _configured_path(out_dir, config, "text_keywords_csv", "naver_keywords.csv"),
+        "accessibility_csv": _configured_path(
+            out_dir, config, "theater_station_accessibility_csv", "theater_station_accessibility.csv"
+        ),
     }
 
-    status_label = {"success": "성공", "failed": "실패", "skipped": "스킵"}
+    status_label = {"success": "성공", "cached": "캐시", "failed": "실패", "skipped": "스킵"}
+
+    # 큰 임베드(이미지 base64, 지도 본문)는 템플릿에 자리표시자만 두고 파일에 쓸 때 스트리밍합니다.
+    embeds: list[Callable[[TextIO], None]] = []
+
+    # 지도들이 공유하는 Leaflet/플러그인 자산은 <head>에 한 번만 씁니다.
+    map_assets = MapAssets()
+    dashboard_cfg = config.get("dashboard", {})
+    map_asset_cache = (
+        cache_dir(config, "map_assets") if dashboard_cfg.get("inline_map_assets", True) else None
+    )
+
+    def embed(writer: Callable[[TextIO], None]) -> str:
+        embeds.append(writer)
+        return f"\x00{len(embeds) - 1}\x00"
+
+    image_cfg = ImageTierConfig.from_config(config)
+    image_cache = cache_dir(config, "images")
+    budget_bytes = int(dashboard_cfg.get("max_bytes", 0) or 0)
+    image_tiers: list[ImageTiers] = []
+    # 예산 초과 시 두 번째 쓰기에서 원본 해상도 티어를 빼고 썸네일만 남깁니다.
+    budget_state = {"drop_full": False}
+
+    def write_full_uri(out: TextIO, tiers: ImageTiers) -> None:
+        if not budget_state["drop_full"]:
+            _write_data_uri(out, tiers.full)
 
     def image_card(title: str, filename: str, path: Path) -> str:
         if not path.exists():
@@ -207,17 +631,41 @@ def build_dashboard(outputs_dir: str, config: dict, run_summary: dict) -> str:
                 "</article>"
             )
 
-        data_uri = _data_uri(path)
+        tiers = encode_tiers(path, image_cfg, image_cache)
+        image_tiers.append(tiers)
+        if tiers.thumbnail is None:
+            img_attrs = f"src='{embed(lambda out: _write_data_uri(out, tiers.full))}'"
+        else:
+            img_attrs = (
+                f"src='{embed(lambda out: _write_data_uri(out, tiers.thumbnail))}' "
+                f"data-full='{embed(lambda out: write_full_uri(out, tiers))}'"
+            )
         return (
             "<article class='card'>"
             f"<h3>{html.escape(title)}</h3>"
-            f"<a href='{data_uri}' target='_blank' rel='noopener noreferrer'>"
-            f"<img src='{data_uri}' alt='{html.escape(title)}' loading='lazy'/>"
-            "</a>"
-            f"<p class='meta'>인라인 임베드 ({html.escape(path.name)})</p>"
+            f"<img {img_attrs} class='zoomable' alt='{html.escape(title)}' loading='lazy'/>"
+            f"<p class='meta'>인라인 임베드 ({html.escape(path.name)}, 클릭하면 확대)</p>"
             "</article>"
         )
 
+    vector_charts: list[Path] = []
+
+    def vector_chart_card(title: str, filename: str, path: Path) -> str:
+        if not path.exists():
+            return image_card(title, filename, path)
+        vector_charts.append(path)
+        return (
+            "<article class='card'>"
+            f"<h3>{html.escape(title)}</h3>"
+            f"{embed(lambda out: write_chart_data(out, path))}"
+            f"<p class='meta'>인라인 벡터 차트 ({html.escape(path.name)}, 마우스를 올리면 값 표시)</p>"
+            "</article>"
+        )
+
+    def chart_card(title: str, filename: str, path: Path) -> str:
+        card = vector_chart_card if path.suffix == ".json" else image_card
+        return card(title, filename, path)
+
     def map_card(title: str, filename: str, path: Path) -> str:
         if not path.exists():
             return (
@@ -227,15 +675,36 @@ def build_dashboard(outputs_dir: str, config: dict, run_summary: dict) -> str:
                 "</article>"
             )
 
-        srcdoc = html.escape(path.read_text(encoding="utf-8", errors="ignore"), quote=True)
+        map_assets.add(read_map_assets(path))
         return (
             "<article class='card map-card'>"
             f"<h3>{html.escape(title)}</h3>"
-            f"<iframe title='{html.escape(title)}' loading='lazy' srcdoc=\"{srcdoc}\"></iframe>"
+            f"<div class='map-frame' role='region' aria-label='{html.escape(title)}'>"
+            f"{embed(lambda out: write_map_body(out, path))}"
+            "</div>"
             f"<p class='meta'>인라인 임베드 ({html.escape(path.name)})</p>"
             "</article>"
         )
 
+    def image_payload_bytes() -> int:
+        total = 0
+        for tiers in image_tiers:
+            if tiers.thumbnail is not None:
+                total += base64_size(tiers.thumbnail.stat().st_size)
+                if budget_state["drop_full"]:
+                    continue
+            total += base64_size(tiers.full.stat().st_size)
+        return total
+
+    def write_image_budget_line(out: TextIO) -> None:
+        line = f"이미지 임베드: {len(image_tiers)}개, {image_payload_bytes() / 1e6:.1f}MB ({image_cfg.format}"
+        line += f", 썸네일 {image_cfg.thumbnail_width}px)" if image_cfg.thumbnail_width else ")"
+        if budget_bytes:
+            line += f" / 대시보드 예산 {budget_bytes / 1e6:.1f}MB"
+        if budget_state["drop_full"]:
+            line += " - 예산 초과로 원본 해상도 생략"
+        out.write(html.escape(line))
+
     generated_html = "".join(
         f"<li><code>{html.escape(name)}</code></li>" for name in run_summary.get("generated_files", [])
     ) or "<li>생성된 파일이 없습니다.</li>"
@@ -251,34 +720,157 @@ def build_dashboard(outputs_dir: str, config: dict, run_summary: dict) -> str:
     step_rows: list[str] = []
     for step in run_summary.get("steps", []):
         s = html.escape(step.get("status", ""))
+        m = step.get("metrics") or {}
+        if m:
+            rss = "-" if m.get("peak_rss_mb") is None else f"{m['peak_rss_mb']:.0f}"
+            if m.get("peak_rss_scope") == "process":
+                rss += "*"
+            http_cell = f"{m['http_requests']}건 / 평균 {m['http_mean_ms']:.0f}ms" if m.get("http_requests") else "-"
+            if m.get("http_errors"):
+                http_cell += f" (오류 {m['http_errors']})"
+            metric_cells = (
+                f"<td class='num'>{m['wall_seconds']:.2f}</td>"
+                f"<td class='num'>{m['cpu_seconds']:.2f}</td>"
+                f"<td class='num'>{html.escape(rss)}</td>"
+                f"<td>{html.escape(http_cell)}</td>"
+            )
+        else:
+            metric_cells = "<td class='num'>-</td>" * 3 + "<td>-</td>"
         step_rows.append(
             "<tr>"
             f"<td>{html.escape(step.get('name', '-'))}</td>"
             f"<td class='status {s}'>{html.escape(status_label.get(step.get('status', ''), step.get('status', '-')))}</td>"
+            f"{metric_cells}"
             f"<td>{html.escape(step.get('message', '-'))}</td>"
             "</tr>"
         )
 
-    csv_preview_html = "<p class='missing'>미생성(스킵/실패): naver_keywords.csv</p>"
-    csv_path = discovered["keywords_csv"]
-    if csv_path.exists():
+    def csv_preview(title: str, filename: str, path: Path, max_rows: int = 10) -> str:
+        if not path.exists():
+            return f"<p class='missing'>미생성(스킵/실패): {html.escape(filename)}</p>"
         try:
-            headers, rows = _read_csv_preview(csv_path, max_rows=10)
-            head_html = "".join(f"<th>{html.escape(col)}</th>" for col in headers)
-            row_html = "".join(
-                "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>" for row in rows
+            headers, rows = _read_csv_preview(path, max_rows=max_rows)
+        except Exception as e:
+            return f"<p class='missing'>CSV 미리보기 실패: {html.escape(type(e).__name__ + ': ' + str(e))}</p>"
+        head_html = "".join(f"<th>{html.escape(col)}</th>" for col in headers)
+        row_html = "".join(
+            "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>" for row in rows
+        )
+        return (
+            f"<h3>{html.escape(title)}</h3>"
+            "<div class='table-wrap'>"
+            "<table>"
+            f"<thead><tr>{head_html}</tr></thead>"
+            f"<tbody>{row_html}</tbody>"
+            "</table>"
+            "</div>"
+        )
+
+    csv_preview_html = csv_preview(
+        "키워드 CSV 미리보기 (상위 10행)", "naver_keywords.csv", discovered["keywords_csv"]
+    )
+
+    movie_cards_html = "".join(
+        chart_card(title, path.name, path) for title, path in _movie_chart_paths(out_dir, config)
+    )
+    chart_renderer_html = embed(write_renderer) if vector_charts else ""
+
+    movie_summary_html = ""
+    movie_csv = ROOT / config.get("paths", {}).get("movie_indicators_csv", "data_movie_indicators_by_year.csv")
+    if movie_csv.exists():
+        try:
+            from movie_indicators import latest_summary, load_cube
+
+            latest = latest_summary(load_cube(movie_csv, config))
+
+            def fmt(value: float, spec: str) -> str:
+                # 직전 연도가 없는 전년 대비 증감률 등은 NaN입니다.
+                return "-" if value != value else format(value, spec)
+
+            rows_html = "".join(
+                "<tr>"
+                f"<td>{html.escape(str(r.category))}</td>"
+                f"<td class='num'>{fmt(r.audience_10k, ',.1f')}</td>"
+                f"<td class='num'>{fmt(r.audience_share, '.1%')}</td>"
+                f"<td class='num'>{fmt(r.audience_yoy, '+.1%')}</td>"
+                f"<td class='num'>{fmt(r.sales_100m, ',.1f')}</td>"
+                f"<td class='num'>{fmt(r.sales_share, '.1%')}</td>"
+                f"<td class='num'>{fmt(r.sales_yoy, '+.1%')}</td>"
+                f"<td class='num'>{fmt(r.revenue_per_viewer, ',.0f')}</td>"
+                f"<td class='num'>{fmt(r.revenue_per_release / 1e8, ',.2f')}</td>"
+                "</tr>"
+                for r in latest.itertuples(index=False)
             )
-            csv_preview_html = (
-                "<h3>키워드 CSV 미리보기 (상위 10행)</h3>"
-                "<div class='table-wrap'>"
-                "<table>"
-                f"<thead><tr>{head_html}</tr></thead>"
-                f"<tbody>{row_html}</tbody>"
-                "</table>"
-                "</div>"
+            year = int(latest["year"].iloc[0]) if len(latest) else "-"
+            movie_summary_html = (
+                f"<h3 style=\"margin-top:14px\">{year}년 지표 요약</h3>"
+                "<div class='table-wrap'><table>"
+                "<thead><tr><th>분류</th><th>관객수(만)</th><th>관객 점유율</th><th>관객 전년 대비</th>"
+                "<th>매출(억)</th><th>매출 점유율</th><th>매출 전년 대비</th><th>관객 1인당 매출(원)</th>"
+                "<th>편당 매출(억)</th></tr></thead>"
+                f"<tbody>{rows_html}</tbody>"
+                "</table></div>"
             )
         except Exception as e:
-            csv_preview_html = f"<p class='missing'>CSV 미리보기 실패: {html.escape(type(e).__name__ + ': ' + str(e))}</p>"
+            movie_summary_html = f"<p class='missing'>영화 지표 요약 실패: {html.escape(type(e).__name__ + ': ' + str(e))}</p>"
+
+    brand_section_html = ""
+    brand_paths = _brand_keyword_paths(out_dir, config)
+    if brand_paths:
+
+        def brand_card(brand: str, csv_path: Path, img_path: Path) -> str:
+            title = f"{brand} 특징 키워드 워드클라우드"
+            try:
+                empty = csv_path.exists() and not _read_csv_preview(csv_path, max_rows=1)[1]
+            except Exception:
+                empty = False
+            if empty:
+                # text_analysis는 글이 없는 브랜드에도 자리 표시 그림을 쓰므로, CSV로 판단해 미생성 카드로 보여줍니다.
+                return (
+                    "<article class='card missing-card'>"
+                    f"<h3>{html.escape(title)}</h3>"
+                    f"<p class='missing'>저장된 글이 없어 특징 키워드가 없습니다: {html.escape(brand)}</p>"
+                    "</article>"
+                )
+            return image_card(title, img_path.name, img_path)
+
+        brand_cards = "".join(brand_card(*paths) for paths in brand_paths)
+        brand_tables = "".join(
+            csv_preview(f"{brand} 특징 키워드 (log-odds 상위 10행)", csv_path.name, csv_path)
+            for brand, csv_path, _ in brand_paths
+        )
+        brand_section_html = (
+            "<section class=\"section\">"
+            "<h2>D-2. 브랜드별 특징 키워드</h2>"
+            f"<div class=\"cards\">{brand_cards}</div>"
+            f"{brand_tables}"
+            "</section>"
+        )
+
+    access_path = discovered["accessibility_csv"]
+    access_summary_html = ""
+    if access_path.exists():
+        try:
+            import pandas as pd
+            from proximity import accessibility_summary
+
+            radii_m = config.get("proximity", {}).get("radii_m", [500, 1000])
+            summary = accessibility_summary(pd.read_csv(access_path, encoding="utf-8-sig"), radii_m)
+            items = [f"<li>극장 수: {summary['theaters']}</li>"]
+            if "nearest_median_m" in summary:
+                items.append(
+                    f"<li>최근접 역 거리: 중앙값 {summary['nearest_median_m']}m / 평균 {summary['nearest_mean_m']}m</li>"
+                )
+            for r in radii_m:
+                share = summary.get(f"share_within_{int(r)}m")
+                if share is not None:
+                    items.append(f"<li>{int(r)}m 이내 역이 있는 극장 비율: {share * 100:.1f}%</li>")
+            access_summary_html = f"<ul>{''.join(items)}</ul>"
+        except Exception as e:
+            access_summary_html = f"<p class='missing'>접근성 요약 실패: {html.escape(type(e).__name__ + ': ' + str(e))}</p>"
+    access_preview_html = access_summary_html + csv_preview(
+        "극장별 가까운 역 (상위 20행)", "theater_station_accessibility.csv", access_path, max_rows=20
+    )
 
     dashboard_html = f"""<!doctype html>
 <html lang=\"ko\">
@@ -311,23 +903,30 @@ def build_dashboard(outputs_dir: str, config: dict, run_summary: dict) -> str:
     .missing {{ color: var(--fail); font-weight: 600; }}
     .missing-card {{ background: #fff9f9; }}
     img {{ width: 100%; border-radius: 8px; border: 1px solid var(--line); display: block; }}
-    iframe {{ width: 100%; min-height: 900px; border: 1px solid var(--line); border-radius: 8px; background: #fff; }}
+    .map-frame {{ position: relative; width: 100%; height: 900px; border: 1px solid var(--line); border-radius: 8px; overflow: hidden; background: #fff; }}
     .map-card {{ grid-column: 1 / -1; }}
+    img.zoomable {{ cursor: zoom-in; }}
+    .lightbox {{ position: fixed; inset: 0; z-index: 10000; display: flex; align-items: center; justify-content: center; background: rgba(15, 23, 42, 0.85); cursor: zoom-out; }}
+    .lightbox[hidden] {{ display: none; }}
+    .lightbox img {{ width: auto; max-width: 96vw; max-height: 96vh; border: 0; }}
     code {{ background: #edf2ff; padding: 2px 6px; border-radius: 6px; }}
     ul {{ margin: 0; padding-left: 18px; }}
     table {{ width: 100%; border-collapse: collapse; font-size: 14px; }}
     th, td {{ border: 1px solid var(--line); padding: 8px; text-align: left; }}
     th {{ background: #f2f5fb; }}
+    td.num {{ text-align: right; font-variant-numeric: tabular-nums; }}
     .table-wrap {{ overflow-x: auto; }}
     .status {{ font-weight: 700; }}
     .status.success {{ color: var(--ok); }}
+    .status.cached {{ color: var(--ok); font-style: italic; }}
     .status.failed {{ color: var(--fail); }}
     .status.skipped {{ color: var(--skip); }}
     @media (max-width: 900px) {{
       .summary-grid {{ grid-template-columns: 1fr; }}
-      iframe {{ min-height: 900px; }}
+      .map-frame {{ height: 640px; }}
     }}
   </style>
+  {embed(lambda out: write_shared_assets(out, map_assets, map_asset_cache, config))}
 </head>
 <body>
   <main class=\"container\">
@@ -341,6 +940,8 @@ def build_dashboard(outputs_dir: str, config: dict, run_summary: dict) -> str:
             <li>시작: {html.escape(str(run_summary.get('started_at', '-')))}</li>
             <li>종료: {html.escape(str(run_summary.get('finished_at', '-')))}</li>
             <li>소요 시간: {html.escape(str(run_summary.get('duration_seconds', '-')))}초</li>
+            <li>HTTP 모드: {html.escape(str(run_summary.get('http_mode', 'live')))} (외부 호출 {run_summary.get('http_requests', 0)}건)</li>
+            <li>{embed(write_image_budget_line)}</li>
           </ul>
         </section>
         <section>
@@ -359,23 +960,23 @@ def build_dashboard(outputs_dir: str, config: dict, run_summary: dict) -> str:
         <div class=\"table-wrap\">
           <table>
             <thead>
-              <tr><th>단계</th><th>상태</th><th>메시지</th></tr>
+              <tr><th>단계</th><th>상태</th><th>시간(s)</th><th>CPU(s)</th><th>피크 RSS(MB)</th><th>HTTP</th><th>메시지</th></tr>
             </thead>
             <tbody>
               {''.join(step_rows)}
             </tbody>
           </table>
         </div>
+        <p class=\"meta\">시간/CPU/피크 RSS/HTTP는 단계 모듈 import를 포함한 값입니다. RSS의 *는 단계별 초기화가 안 되는 OS에서의 프로세스 누적 최대값입니다. 원본 수치는 <code>run_metrics.json</code>에 있습니다.</p>
       </section>
     </header>
 
     <section class=\"section\">
       <h2>A. 영화 지표</h2>
       <div class=\"cards\">
-        {image_card('연도별 개봉편수', 'movie_releases_by_year.png', discovered['movie_releases'])}
-        {image_card('연도별 관객수', 'movie_audience_by_year.png', discovered['movie_audience'])}
-        {image_card('연도별 매출', 'movie_sales_by_year.png', discovered['movie_sales'])}
+        {movie_cards_html}
       </div>
+      {movie_summary_html}
     </section>
 
     <section class=\"section\">
@@ -386,6 +987,11 @@ def build_dashboard(outputs_dir: str, config: dict, run_summary: dict) -> str:
       </div>
     </section>
 
+    <section class=\"section\">
+      <h2>B-2. 극장-지하철역 접근성</h2>
+      {access_preview_html}
+    </section>
+
     <section class=\"section\">
       <h2>C. 기타 분석</h2>
       <div class=\"cards\">
@@ -399,105 +1005,90 @@ def build_dashboard(outputs_dir: str, config: dict, run_summary: dict) -> str:
       <h2>D. 키워드 데이터</h2>
       {csv_preview_html}
     </section>
+
+    {brand_section_html}
   </main>
+  {chart_renderer_html}
+  <div id=\"lightbox\" class=\"lightbox\" hidden onclick=\"this.hidden = true\"><img alt=\"\"/></div>
+  <script>
+    document.addEventListener('click', function (e) {{
+      var img = e.target.closest('img.zoomable');
+      if (!img) return;
+      var box = document.getElementById('lightbox');
+      box.querySelector('img').src = img.dataset.full || img.src;
+      box.hidden = false;
+    }});
+  </script>
 </body>
 </html>
 """
 
     dashboard_path = out_dir / "dashboard.html"
-    dashboard_path.write_text(dashboard_html, encoding="utf-8")
+    tmp_path = dashboard_path.with_name(dashboard_path.name + ".tmp")
+    parts = re.split(r"\x00(\d+)\x00", dashboard_html)
+
+    def write_dashboard() -> int:
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            for i, part in enumerate(parts):
+                if i % 2:
+                    embeds[int(part)](out)
+                else:
+                    out.write(part)
+        return tmp_path.stat().st_size
+
+    size = write_dashboard()
+    if budget_bytes and size > budget_bytes and any(t.thumbnail is not None for t in image_tiers):
+        budget_state["drop_full"] = True
+        size = write_dashboard()
+    tmp_path.replace(dashboard_path)
+
+    run_summary["dashboard"] = {
+        "bytes": size,
+        "budget_bytes": budget_bytes,
+        "within_budget": not budget_bytes or size <= budget_bytes,
+        "image_bytes": image_payload_bytes(),
+        "full_images_dropped": budget_state["drop_full"],
+    }
     return str(dashboard_path)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Analysis-of-Theater 파이프라인 실행 및 대시보드 생성")
+    parser.add_argument(
+        "--http-mode",
+        choices=MODES,
+        default=None,
+        help="Kakao/Naver 호출 모드(live: 실호출, record: 카세트 녹화, replay: 카세트 재생). 기본은 config http.mode",
+    )
+    args = parser.parse_args(argv)
+
     started_at = datetime.now()
     cfg = load_config()
     out_dir = _abs_output_dir(cfg)
 
-    _prepare_outputs_for_fresh_run(out_dir, cfg)
+    if args.http_mode:
+        os.environ[MODE_ENV] = args.http_mode  # spawn 워커도 환경변수를 물려받습니다.
+    http_mode = resolve_mode(cfg)
+    recording_dir = None
+    if http_mode == "record":
+        # 새 녹화는 임시 폴더에 쓰고, 실행이 끝난 뒤에만 기존 카세트를 교체합니다.
+        recording_dir = begin_recording(cfg)
+        print(f"[INFO] HTTP record mode: recording to {recording_dir}")
+    elif http_mode == "replay":
+        print(f"[INFO] HTTP replay mode: API responses are served from {cassette_dir(cfg)}")
 
-    expected_files = {
-        "지도(극장+역)": [_configured_path(out_dir, cfg, "map_theaters_and_stations", "map_theaters_stations.html")],
-        "지도(극장+쇼핑몰 예시)": [_configured_path(out_dir, cfg, "map_spot", "map_spot_theaters_malls.html")],
-        "영화 지표 시각화": [
-            _configured_path(out_dir, cfg, "movie_releases_plot", "movie_releases_by_year.png"),
-            _configured_path(out_dir, cfg, "movie_audience_plot", "movie_audience_by_year.png"),
-            _configured_path(out_dir, cfg, "movie_sales_plot", "movie_sales_by_year.png"),
-        ],
-        "3D 분석": [_configured_path(out_dir, cfg, "plot_3d_trendlines", "theater_3d_trendlines.png")],
-        "소비지출-점유율 상관": [
-            _configured_path(out_dir, cfg, "consumption_share_correlation", "consumption_share_correlation.png")
-        ],
-        "텍스트 키워드 분석": [
-            _configured_path(out_dir, cfg, "text_keywords_csv", "naver_keywords.csv"),
-            _configured_path(out_dir, cfg, "text_wordcloud", "naver_wordcloud.png"),
-        ],
-    }
-
-    results: list[StepResult] = []
-
-    if cfg.get("pipeline", {}).get("run_maps", True):
-        try:
-            import Integrate_stations
-
-            results.append(_run_step("지도(극장+역)", Integrate_stations.main, expected_files["지도(극장+역)"]))
-        except Exception as e:
-            results.append(StepResult("지도(극장+역)", "failed", f"ImportError/InitError: {e}", []))
-
-        try:
-            import Spot
-
-            results.append(_run_step("지도(극장+쇼핑몰 예시)", Spot.main, expected_files["지도(극장+쇼핑몰 예시)"]))
-        except Exception as e:
-            results.append(StepResult("지도(극장+쇼핑몰 예시)", "failed", f"ImportError/InitError: {e}", []))
-    else:
-        results.append(_step_skipped("지도(극장+역)", "config.pipeline.run_maps=false"))
-        results.append(_step_skipped("지도(극장+쇼핑몰 예시)", "config.pipeline.run_maps=false"))
-
-    if cfg.get("pipeline", {}).get("run_movie_visualization", True):
-        try:
-            import Visualization
-
-            results.append(_run_step("영화 지표 시각화", Visualization.main, expected_files["영화 지표 시각화"]))
-        except Exception as e:
-            results.append(StepResult("영화 지표 시각화", "failed", f"ImportError/InitError: {e}", []))
-    else:
-        results.append(_step_skipped("영화 지표 시각화", "config.pipeline.run_movie_visualization=false"))
-
-    if cfg.get("pipeline", {}).get("run_3d_analysis", True):
-        try:
-            import Graph3D
-
-            results.append(_run_step("3D 분석", Graph3D.main, expected_files["3D 분석"]))
-        except Exception as e:
-            results.append(StepResult("3D 분석", "failed", f"ImportError/InitError: {e}", []))
-    else:
-        results.append(_step_skipped("3D 분석", "config.pipeline.run_3d_analysis=false"))
-
-    if cfg.get("pipeline", {}).get("run_consumption_share_analysis", True):
-        try:
-            import Consumtion_Share_Analysis
-
-            results.append(
-                _run_step("소비지출-점유율 상관", Consumtion_Share_Analysis.main, expected_files["소비지출-점유율 상관"])
-            )
-        except Exception as e:
-            results.append(StepResult("소비지출-점유율 상관", "failed", f"ImportError/InitError: {e}", []))
-    else:
-        results.append(_step_skipped("소비지출-점유율 상관", "config.pipeline.run_consumption_share_analysis=false"))
+    _prepare_outputs_for_fresh_run(out_dir, cfg)
 
-    if cfg.get("pipeline", {}).get("run_text_analysis", True):
-        try:
-            import text_analysis
+    # 폰트 탐색 결과를 워커 기동 전에 캐시해 두면 단계 프로세스들은 탐색 없이 읽기만 합니다.
+    font_path = resolve_korean_font_path(cfg)
+    if not font_path:
+        print("[WARN] 한글 폰트를 찾지 못했습니다(KOREAN_FONT_PATH 설정 또는 NanumGothic 등 설치 필요)")
 
-            results.append(_run_step("텍스트 키워드 분석", text_analysis.main, expected_files["텍스트 키워드 분석"]))
-        except Exception as e:
-            results.append(StepResult("텍스트 키워드 분석", "failed", f"ImportError/InitError: {e}", []))
-    else:
-        results.append(_step_skipped("텍스트 키워드 분석", "config.pipeline.run_text_analysis=false"))
+    results = run_steps(_step_specs(out_dir, cfg), cfg)
 
     finished_at = datetime.now()
     run_summary = _build_run_summary(results, started_at, finished_at, out_dir)
+    run_summary["http_mode"] = http_mode
 
     dashboard_path = out_dir / "dashboard.html"
     try:
@@ -506,6 +1097,10 @@ def main() -> int:
         if not dashboard_path.is_absolute():
             dashboard_path = (ROOT / dashboard_path).resolve()
         print(f"[OK] Dashboard generated: {dashboard_path}")
+        size_info = run_summary["dashboard"]
+        print(f"[INFO] Dashboard size: {size_info['bytes'] / 1e6:.2f}MB (budget {size_info['budget_bytes'] / 1e6:.2f}MB)")
+        if not size_info["within_budget"]:
+            print("[WARN] Dashboard exceeds size budget")
     except Exception as e:
         err = f"{type(e).__name__}: {e}"
         fallback = (
@@ -517,11 +1112,24 @@ def main() -> int:
         dashboard_path.write_text(fallback, encoding="utf-8")
         print(f"[WARN] Dashboard generation failed: {err}")
 
+    metrics_path = _configured_path(out_dir, cfg, "run_metrics_json", "run_metrics.json")
+    _write_run_metrics(metrics_path, run_summary)
+    print(f"[OK] Run metrics written: {metrics_path}")
+
     cleanup_targets = _known_artifact_paths(out_dir, cfg)
-    removed = _remove_files(cleanup_targets, preserve={"dashboard.html", ".gitkeep"})
+    removed = _remove_files(cleanup_targets, preserve={"dashboard.html", metrics_path.name, ".gitkeep"})
     print(f"[OK] Temporary artifacts cleaned: {removed} files removed")
 
-    return 0 if all(r.status != "failed" for r in results) else 2
+    ok = all(r.status != "failed" for r in results)
+    if recording_dir is not None:
+        if ok:
+            moved = commit_recording(recording_dir, cfg)
+            print(f"[OK] Cassettes replaced: {moved} files in {cassette_dir(cfg)}")
+        else:
+            discard_recording(recording_dir)
+            print("[WARN] Recording discarded because a step failed; previous cassettes were kept")
+
+    return 0 if ok else 2
 
 
 if __name__ == "__main__":
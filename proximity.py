@@ -0,0 +1,97 @@
+"""극장-지하철역 근접도 인덱스와 접근성 지표.
+
+- 역 위경도 배열로 haversine BallTree를 한 번 만들고, 극장 좌표 전체를 한 번에 질의합니다.
+- 극장별 가까운 역 N개(역 이름/거리 m)와 반경(기본 500m/1km) 내 역 개수를 계산합니다.
+- 전체 쌍 거리 행렬을 만들지 않으므로 전국 단위 점 개수에서도 메모리가 O(극장 수 × N)입니다.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import BallTree
+
+
+EARTH_RADIUS_M = 6_371_008.8
+
+
+def _radians(lat: Sequence[float] | np.ndarray, lng: Sequence[float] | np.ndarray) -> np.ndarray:
+    return np.radians(np.column_stack([np.asarray(lat, dtype=float), np.asarray(lng, dtype=float)]))
+
+
+class StationIndex:
+    """역 좌표 haversine BallTree 래퍼."""
+
+    def __init__(self, lat: Sequence[float] | np.ndarray, lng: Sequence[float] | np.ndarray) -> None:
+        self._points = _radians(lat, lng)
+        self.size = len(self._points)
+        self._tree = BallTree(self._points, metric="haversine") if self.size else None
+
+    def nearest(
+        self, lat: Sequence[float] | np.ndarray, lng: Sequence[float] | np.ndarray, k: int = 3
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(거리 m, 역 인덱스) 배열을 반환합니다. 모양은 (질의 점 수, min(k, 역 수))입니다."""
+        query = _radians(lat, lng)
+        k = min(int(k), self.size)
+        if self._tree is None or k == 0 or len(query) == 0:
+            return np.empty((len(query), 0)), np.empty((len(query), 0), dtype=int)
+        dist, idx = self._tree.query(query, k=k)
+        return dist * EARTH_RADIUS_M, idx
+
+    def count_within(
+        self, lat: Sequence[float] | np.ndarray, lng: Sequence[float] | np.ndarray, radius_m: float
+    ) -> np.ndarray:
+        query = _radians(lat, lng)
+        if self._tree is None or len(query) == 0:
+            return np.zeros(len(query), dtype=int)
+        return self._tree.query_radius(query, r=radius_m / EARTH_RADIUS_M, count_only=True)
+
+
+def theater_accessibility(
+    theaters: pd.DataFrame,
+    stations: pd.DataFrame,
+    k: int = 3,
+    radii_m: Sequence[float] = (500, 1000),
+) -> pd.DataFrame:
+    """극장별 접근성 표를 만듭니다.
+
+    theaters: lat, lng 컬럼 필수(나머지 컬럼은 그대로 앞에 유지)
+    stations: lat, lng 컬럼 필수, 역사명/노선명이 있으면 역 라벨로 사용
+
+    추가 컬럼: nearest_{i}_station, nearest_{i}_m (i=1..k), stations_within_{r}m
+    """
+    index = StationIndex(stations["lat"].to_numpy(), stations["lng"].to_numpy())
+    lat = theaters["lat"].to_numpy(dtype=float)
+    lng = theaters["lng"].to_numpy(dtype=float)
+
+    if "역사명" in stations.columns:
+        labels = stations["역사명"].astype(str)
+        if "노선명" in stations.columns:
+            labels = labels + " (" + stations["노선명"].astype(str) + ")"
+        labels = labels.to_numpy(dtype=object)
+    else:
+        labels = np.arange(len(stations)).astype(str).astype(object)
+
+    out = theaters.reset_index(drop=True).copy()
+    dist, idx = index.nearest(lat, lng, k=k)
+    for i in range(dist.shape[1]):
+        out[f"nearest_{i + 1}_station"] = labels[idx[:, i]]
+        out[f"nearest_{i + 1}_m"] = np.round(dist[:, i]).astype(int)
+    for r in radii_m:
+        out[f"stations_within_{int(r)}m"] = index.count_within(lat, lng, r)
+    return out
+
+
+def accessibility_summary(table: pd.DataFrame, radii_m: Sequence[float] = (500, 1000)) -> dict:
+    """대시보드용 요약 지표(극장 수, 최근접 역 거리 중앙값/평균, 반경별 역세권 비율)."""
+    summary: dict = {"theaters": int(len(table))}
+    if "nearest_1_m" in table.columns and len(table):
+        summary["nearest_median_m"] = int(table["nearest_1_m"].median())
+        summary["nearest_mean_m"] = int(round(table["nearest_1_m"].mean()))
+    for r in radii_m:
+        col = f"stations_within_{int(r)}m"
+        if col in table.columns and len(table):
+            summary[f"share_within_{int(r)}m"] = round(float((table[col] > 0).mean()), 3)
+    return summary
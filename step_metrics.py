@@ -0,0 +1,154 @@
+"""파이프라인 단계별 실행 계측(벽시계/CPU 시간, 피크 메모리, 외부 HTTP 호출).
+
+`measure()` 컨텍스트 안에서 단계 main()을 실행하면 `StepMetrics`가 채워집니다.
+
+- 피크 RSS: Linux는 `/proc/self/clear_refs`로 단계 시작 시 최고 수위(VmHWM)를 초기화한 뒤 읽으므로
+  워커 프로세스를 재사용해도 단계별 값이 나옵니다. 그 밖의 OS는 `resource.getrusage`의 프로세스 누적 최대값입니다.
+- Python 힙 피크: `trace_memory=True`일 때만 tracemalloc으로 측정합니다(할당이 느려지므로 기본 꺼짐).
+- HTTP: `requests`의 `HTTPAdapter.send`를 감싸 요청 수/오류 수/지연을 호스트별로 셉니다.
+  Kakao/Naver 호출은 모두 `requests`를 거치므로 별도 수정 없이 잡힙니다.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator
+from urllib.parse import urlsplit
+
+import requests.adapters
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+_PROC_STATUS = Path("/proc/self/status")
+_PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+@dataclass
+class StepMetrics:
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_mb: float | None = None
+    peak_rss_scope: str = "step"  # step | process(프로세스 누적 최대값)
+    py_peak_mb: float | None = None
+    http_requests: int = 0
+    http_errors: int = 0
+    http_total_ms: float = 0.0
+    http_max_ms: float = 0.0
+    http_by_host: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def http_mean_ms(self) -> float:
+        return self.http_total_ms / self.http_requests if self.http_requests else 0.0
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        for key in ("wall_seconds", "cpu_seconds"):
+            d[key] = round(d[key], 3)
+        d["http_total_ms"] = round(self.http_total_ms, 1)
+        d["http_max_ms"] = round(self.http_max_ms, 1)
+        d["http_mean_ms"] = round(self.http_mean_ms, 1)
+        return d
+
+
+def _reset_peak_rss() -> bool:
+    try:
+        _PROC_CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        for line in _PROC_STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024  # macOS는 바이트, Linux는 KB
+
+
+class _HttpRecorder:
+    """HTTPAdapter.send를 한 번만 감싸고, 활성 StepMetrics에 호출 기록을 더합니다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active: list[StepMetrics] = []
+        self._original = None
+
+    def _send(self, adapter, request, *args, **kwargs):
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = self._original(adapter, request, *args, **kwargs)
+            ok = response.status_code < 400
+            return response
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            host = urlsplit(request.url).netloc
+            with self._lock:
+                for m in self._active:
+                    m.http_requests += 1
+                    m.http_errors += 0 if ok else 1
+                    m.http_total_ms += elapsed_ms
+                    m.http_max_ms = max(m.http_max_ms, elapsed_ms)
+                    m.http_by_host[host] = m.http_by_host.get(host, 0) + 1
+
+    def attach(self, metrics: StepMetrics) -> None:
+        with self._lock:
+            if self._original is None:
+                self._original = requests.adapters.HTTPAdapter.send
+                recorder = self
+
+                def send(adapter, request, *args, **kwargs):
+                    return recorder._send(adapter, request, *args, **kwargs)
+
+                requests.adapters.HTTPAdapter.send = send
+            self._active.append(metrics)
+
+    def detach(self, metrics: StepMetrics) -> None:
+        with self._lock:
+            self._active.remove(metrics)
+            if not self._active and self._original is not None:
+                requests.adapters.HTTPAdapter.send = self._original
+                self._original = None
+
+
+_http_recorder = _HttpRecorder()
+
+
+@contextmanager
+def measure(trace_memory: bool = False) -> Iterator[StepMetrics]:
+    """블록 실행 동안의 계측값을 StepMetrics로 돌려줍니다(블록이 예외로 끝나도 채워짐)."""
+    metrics = StepMetrics()
+    if not _reset_peak_rss():
+        metrics.peak_rss_scope = "process"
+    tracing = trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    _http_recorder.attach(metrics)
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        yield metrics
+    finally:
+        metrics.wall_seconds = time.perf_counter() - wall0
+        metrics.cpu_seconds = time.process_time() - cpu0
+        _http_recorder.detach(metrics)
+        if tracing:
+            metrics.py_peak_mb = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1)
+            tracemalloc.stop()
+        peak = _peak_rss_mb()
+        metrics.peak_rss_mb = round(peak, 1) if peak is not None else None
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# 분석 스크립트는 저장소 루트의 최상위 모듈이므로 루트(와 stub 서버가 있는 benchmarks)를 import 경로에 둡니다.
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "benchmarks"))
+sys.path.insert(0, str(ROOT))
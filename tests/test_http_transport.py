@@ -0,0 +1,87 @@
+import shutil
+
+from geocoding import BatchGeocoder, GeocodeCache
+from http_transport import (
+    CASSETTE_DIR_ENV,
+    MODE_ENV,
+    begin_recording,
+    cassette_dir,
+    commit_recording,
+    discard_recording,
+    replay_credential,
+)
+from naver_blog import BlogCollector
+from stub_api import StubApiServer
+
+ADDRESSES = ["서울 중구 세종대로 110", "서울 마포구 월드컵북로 400"]
+
+
+def _geocode(cfg: dict) -> list:
+    cache = GeocodeCache.from_config(cfg)
+    geocoder = BatchGeocoder.from_config(cfg, "stub-key", cache)
+    try:
+        return geocoder.geocode_many(ADDRESSES)
+    finally:
+        geocoder.close()
+        cache.close()
+
+
+def _crawl(cfg: dict) -> tuple[list, object]:
+    collector = BlogCollector.from_config(cfg, "stub-id", "stub-secret")
+    try:
+        return collector.collect("CGV", max_items=200)
+    finally:
+        collector.close()
+
+
+def test_record_with_warm_caches_replays_on_clean_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv(CASSETTE_DIR_ENV, raising=False)  # 녹화 임시 폴더 설정이 다른 테스트로 새지 않게
+    with StubApiServer() as stub:
+        cfg = {"cache": {"dir": str(tmp_path / "cache")}, **stub.config_overrides()}
+        monkeypatch.setenv(MODE_ENV, "live")
+        live = _geocode(cfg)  # 지오코딩 캐시를 채워 둡니다.
+        live_items, _ = _crawl(cfg)  # 같은 날 페이지 캐시도 채워 둡니다.
+
+        monkeypatch.setenv(MODE_ENV, "record")
+        staging = begin_recording(cfg)
+        before = stub.request_count
+        recorded = _geocode(cfg)
+        _, stats = _crawl(cfg)
+        assert [r.source for r in recorded] == ["api", "api"]
+        assert stats.cache_hits == 0
+        assert stub.request_count - before == len(ADDRESSES) + stats.pages
+        commit_recording(staging, cfg)
+
+    # stub이 꺼진 상태에서 로컬 캐시 없이 카세트만으로 재생합니다.
+    (tmp_path / "cache" / "geocode.sqlite3").unlink()
+    shutil.rmtree(tmp_path / "cache" / "naver_blog")
+    monkeypatch.setenv(MODE_ENV, "replay")
+    replayed = _geocode(cfg)
+    assert [r.coord for r in replayed] == [r.coord for r in live]
+    assert [r.source for r in replayed] == ["api", "api"]
+    replayed_items, stats = _crawl(cfg)
+    assert replayed_items == live_items and stats.errors == 0
+
+
+def test_discarded_recording_keeps_previous_cassettes(tmp_path, monkeypatch):
+    monkeypatch.delenv(CASSETTE_DIR_ENV, raising=False)
+    cfg = {"cache": {"dir": str(tmp_path / "cache")}}
+    old = cassette_dir(cfg) / "old.jsonl.gz"
+    old.write_bytes(b"")
+    monkeypatch.setenv(MODE_ENV, "record")
+
+    staging = begin_recording(cfg)
+    (staging / "new.jsonl.gz").write_bytes(b"")
+    assert old.exists()
+    discard_recording(staging)
+
+    assert old.exists() and not staging.exists()
+    assert sorted(p.name for p in cassette_dir(cfg).iterdir()) == ["old.jsonl.gz"]
+
+
+def test_replay_needs_no_api_keys(monkeypatch):
+    monkeypatch.setenv(MODE_ENV, "replay")
+    assert replay_credential("", None)
+    assert replay_credential("real-key", None) == "real-key"
+    monkeypatch.setenv(MODE_ENV, "live")
+    assert replay_credential("", None) == ""
@@ -0,0 +1,53 @@
+import multiprocessing
+
+import pandas as pd
+import pytest
+
+from ingest import read_sheet
+
+
+def _read_rows(args: tuple) -> int:
+    xlsx, cache = args
+    return len(read_sheet(xlsx, "극장", cfg={"cache": {"dir": cache}}))
+
+
+def test_read_sheet_cold_cache_from_concurrent_processes(tmp_path):
+    xlsx = tmp_path / "theaters.xlsx"
+    pd.DataFrame({"영화관명": [f"극장{i}" for i in range(5000)], "좌석수": range(5000)}).to_excel(
+        xlsx, sheet_name="극장", index=False
+    )
+    cache = str(tmp_path / "cache")
+
+    with multiprocessing.get_context("spawn").Pool(4) as pool:
+        assert pool.map(_read_rows, [(xlsx, cache)] * 4) == [5000] * 4
+
+    names = sorted(p.name for p in (tmp_path / "cache" / "sheets").iterdir())
+    assert not [n for n in names if n.endswith(".tmp")]
+    assert len([n for n in names if n.startswith("theaters.")]) == 1
+
+
+def test_read_sheet_skips_missing_optional_columns(tmp_path):
+    xlsx = tmp_path / "stations.xlsx"
+    pd.DataFrame({"역사명": ["서울역"], "역위도": [37.55], "역경도": [126.97]}).to_excel(xlsx, index=False)
+    cfg = {"cache": {"dir": str(tmp_path / "cache")}}
+
+    df = read_sheet(xlsx, columns=["역사명", "역위도", "역경도", "운영기관명"], cfg=cfg, optional_columns=["운영기관명"])
+    assert list(df.columns) == ["역사명", "역위도", "역경도"]
+
+    with pytest.raises(KeyError, match="운영기관명"):
+        read_sheet(xlsx, columns=["역사명", "운영기관명"], cfg=cfg)
+
+
+def test_workbooks_with_overlapping_names_keep_their_caches(tmp_path):
+    cfg = {"cache": {"dir": str(tmp_path / "cache")}}
+    books = [tmp_path / "data.xlsx", tmp_path / "data.v2.xlsx", tmp_path / "other" / "data.xlsx"]
+    for i, xlsx in enumerate(books):
+        xlsx.parent.mkdir(exist_ok=True)
+        pd.DataFrame({"값": [i]}).to_excel(xlsx, index=False)
+        read_sheet(xlsx, cfg=cfg)
+
+    sheets = tmp_path / "cache" / "sheets"
+    before = {p.name for p in sheets.iterdir() if p.suffix in (".parquet", ".pkl")}
+    assert len(before) == 3
+    assert [read_sheet(xlsx, cfg=cfg)["값"].iloc[0] for xlsx in books] == [0, 1, 2]
+    assert {p.name for p in sheets.iterdir() if p.suffix in (".parquet", ".pkl")} == before
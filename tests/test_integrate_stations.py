@@ -0,0 +1,66 @@
+import pandas as pd
+
+from geocoding import BatchGeocoder, GeocodeCache, clean_address
+from Integrate_stations import resolve_stations
+
+
+class _FakeResponse:
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return self._data
+
+
+class _FakeSession:
+    """주소 → 좌표 표를 Kakao 응답 형식으로 돌려주는 세션. 표에 없는 주소는 빈 결과입니다."""
+
+    def __init__(self, known: dict[str, tuple[float, float]]) -> None:
+        self.known = {clean_address(address): coord for address, coord in known.items()}
+        self.headers: dict[str, str] = {}
+        self.queries: list[str] = []
+
+    def get(self, url: str, params: dict, timeout: float) -> _FakeResponse:
+        query = params["query"]
+        self.queries.append(query)
+        coord = self.known.get(clean_address(query))
+        docs = [{"x": str(coord[1]), "y": str(coord[0])}] if coord else []
+        return _FakeResponse({"documents": docs})
+
+    def close(self) -> None:
+        pass
+
+
+def test_resolve_stations_drops_failed_geocode(tmp_path):
+    raw = pd.DataFrame(
+        {
+            "역사명": ["시트역", "교환역", "변환역", "실패역"],
+            "노선명": ["1호선"] * 4,
+            "운영기관명": ["테스트"] * 4,
+            "역위도": [37.56, 126.98, None, None],
+            "역경도": [126.97, 37.57, None, None],
+            "역사도로명주소": [None, None, "서울 중구 세종대로 110", "서울 중구 없는로 1"],
+        }
+    )
+    session = _FakeSession({"서울 중구 세종대로 110": (37.5663, 126.9779)})
+    cache = GeocodeCache(tmp_path / "geocode.sqlite3")
+    geocoder = BatchGeocoder("test-key", cache=cache, max_workers=1, rate_per_sec=1000, burst=1000)
+    geocoder.session = session
+    try:
+        stations = resolve_stations(raw, geocoder)
+    finally:
+        geocoder.close()
+        cache.close()
+
+    assert dict(zip(stations["역사명"], stations["source"])) == {
+        "시트역": "sheet",
+        "교환역": "sheet_swapped",
+        "변환역": "geocoded",
+    }
+    # 시트 좌표가 있는 역은 지오코딩하지 않습니다.
+    assert len(session.queries) == 2
+    row = stations.set_index("역사명").loc["교환역"]
+    assert (row["lat"], row["lng"]) == (37.57, 126.98)
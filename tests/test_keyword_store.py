@@ -0,0 +1,14 @@
+from keyword_store import KeywordStore
+
+
+def test_trending_drops_short_terms_like_brand_matrix(tmp_path):
+    store = KeywordStore(tmp_path / "keywords.sqlite")
+    try:
+        items = [{"link": f"https://blog/{i}", "postdate": "20261016"} for i in range(4)]
+        store.ingest("CGV", items, [["팝콘", "관", "용산"]] * 4)
+        terms = [row[0] for row in store.trending("CGV")]
+        assert "관" not in terms
+        assert set(terms) == {"팝콘", "용산"}
+        assert "관" in [row[0] for row in store.trending("CGV", min_len=1)]
+    finally:
+        store.close()
@@ -0,0 +1,62 @@
+import functools
+import io
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from http_transport import MODE_ENV
+from map_embed import AssetFetcher, MapAssets, write_shared_assets
+
+FONT_CSS = """@font-face{font-family:x;src:url(../fonts/x.eot);src:url(../fonts/x.eot?#iefix) format('embedded-opentype'),url(../fonts/x.woff2) format('woff2'),url(../fonts/x.ttf) format('truetype')}
+.icon{background:url("../img/sprite.png")}
+"""
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def _serve(root):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_QuietHandler, directory=str(root)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_css_resources_are_inlined_as_data_uris(tmp_path, monkeypatch):
+    monkeypatch.setenv(MODE_ENV, "live")
+    site = tmp_path / "site"
+    for rel, data in {"css/a.css": FONT_CSS.encode(), "fonts/x.woff2": b"W2", "fonts/x.ttf": b"TT", "img/sprite.png": b"PNG"}.items():
+        (site / rel).parent.mkdir(parents=True, exist_ok=True)
+        (site / rel).write_bytes(data)
+    server = _serve(site)
+    url = f"http://127.0.0.1:{server.server_address[1]}/css/a.css"
+    cache = tmp_path / "assets"
+    cache.mkdir()
+    try:
+        out = io.StringIO()
+        write_shared_assets(out, MapAssets(stylesheets=[url]), cache)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    html = out.getvalue()
+    assert "data:font/woff2;base64,VzI=" in html
+    assert "data:image/png;base64,UE5H" in html
+    assert ".eot" not in html and ".ttf" not in html and "http://" not in html.split("*/", 1)[1]
+
+
+def test_failed_download_is_not_retried_until_marker_expires(tmp_path, monkeypatch):
+    monkeypatch.setenv(MODE_ENV, "live")
+    server = _serve(tmp_path)
+    url = f"http://127.0.0.1:{server.server_address[1]}/missing.css"
+    server.shutdown()
+    server.server_close()
+
+    fetcher = AssetFetcher(tmp_path, timeout=2)
+    try:
+        assert fetcher.text(url) is None
+        assert list(tmp_path.glob("*.css.failed"))
+        fetcher._get = lambda u: (_ for _ in ()).throw(AssertionError("재시도하면 안 됩니다"))
+        assert fetcher.text(url) is None
+    finally:
+        fetcher.close()
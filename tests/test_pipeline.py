@@ -0,0 +1,37 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import pipeline
+
+
+def _spec(cfg: dict, module: str) -> pipeline.StepSpec:
+    return next(s for s in pipeline._step_specs(Path("outputs"), cfg) if s.module == module)
+
+
+def test_api_step_cache_key_changes_with_collection_period():
+    cfg = pipeline.load_config()
+    cfg["cache"] = {**cfg.get("cache", {}), "api_artifact_ttl_days": 7}
+    spot, charts = _spec(cfg, "Spot"), _spec(cfg, "Visualization")
+    key = pipeline._step_cache_key
+
+    # 2026-10-11(toordinal이 7의 배수)부터 7일이 한 기간입니다.
+    assert key(spot, cfg, date(2026, 10, 11)) == key(spot, cfg, date(2026, 10, 17))
+    assert key(spot, cfg, date(2026, 10, 17)) != key(spot, cfg, date(2026, 10, 18))
+    assert key(charts, cfg, date(2026, 10, 11)) == key(charts, cfg, date(2027, 1, 1))
+
+
+def test_run_metrics_keep_failure_reason(tmp_path):
+    path = tmp_path / "run_metrics.json"
+    step = {
+        "name": "지도",
+        "status": "failed",
+        "message": "RuntimeError: boom",
+        "artifacts": ["a.csv"],
+        "metrics": {"wall_seconds": 1.0},
+    }
+    pipeline._write_run_metrics(path, {"steps": [step]})
+    saved = json.loads(path.read_text(encoding="utf-8"))["steps"][0]
+    assert saved["message"] == "RuntimeError: boom"
+    assert saved["artifacts"] == ["a.csv"]
+    assert saved["wall_seconds"] == 1.0
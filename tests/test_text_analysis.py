@@ -0,0 +1,59 @@
+import csv
+from pathlib import Path
+
+import matplotlib
+from PIL import Image
+
+from brand_keywords import build_brand_matrix
+from keyword_store import KeywordStore
+from text_analysis import write_brand_keywords
+from wordcloud_render import WordCloudSettings, save_placeholder
+
+BRANDS = ["CGV", "메가박스"]
+
+
+def _rows(path: Path) -> list[list[str]]:
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_brand_without_posts_still_gets_outputs(tmp_path):
+    store = KeywordStore(Path(":memory:"))
+    try:
+        items = [{"link": f"https://blog/{i}", "postdate": "20261016"} for i in range(3)]
+        store.ingest("CGV", items, [["팝콘", "용산"]] * 3)
+        bm = build_brand_matrix(store, BRANDS)
+    finally:
+        store.close()
+
+    saved, clouds = write_brand_keywords(bm, tmp_path / "naver_keywords.csv", tmp_path / "naver_wordcloud.png")
+
+    assert [p.name for p in saved] == ["naver_keywords_CGV.csv", "naver_keywords_메가박스.csv"]
+    assert len(_rows(saved[0])) == 3
+    assert _rows(saved[1]) == [["keyword", "count", "tfidf", "log_odds_z"]]
+    assert [(bool(w), p.name) for w, p in clouds] == [
+        (True, "naver_wordcloud_CGV.png"),
+        (False, "naver_wordcloud_메가박스.png"),
+    ]
+
+
+def test_empty_matrix_writes_header_only_csvs(tmp_path):
+    store = KeywordStore(Path(":memory:"))
+    try:
+        bm = build_brand_matrix(store, BRANDS)
+    finally:
+        store.close()
+
+    saved, clouds = write_brand_keywords(bm, tmp_path / "naver_keywords.csv", tmp_path / "naver_wordcloud.png")
+
+    assert all(len(_rows(p)) == 1 for p in saved) and len(saved) == 2
+    assert [w for w, _ in clouds] == [{}, {}]
+
+
+def test_placeholder_matches_wordcloud_size(tmp_path):
+    font = Path(matplotlib.get_data_path()) / "fonts" / "ttf" / "DejaVuSans.ttf"
+    settings = WordCloudSettings(width=200, height=100, scale=1.5)
+    path = tmp_path / "cloud.png"
+    save_placeholder(path, str(font), settings, message="empty")
+    with Image.open(path) as image:
+        assert image.size == (300, 150)
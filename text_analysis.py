@@ -1,27 +1,47 @@
 """네이버 검색 API(블로그) 결과의 제목/요약(description)을 이용해 키워드 빈도 분석 및 워드클라우드를 생성합니다.
 
-- 데이터 수집은 '공식 API'를 사용합니다.
+- 데이터 수집은 '공식 API'를 사용합니다. 검색 결과를 최대 `naver_api.max_items`건까지 페이지를 넘기며 받고
+  `link` 기준으로 중복을 제거합니다(`naver_blog.BlogCollector`, 원본 응답은 `.cache/naver_blog/`에 캐시).
+- 키워드 빈도는 `.cache/keywords.sqlite3`(`keyword_store.KeywordStore`)에 일별로 누적되며, 처음 보는 글만 토큰화합니다.
+  CSV는 저장소의 `text_analysis.window_days`일(0이면 전체) 합계입니다.
 - API 키는 config.yaml 또는 환경변수로 주입합니다(코드에 직접 하드코딩 금지).
 
+- `naver_api.queries`에 검색어(브랜드)를 여러 개 주면 한 번에 수집/토큰화하고, 브랜드별 특징 키워드
+  (TF-IDF, log-odds z; `brand_keywords`)를 계산합니다.
+
 출력:
-- outputs/naver_keywords.csv
+- outputs/naver_keywords.csv (전체 검색어 합계)
 - outputs/naver_wordcloud.png
+- outputs/naver_keywords_<브랜드>.csv, outputs/naver_wordcloud_<브랜드>.png (검색어가 2개 이상일 때)
+  저장된 글이 없는 브랜드도 헤더만 있는 CSV와 "키워드 없음" 그림을 써서 산출물 목록이 항상 같습니다.
 """
 
 from __future__ import annotations
 
 import csv
 import os
-import re
 from collections import Counter
+from datetime import date, timedelta
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-import requests
 import yaml
 from dotenv import load_dotenv
-from matplotlib import font_manager
-from wordcloud import WordCloud
+
+from brand_keywords import (
+    BrandMatrix,
+    brand_output_path,
+    build_brand_matrix,
+    configured_queries,
+    distinctive_rows,
+    log_odds_by_brand,
+    tfidf_by_brand,
+)
+from http_transport import replay_credential
+from keyword_store import KeywordStore
+from korean_font import resolve_korean_font_path
+from naver_blog import BlogCollector
+from tokenizer import TokenizerService
+from wordcloud_render import WordCloudSettings, save_placeholder, save_wordcloud
 
 
 ROOT = Path(__file__).resolve().parent
@@ -29,6 +49,16 @@ CONFIG_PATH = ROOT / "config.yaml"
 OUTPUT_DIR_DEFAULT = ROOT / "outputs"
 load_dotenv(ROOT / ".env")
 
+STOPWORDS = {
+    "CGV", "롯데시네마", "메가박스", "영화", "상영관", "극장", "좌석",
+    "예매", "상영", "시간표", "영화관", "고객센터", "블로그", "후기", "포스팅",
+    "링크", "사진", "공유", "작성", "추천", "조회", "댓글", "좋아요", "대해",
+    "은", "는", "이", "가", "을", "를", "의", "와", "과", "도", "에", "에서",
+    "보다", "으로", "또는", "그리고", "해서", "그러나", "너무", "정말", "많이",
+    "아주", "그냥", "그래서", "이제", "다시", "이렇게", "저렇게",
+    "!", "?", ".", ",", "/", "@", "#", "%",
+}
+
 
 def load_config(path: Path = CONFIG_PATH) -> dict:
     with open(path, "r", encoding="utf-8") as f:
@@ -48,44 +78,42 @@ def get_env_or_config(cfg: dict, key: str, env_key: str) -> str:
     return ""
 
 
-def extract_tokens(text: str) -> list[str]:
-    try:
-        from konlpy.tag import Okt
-
-        return Okt().nouns(text)
-    except Exception:
-        # JVM/KoNLPy 미설치 환경을 위한 간단한 폴백 토큰화
-        return re.findall(r"[가-힣A-Za-z0-9]{2,}", text)
-
-
-def resolve_korean_font_path() -> str | None:
-    env_path = os.getenv("KOREAN_FONT_PATH", "").strip()
-    if env_path and Path(env_path).exists():
-        return env_path
-
-    preferred_names = [
-        "NanumGothic",
-        "Nanum Gothic",
-        "Apple SD Gothic Neo",
-        "AppleGothic",
-        "Malgun Gothic",
-        "Noto Sans CJK KR",
-        "Noto Sans KR",
-    ]
-    for name in preferred_names:
-        try:
-            path = font_manager.findfont(name, fallback_to_default=False)
-            if path and Path(path).exists():
-                return path
-        except Exception:
-            continue
-
-    for f in font_manager.fontManager.ttflist:
-        name = (f.name or "").lower()
-        if any(k in name for k in ["nanum", "gothic", "malgun", "noto sans cjk kr", "applegothic"]):
-            if f.fname and Path(f.fname).exists():
-                return f.fname
-    return None
+def extract_tokens(docs: list[str], service: TokenizerService | None = None) -> list[list[str]]:
+    """문서별 명사 목록을 추출합니다(Okt 불가 시 정규식 폴백)."""
+    service = service or TokenizerService()
+    per_doc, stats = service.tokenize(docs)
+    print(f"[tokenize] {stats.summary()}")
+    return per_doc
+
+
+def write_brand_keywords(
+    bm: BrandMatrix, csv_path: Path, img_path: Path, prior_scale: float = 0.01
+) -> tuple[list[Path], list[tuple[dict[str, float], Path]]]:
+    """브랜드별 특징 키워드 CSV를 쓰고 (저장한 CSV 목록, (워드클라우드 가중치, 경로) 목록)을 돌려줍니다.
+
+    log-odds z 내림차순 CSV이며, 워드클라우드는 z > 0 키워드(없으면 빈도)입니다. 글이 없는 브랜드는
+    헤더만 있는 CSV와 빈 가중치를 돌려줍니다(호출부가 자리 표시 그림을 씁니다).
+    """
+    brand_rows: list[list[tuple[str, int, float, float]]] = [[] for _ in bm.brands]
+    if bm.matrix.nnz:
+        tfidf = tfidf_by_brand(bm)
+        z = log_odds_by_brand(bm, prior_scale)
+        brand_rows = [distinctive_rows(bm, tfidf, z, i) for i in range(len(bm.brands))]
+
+    saved: list[Path] = []
+    clouds: list[tuple[dict[str, float], Path]] = []
+    for query, rows in zip(bm.brands, brand_rows):
+        brand_csv = brand_output_path(csv_path, query)
+        with open(brand_csv, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(["keyword", "count", "tfidf", "log_odds_z"])
+            writer.writerows(rows)
+        saved.append(brand_csv)
+        weights = {t: zz for t, _, _, zz in rows if zz > 0} or {t: n for t, n, _, _ in rows}
+        clouds.append((weights, brand_output_path(img_path, query)))
+        top = ", ".join(t for t, *_ in rows[:10])
+        print(f"[keywords] {query} 특징 키워드: {top or '(저장된 글 없음)'}")
+    return saved, clouds
 
 
 def main() -> None:
@@ -96,89 +124,100 @@ def main() -> None:
         out_dir = ROOT / out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    client_id = get_env_or_config(cfg, "naver_api.client_id", "NAVER_CLIENT_ID")
-    client_secret = get_env_or_config(cfg, "naver_api.client_secret", "NAVER_CLIENT_SECRET")
-    url = cfg.get("naver_api", {}).get("blog_search_url", "https://openapi.naver.com/v1/search/blog.json")
-
+    client_id = replay_credential(get_env_or_config(cfg, "naver_api.client_id", "NAVER_CLIENT_ID"), cfg)
+    client_secret = replay_credential(get_env_or_config(cfg, "naver_api.client_secret", "NAVER_CLIENT_SECRET"), cfg)
     if not client_id or not client_secret:
         raise RuntimeError(
             "NAVER API 키가 필요합니다. config.yaml의 naver_api.client_id/client_secret 또는 "
             "환경변수 NAVER_CLIENT_ID/NAVER_CLIENT_SECRET을 설정하세요."
         )
 
-    query = cfg.get("naver_api", {}).get("query", "메가박스")
-    params = {
-        "query": query,
-        "display": int(cfg.get("naver_api", {}).get("display", 100)),
-        "start": int(cfg.get("naver_api", {}).get("start", 1)),
-        "sort": cfg.get("naver_api", {}).get("sort", "sim"),
-    }
-    headers = {
-        "X-Naver-Client-Id": client_id,
-        "X-Naver-Client-Secret": client_secret,
-    }
-
-    response = requests.get(url, headers=headers, params=params, timeout=30)
-    response.raise_for_status()
-    data = response.json()
-
-    text_data: list[str] = []
-    for item in data.get("items", []):
-        text_data.append(item.get("title", ""))
-        text_data.append(item.get("description", ""))
-
-    text = " ".join(text_data)
-
-    # 형태소 분석(명사 추출). 실패 시 정규식 기반 폴백 사용.
-    tokens = extract_tokens(text)
-
-    stopwords = {
-        "CGV", "롯데시네마", "메가박스", "영화", "상영관", "극장", "좌석",
-        "예매", "상영", "시간표", "영화관", "고객센터", "블로그", "후기", "포스팅",
-        "링크", "사진", "공유", "작성", "추천", "조회", "댓글", "좋아요", "대해",
-        "은", "는", "이", "가", "을", "를", "의", "와", "과", "도", "에", "에서",
-        "보다", "으로", "또는", "그리고", "해서", "그러나", "너무", "정말", "많이",
-        "아주", "그냥", "그래서", "이제", "다시", "이렇게", "저렇게",
-        "!", "?", ".", ",", "/", "@", "#", "%",
-    }
-
-    filtered = [t for t in tokens if t not in stopwords and len(t) > 1]
-    counts = Counter(filtered)
-
-    # CSV 저장
+    naver = cfg.get("naver_api", {})
+    ta_cfg = cfg.get("text_analysis", {})
+    queries = configured_queries(cfg)
+    window_days = int(ta_cfg.get("window_days", 0))
+    since = (date.today() - timedelta(days=window_days - 1)).isoformat() if window_days > 0 else None
+    exclude = STOPWORDS | set(queries)
+
+    # 검색어가 여러 개여도 토크나이저/세션/저장소는 한 번만 만듭니다.
+    tokenizer = TokenizerService.from_config(cfg)
+    collector = BlogCollector.from_config(cfg, client_id, client_secret)
+    store = KeywordStore.from_config(cfg)
+    try:
+        for query in queries:
+            items, stats = collector.collect(
+                query,
+                max_items=int(naver.get("max_items", 1000)),
+                display=int(naver.get("display", 100)),
+                sort=naver.get("sort", "sim"),
+                start=int(naver.get("start", 1)),
+            )
+            print(stats.summary())
+
+            # 이미 저장소에 반영한 글은 건너뛰고 새 글만 토큰화합니다.
+            new_items = store.new_items(query, items)
+            # 글 하나(제목 + 요약)를 문서 하나로 봅니다.
+            docs = [f"{item.get('title', '')} {item.get('description', '')}" for item in new_items]
+
+            # 형태소 분석(명사 추출). 실패 시 정규식 기반 폴백 사용.
+            store.ingest(query, new_items, extract_tokens(docs, tokenizer))
+
+            trending = store.trending(
+                query,
+                window_days=int(ta_cfg.get("trend_window_days", 7)),
+                baseline_days=int(ta_cfg.get("trend_baseline_days", 28)),
+                exclude=exclude,
+            )
+            print(
+                f"[keywords] {query}: new={len(new_items)} skipped={len(items) - len(new_items)} "
+                f"stored_posts={store.post_count(query)} window={'all' if since is None else f'{window_days}d'}"
+            )
+            if trending:
+                print(f"[keywords] {query} 급상승: " + ", ".join(f"{t}({n})" for t, n, _, _ in trending[:10]))
+
+        bm = build_brand_matrix(store, queries, since=since, exclude=exclude)
+    finally:
+        collector.close()
+        store.close()
+
+    counts = Counter(dict(zip(bm.vocab.tolist(), bm.total_counts().astype(int).tolist())))
     csv_path = out_dir / cfg.get("outputs", {}).get("text_keywords_csv", "naver_keywords.csv")
+    img_path = out_dir / cfg.get("outputs", {}).get("text_wordcloud", "naver_wordcloud.png")
+
+    # CSV 저장(전체 검색어 합계)
     with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
         writer = csv.writer(f)
         writer.writerow(["keyword", "count"])
         writer.writerows(counts.most_common())
+    saved = [csv_path]
+
+    # 브랜드별 특징 키워드(검색어가 2개 이상일 때)
+    brand_clouds: list[tuple[dict[str, float], Path]] = []
+    if len(queries) > 1:
+        brand_csvs, brand_clouds = write_brand_keywords(
+            bm, csv_path, img_path, float(ta_cfg.get("log_odds_prior", 0.01))
+        )
+        saved += brand_csvs
 
-    # 워드클라우드 이미지 저장
-    plt.rcParams["axes.unicode_minus"] = False
-    font_path = resolve_korean_font_path()
+    # 워드클라우드 이미지 저장(폰트는 한 번만 찾습니다, 같은 빈도 분포면 렌더 캐시 재사용)
+    font_path = resolve_korean_font_path(cfg)
     if not font_path:
         raise RuntimeError(
             "한글 폰트를 찾지 못했습니다. KOREAN_FONT_PATH를 설정하거나 "
             "NanumGothic/AppleGothic 계열 폰트를 설치하세요."
         )
-    plt.rcParams["font.family"] = font_manager.FontProperties(fname=font_path).get_name()
-    wc = WordCloud(
-        font_path=font_path,
-        background_color="white",
-        width=1000,
-        height=700,
-        max_words=80,
-    ).generate_from_frequencies(counts)
-
-    img_path = out_dir / cfg.get("outputs", {}).get("text_wordcloud", "naver_wordcloud.png")
-    plt.figure(figsize=(10, 7))
-    plt.imshow(wc, interpolation="bilinear")
-    plt.axis("off")
-    plt.tight_layout()
-    plt.savefig(img_path, dpi=200)
-    plt.close()
-
-    print(f"Saved: {csv_path}")
-    print(f"Saved: {img_path}")
+    wc_settings = WordCloudSettings.from_config(cfg)
+    reused = 0
+    for freqs, path in [(counts, img_path), *brand_clouds]:
+        if freqs:
+            reused += save_wordcloud(freqs, path, font_path, wc_settings, cfg)
+        else:
+            save_placeholder(path, font_path, wc_settings)
+        saved.append(path)
+    print(f"[wordcloud] {len(brand_clouds) + 1}개 중 캐시 재사용 {reused}개")
+
+    for path in saved:
+        print(f"Saved: {path}")
 
 
 if __name__ == "__main__":
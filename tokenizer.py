@@ -0,0 +1,159 @@
+"""블로그 글 형태소 분석(명사 추출) 서비스.
+
+- KoNLPy `Okt`는 JVM 기동과 사전 로딩이 느리므로 프로세스마다 한 번만 만들어 재사용합니다(`get_okt`).
+  JVM/KoNLPy가 없으면 정규식 기반 폴백 토큰화를 씁니다(실패 결과도 캐시해 매 호출 재시도하지 않음).
+- 문서(글) 단위로 토큰화해 문서별 토큰 목록을 돌려줍니다. 문서를 `batch_size`개씩 묶어 처리하고,
+  Okt 사용 시 문서 수가 `parallel_min_docs` 이상이고 `workers > 1`이면 배치를 프로세스 풀(spawn)에
+  나눠 보냅니다. 각 워커는 initializer에서 Okt를 미리 띄워 둡니다.
+- 처리량(docs/sec)은 `TokenizeStats`로 반환합니다.
+
+config.yaml `text_analysis` 섹션:
+- `tokenizer`: auto(Okt 가능하면 Okt) | okt | regex
+- `batch_size`, `workers`(0이면 CPU 수), `parallel_min_docs`
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+
+BACKENDS = ("auto", "okt", "regex")
+
+_FALLBACK_TOKEN_RE = re.compile(r"[가-힣A-Za-z0-9]{2,}")
+
+_okt = None
+_okt_error: Exception | None = None
+_okt_lock = threading.Lock()
+
+
+def get_okt():
+    """프로세스 공용 Okt 인스턴스. 만들 수 없으면 None(원인은 `okt_error()`)."""
+    global _okt, _okt_error
+    with _okt_lock:
+        if _okt is None and _okt_error is None:
+            try:
+                from konlpy.tag import Okt
+
+                _okt = Okt()
+            except Exception as e:  # konlpy 미설치, JVM 없음 등
+                _okt_error = e
+        return _okt
+
+
+def okt_error() -> Exception | None:
+    return _okt_error
+
+
+def regex_tokens(text: str) -> list[str]:
+    # JVM/KoNLPy 미설치 환경을 위한 간단한 폴백 토큰화
+    return _FALLBACK_TOKEN_RE.findall(text)
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    backend = (backend or "auto").strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 토크나이저입니다: {backend} (가능: {', '.join(BACKENDS)})")
+    if backend == "regex":
+        return "regex"
+    if get_okt() is not None:
+        return "okt"
+    if backend == "okt":
+        raise RuntimeError(f"Okt를 사용할 수 없습니다(KoNLPy/JVM 확인): {okt_error()}")
+    return "regex"
+
+
+def tokenize_batch(docs: Sequence[str], backend: str) -> list[list[str]]:
+    """문서 묶음을 문서별 토큰 목록으로 바꿉니다(backend는 resolve_backend 결과)."""
+    if backend == "okt":
+        okt = get_okt()
+        return [okt.nouns(doc) if doc else [] for doc in docs]
+    return [regex_tokens(doc) for doc in docs]
+
+
+def _warm_worker(backend: str) -> None:
+    if backend == "okt":
+        get_okt()
+
+
+@dataclass
+class TokenizeStats:
+    backend: str
+    docs: int = 0
+    tokens: int = 0
+    seconds: float = 0.0
+    workers: int = 1
+    batches: int = 0
+
+    @property
+    def docs_per_sec(self) -> float:
+        return self.docs / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"backend={self.backend} docs={self.docs} tokens={self.tokens} "
+            f"batches={self.batches} workers={self.workers} "
+            f"{self.seconds:.2f}s ({self.docs_per_sec:,.0f} docs/s)"
+        )
+
+
+class TokenizerService:
+    """문서 목록을 배치 단위로(필요하면 여러 프로세스에서) 토큰화합니다."""
+
+    def __init__(
+        self,
+        backend: str = "auto",
+        batch_size: int = 256,
+        workers: int = 1,
+        parallel_min_docs: int = 2000,
+    ) -> None:
+        self.backend = resolve_backend(backend)
+        self.batch_size = max(1, int(batch_size))
+        self.workers = int(workers) if int(workers) > 0 else (os.cpu_count() or 1)
+        self.parallel_min_docs = int(parallel_min_docs)
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "TokenizerService":
+        ta_cfg = cfg.get("text_analysis", {})
+        return cls(
+            backend=ta_cfg.get("tokenizer", "auto"),
+            batch_size=ta_cfg.get("batch_size", 256),
+            workers=ta_cfg.get("workers", 1),
+            parallel_min_docs=ta_cfg.get("parallel_min_docs", 2000),
+        )
+
+    def _batches(self, docs: Sequence[str]) -> Iterable[Sequence[str]]:
+        for i in range(0, len(docs), self.batch_size):
+            yield docs[i : i + self.batch_size]
+
+    def tokenize(self, docs: Sequence[str]) -> tuple[list[list[str]], TokenizeStats]:
+        docs = list(docs)
+        batches = list(self._batches(docs))
+        # 정규식 폴백은 프로세스 기동/직렬화 비용이 토큰화보다 커서 항상 현재 프로세스에서 처리합니다.
+        parallel = self.backend == "okt" and len(docs) >= self.parallel_min_docs
+        workers = min(self.workers, len(batches)) if parallel else 1
+        stats = TokenizeStats(self.backend, docs=len(docs), workers=max(1, workers), batches=len(batches))
+
+        t0 = time.perf_counter()
+        results: list[list[str]] = []
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+                initargs=(self.backend,),
+            ) as pool:
+                for part in pool.map(tokenize_batch, batches, [self.backend] * len(batches)):
+                    results.extend(part)
+        else:
+            for batch in batches:
+                results.extend(tokenize_batch(batch, self.backend))
+        stats.seconds = time.perf_counter() - t0
+        stats.tokens = sum(len(t) for t in results)
+        return results, stats
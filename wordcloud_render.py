@@ -0,0 +1,130 @@
+"""워드클라우드를 PNG로 바로 저장하고, 같은 입력이면 렌더 결과를 재사용합니다.
+
+- matplotlib `imshow` + `savefig`를 거치지 않고 `WordCloud.to_file()`(PIL)로 목표 크기 그대로 씁니다.
+  해상도는 배치(layout)를 `width`×`height`에서 하고 `scale`배로 그려 올립니다.
+- 배치가 가장 비싼 CPU 작업이므로, 상위 `max_words`개 빈도(최댓값 대비 비율), 폰트 파일, 크기/옵션의 해시를
+  키로 `.cache/wordclouds/<해시>.png`에 저장해 두고 분포가 같으면 파일만 복사합니다.
+  배치 난수는 고정(`random_state`)이라 같은 키는 항상 같은 그림입니다.
+
+키워드가 하나도 없으면(수집된 글이 없는 브랜드 등) `save_placeholder`로 같은 크기의 빈 그림을 씁니다.
+
+config.yaml `text_analysis`: `wordcloud_width`, `wordcloud_height`, `wordcloud_scale`, `wordcloud_max_words`,
+`wordcloud_cache_entries`
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from cache_utils import cache_dir
+
+
+@dataclass(frozen=True)
+class WordCloudSettings:
+    width: int = 1000
+    height: int = 700
+    scale: float = 2.0
+    max_words: int = 80
+    background_color: str = "white"
+    random_state: int = 42
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "WordCloudSettings":
+        ta_cfg = cfg.get("text_analysis", {})
+        return cls(
+            width=int(ta_cfg.get("wordcloud_width", 1000)),
+            height=int(ta_cfg.get("wordcloud_height", 700)),
+            scale=float(ta_cfg.get("wordcloud_scale", 2.0)),
+            max_words=int(ta_cfg.get("wordcloud_max_words", 80)),
+        )
+
+
+def top_frequencies(freqs: dict[str, float], k: int) -> list[tuple[str, float]]:
+    """WordCloud가 실제로 쓰는 상위 k개(빈도 내림차순, 같으면 키워드 순)와 최댓값 대비 비율."""
+    top = sorted(((t, float(w)) for t, w in freqs.items() if w > 0), key=lambda x: (-x[1], x[0]))[:k]
+    if not top:
+        return []
+    peak = top[0][1]
+    return [(t, round(w / peak, 6)) for t, w in top]
+
+
+def render_key(top: list[tuple[str, float]], font_path: str, settings: WordCloudSettings) -> str:
+    font = Path(font_path)
+    stat = font.stat()
+    payload = {
+        "words": top,
+        "font": [font.name, stat.st_size, int(stat.st_mtime)],
+        "settings": asdict(settings),
+    }
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()[:32]
+
+
+def _prune(directory: Path, keep: int) -> None:
+    files = [p for p in directory.glob("*.png") if ".tmp" not in p.name]
+    files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in files[keep:]:
+        old.unlink(missing_ok=True)
+
+
+def save_wordcloud(
+    freqs: dict[str, float],
+    path: Path,
+    font_path: str,
+    settings: WordCloudSettings | None = None,
+    cfg: dict | None = None,
+) -> bool:
+    """워드클라우드 PNG를 `path`에 씁니다. 캐시에서 복사했으면 True, 새로 그렸으면 False."""
+    settings = settings or WordCloudSettings()
+    top = top_frequencies(freqs, settings.max_words)
+    if not top:
+        raise ValueError(f"워드클라우드에 쓸 키워드가 없습니다: {path.name}")
+
+    cache = cache_dir(cfg or {}, "wordclouds")
+    cached = cache / f"{render_key(top, font_path, settings)}.png"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if cached.exists():
+        shutil.copyfile(cached, path)
+        os.utime(cached)
+        return True
+
+    from wordcloud import WordCloud
+
+    wc = WordCloud(
+        font_path=font_path,
+        background_color=settings.background_color,
+        width=settings.width,
+        height=settings.height,
+        scale=settings.scale,
+        max_words=settings.max_words,
+        random_state=settings.random_state,
+    ).generate_from_frequencies(dict(top))
+
+    tmp = cached.with_suffix(f".{os.getpid()}.tmp.png")
+    wc.to_file(str(tmp))
+    os.replace(tmp, cached)
+    shutil.copyfile(cached, path)
+    _prune(cache, int((cfg or {}).get("text_analysis", {}).get("wordcloud_cache_entries", 64)))
+    return False
+
+
+def save_placeholder(
+    path: Path, font_path: str, settings: WordCloudSettings | None = None, message: str = "키워드 없음"
+) -> None:
+    """키워드가 없을 때 워드클라우드 자리에 `message`만 적은 같은 크기의 PNG를 씁니다."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    settings = settings or WordCloudSettings()
+    size = (int(settings.width * settings.scale), int(settings.height * settings.scale))
+    image = Image.new("RGB", size, settings.background_color)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.truetype(font_path, max(12, size[1] // 12))
+    draw.text((size[0] / 2, size[1] / 2), message, fill="gray", font=font, anchor="mm")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp.png")
+    image.save(tmp)
+    os.replace(tmp, path)